@@ -13,7 +13,7 @@ MAX_CONFIDENCE = 1.0
 # Timing (seconds)
 DEFAULT_COOLDOWN_SECONDS = 2.0
 DEFAULT_MIN_HOLD_TIME = 0.5
-FRAME_PROCESSING_DELAY = 0.01  # seconds between frame processing
+IDLE_TIMEOUT_SECONDS = 10.0  # seconds without a hand before idle frame rate
 SOCKET_TIMEOUT = 10.0  # seconds
 SOCKET_ACCEPT_TIMEOUT = 1.0  # seconds for clean shutdown
 
@@ -22,18 +22,70 @@ DEFAULT_CAMERA_INDEX = 0
 DEFAULT_CAMERA_WIDTH = 640
 DEFAULT_CAMERA_HEIGHT = 480
 DEFAULT_CAMERA_FPS = 30
+RECOGNIZER_POOL_SIZE = 2  # recognizer instances shared by multiple cameras
+INFERENCE_WORKERS = 0  # recognition worker processes (0 = in-process)
+INFERENCE_TASK_TIMEOUT = 10.0  # seconds before a frame without a worker result is skipped
+INFERENCE_WORKER_RESTARTS = 3  # dead inference workers respawned before giving up
+REPLAY_DEFAULT_FPS = 30.0  # frame rate assumed for image directories and videos without FPS
+
+# Processing Resolutions (independent of the capture resolution)
+INFERENCE_WIDTH = 640  # image fed to MediaPipe
+INFERENCE_HEIGHT = 480
+PREVIEW_WIDTH = 640  # annotated MJPEG preview
+PREVIEW_HEIGHT = 480
+
+# Inference Frame Rate
+TARGET_INFERENCE_FPS = 30.0  # while hands are visible
+IDLE_INFERENCE_FPS = 5.0  # after IDLE_TIMEOUT_SECONDS without a hand
+
+# Motion Gating (skip inference on static scenes)
+MOTION_THRESHOLD = 0.01  # fraction of sampled pixels that must change (0 disables)
+MOTION_PIXEL_DELTA = 25  # grayscale difference for a pixel to count as changed
+MOTION_REFRESH_INTERVAL = 2.0  # seconds between forced inference without motion
+
+# Hand Region-of-Interest Tracking (IMAGE running mode)
+ROI_EXPAND_FACTOR = 1.5  # crop size relative to the landmark bounding box
+ROI_FULL_FRAME_INTERVAL = 15  # frames between forced full-frame detections
+ROI_MIN_SIZE = 96  # minimum crop size in pixels
 
 # Socket Communication
 DEFAULT_SOCKET_HOST = 'localhost'
 DEFAULT_SOCKET_PORT = 5555
+DEFAULT_UNIX_SOCKET_PATH = '/tmp/gesture_control.sock'  # '@name' for an abstract socket (Linux)
+UNIX_SOCKET_MODE = 0o660  # permissions of the socket file (connecting needs write access)
 SOCKET_BUFFER_SIZE = 4096
 SOCKET_RECV_SIZE = 1024
+SOCKET_MAX_LINE_LENGTH = 65536  # bytes; longer gesture event lines are dropped
+WIRE_PROTOCOL = 'json'  # gesture event encoding offered by gesture_stream: 'json' or 'binary'
+WIRE_HELLO_TIMEOUT = 1.0  # seconds to wait for the controller to accept binary framing
+EVENT_QUEUE_SIZE = 256  # gesture events buffered while the controller is unreachable (oldest dropped)
+RECONNECT_INITIAL_DELAY = 0.5  # seconds before the first reconnect attempt
+RECONNECT_MAX_DELAY = 30.0  # upper bound of the exponential reconnect backoff
+EVENT_SEND_TIMEOUT = 5.0  # seconds before a stalled send drops the connection
+EVENT_BATCH_INTERVAL_MS = 0  # ms to collect gesture events into one write (0 disables batching)
+EVENT_BATCH_MAX_EVENTS = 32  # queued events that flush a batch early
+EVENT_COALESCE = False  # send every frame (no debounce), collapsing same-gesture frames within a batch
+SOCKET_SERVER_MODE = 'asyncio'  # 'asyncio' (one event loop) or 'threaded' (thread per connection)
+SOCKET_EVENT_WORKERS = 4  # threads processing events received by the asyncio server
+SOCKET_RATE_WINDOW = 10.0  # seconds over which per-connection message rates are computed
 
 # Home Assistant
 HA_REQUEST_TIMEOUT = 30.0  # seconds
+HA_INIT_TIMEOUT = 5.0  # seconds controller startup waits for the HA client to connect
 HA_RETRY_ATTEMPTS = 3
 HA_RETRY_DELAY = 1.0  # seconds
 HA_MIN_TOKEN_LENGTH = 50  # HA tokens are typically ~180+ chars
+HA_MAX_CONNECTIONS = 10  # pooled HTTP connections to Home Assistant
+HA_MAX_KEEPALIVE_CONNECTIONS = 5  # idle connections kept open for reuse
+HA_KEEPALIVE_EXPIRY = 30.0  # seconds an idle connection stays open
+HA_WEBSOCKET_MAX_MESSAGE_SIZE = 16 * 1024 * 1024  # bytes; get_states replies can be large
+HA_MCP_RETRY_INTERVAL = 60.0  # seconds on REST after the MCP session could not be opened
+HA_STATE_CACHE_SIZE = 1024  # entity states kept in memory (least recently used evicted)
+HA_STATE_CACHE_TTL = 300.0  # seconds a cached entity state is served without a refresh
+HA_STATE_SUBSCRIBE = True  # keep cached states fresh from state_changed events (WebSocket API)
+HA_STATE_RESUBSCRIBE_INTERVAL = 60.0  # seconds between attempts to restore a lost subscription
+ACTION_QUEUE_SIZE = 32  # resolved actions waiting for a dispatcher worker (new ones rejected when full)
+ACTION_WORKERS = 2  # Home Assistant calls in flight at once
 
 # Logging
 DEFAULT_LOG_LEVEL = 'INFO'
@@ -46,11 +98,23 @@ MEDIAPIPE_MIN_DETECTION_CONFIDENCE = 0.7
 MEDIAPIPE_MIN_TRACKING_CONFIDENCE = 0.5
 MEDIAPIPE_MIN_HAND_PRESENCE_CONFIDENCE = 0.7
 MEDIAPIPE_MAX_NUM_HANDS = 2
+MEDIAPIPE_RUNNING_MODE = 'VIDEO'  # IMAGE, VIDEO or LIVE_STREAM (VIDEO/LIVE_STREAM track hands across frames)
 
 # MJPEG Streaming
 MJPEG_QUALITY = 85  # JPEG quality (0-100)
 MJPEG_FRAME_RATE = 30  # Target FPS
 MJPEG_FRAME_DELAY = 0.033  # seconds (1/30)
 
+# Shared-Memory Frame Bus (preview frames from gesture_stream to web_server)
+FRAME_BUS_NAME = 'ha_gesture_preview'
+FRAME_BUS_SLOTS = 4
+FRAME_BUS_STALE_TIMEOUT = 2.0  # seconds without a new frame before re-attaching
+PREVIEW_CONSUMER_TIMEOUT = 2.0  # seconds after the last preview request to keep rendering
+
+# Latency Instrumentation
+LATENCY_WINDOW_SIZE = 1000  # samples kept per stage for percentiles
+LATENCY_STATS_INTERVAL = 5.0  # seconds between latency snapshot writes
+LATENCY_STATS_MAX_AGE = 60.0  # seconds before /health ignores a snapshot
+
 # Gesture Debouncing
 GESTURE_DEBOUNCE_TIME = 1.0  # seconds between same gesture events
@@ -0,0 +1,567 @@
+"""
+Recognition Pipeline Benchmark
+
+Drives GestureRecognizer headless (no camera, no socket, no Home Assistant)
+over generated frames or recorded clips and reports frames/sec, per-stage
+latency percentiles and peak RSS as JSON, so runs can be compared over time.
+
+Two pipelines are measured:
+    frame   GestureRecognizer.process_frame plus preview rendering, called
+            directly on frames held in memory (fps counts completed
+            results, so asynchronous LIVE_STREAM runs are comparable)
+    stream  The full replay loop (GestureRecognizer.run with replay=True),
+            including reading frames from disk
+
+Usage:
+    python benchmark.py --model gesture_recognizer.task --output bench.json
+    python benchmark.py --clip recordings/wave.mp4 --resolutions 640x480
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import shutil
+import logging
+import platform
+import argparse
+import tempfile
+import multiprocessing
+from datetime import datetime, timezone
+
+import cv2
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak RSS is reported as None there
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Defaults for the command line
+DEFAULT_RESOLUTIONS = ('640x480', '1280x720')
+DEFAULT_HAND_COUNTS = (1, 2)
+DEFAULT_FRAME_COUNT = 300
+DEFAULT_WARMUP_FRAMES = 10
+PIPELINES = ('frame', 'stream')
+
+# Seconds to wait for one benchmark case in an isolated process
+CASE_TIMEOUT = 600.0
+
+
+def parse_resolution(value):
+    """
+    Parse a WIDTHxHEIGHT string
+
+    Args:
+        value: Resolution string (e.g. '640x480')
+
+    Returns:
+        Tuple of (width, height)
+    """
+    try:
+        width, height = (int(part) for part in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'Invalid resolution: {value} (expected WIDTHxHEIGHT)')
+    return width, height
+
+
+def generate_frames(width, height, count, hands=1, seed=0):
+    """
+    Generate a deterministic synthetic clip
+
+    Each frame has a textured background and one skin-toned blob per hand
+    moving along its own path. The blobs exercise detection and tracking
+    costs but are not real hands, so gestures are rarely recognized; use a
+    recorded clip to benchmark recognition with hands in view.
+
+    Args:
+        width: Frame width in pixels
+        height: Frame height in pixels
+        count: Number of frames
+        hands: Number of moving blobs
+        seed: Random seed for the background texture
+
+    Returns:
+        List of BGR frames
+    """
+    rng = np.random.default_rng(seed)
+    background = rng.integers(40, 90, size=(height, width, 3), dtype=np.uint8)
+    background = cv2.GaussianBlur(background, (0, 0), sigmaX=5)
+
+    axes = (max(width // 16, 8), max(height // 8, 8))
+    frames = []
+
+    for i in range(count):
+        frame = background.copy()
+
+        for hand in range(hands):
+            phase = i / 30.0 + hand * np.pi / max(hands, 1)
+            center = (
+                int(width * (0.5 + 0.3 * np.cos(phase))),
+                int(height * (0.5 + 0.25 * np.sin(2 * phase)))
+            )
+            cv2.ellipse(frame, center, axes, 0, 0, 360, (120, 160, 210), -1)
+
+        frames.append(frame)
+
+    return frames
+
+
+def write_image_directory(frames, directory):
+    """
+    Write frames as an image directory for the stream pipeline
+
+    Args:
+        frames: List of BGR frames
+        directory: Existing directory to write into
+    """
+    for i, frame in enumerate(frames):
+        cv2.imwrite(os.path.join(directory, f'{i:06d}.bmp'), frame)
+
+
+def read_clip(path, limit=None):
+    """
+    Read a recorded clip (video file or image directory) into memory
+
+    Args:
+        path: Video file or image directory path
+        limit: Maximum number of frames to read (None reads all)
+
+    Returns:
+        List of BGR frames
+    """
+    from frame_capture import open_frame_source, parse_source
+
+    cap = open_frame_source(parse_source(path))
+    frames = []
+
+    try:
+        while limit is None or len(frames) < limit:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+    finally:
+        cap.release()
+
+    return frames
+
+
+def peak_rss_mb():
+    """
+    Get the peak resident set size of this process and its waited-for children
+
+    Returns:
+        Tuple of (self_mb, children_mb), or (None, None) if unavailable
+    """
+    if resource is None:
+        return None, None
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+    return round(own, 1), round(children, 1)
+
+
+def _create_recognizer(case, **kwargs):
+    """Create a headless GestureRecognizer for a benchmark case"""
+    from gesture_stream import GestureRecognizer
+
+    width, height = case['resolution']
+    return GestureRecognizer(
+        model_path=case['model_path'],
+        running_mode=case['running_mode'],
+        motion_threshold=0,
+        idle_timeout=0,
+        capture_size=(width, height),
+        inference_size=(width, height),
+        preview_size=(width, height),
+        frame_bus_name=None,
+        socket_host=None,
+        inference_workers=case['inference_workers'],
+        max_num_hands=case['hands'],
+        publish_latency=False,
+        **kwargs
+    )
+
+
+def _wait_for_results(recognizer, timeout=10.0, idle_timeout=1.0):
+    """
+    Wait until frames submitted asynchronously (LIVE_STREAM, worker
+    processes) have produced their results
+
+    LIVE_STREAM may skip frames without a result, so waiting also ends once
+    no result has arrived for idle_timeout seconds.
+
+    Args:
+        recognizer: GestureRecognizer
+        timeout: Maximum time to wait in seconds
+        idle_timeout: Seconds without a new result after which to stop
+    """
+    if recognizer.inference_stream is not None:
+        recognizer._drain_inference(timeout)
+        return
+
+    if recognizer.running_mode != 'LIVE_STREAM':
+        return
+
+    deadline = time.monotonic() + timeout
+    handled = recognizer.results_handled
+    last_progress = time.monotonic()
+
+    while recognizer.pending_frames and time.monotonic() < deadline:
+        time.sleep(0.005)
+        if recognizer.results_handled != handled:
+            handled = recognizer.results_handled
+            last_progress = time.monotonic()
+        elif time.monotonic() - last_progress > idle_timeout:
+            break
+
+
+def benchmark_process_frame(case):
+    """
+    Benchmark process_frame and preview rendering on in-memory frames
+
+    fps counts completed recognition results, so LIVE_STREAM and worker
+    process runs (where process_frame only submits the frame) are measured
+    until their last result arrives and compare with IMAGE/VIDEO runs.
+
+    Args:
+        case: Benchmark case dictionary
+
+    Returns:
+        Dictionary with frames, results, elapsed seconds, fps and stage
+        latencies
+    """
+    width, height = case['resolution']
+    if case['source'] == 'synthetic':
+        frames = generate_frames(width, height, case['frames'] + case['warmup'], case['hands'])
+    else:
+        frames = read_clip(case['source'], case['frames'] + case['warmup'])
+
+    if len(frames) <= case['warmup']:
+        raise RuntimeError(f"{len(frames)} frames available, none left after {case['warmup']} warmup frames")
+
+    recognizer = _create_recognizer(case)
+    if not recognizer.initialize_mediapipe():
+        raise RuntimeError('Failed to initialize MediaPipe')
+
+    measured = 0
+    start_time = None
+    start_results = 0
+
+    try:
+        for i, frame in enumerate(frames):
+            if i == case['warmup']:
+                # Warmup frames pay for lazy initialization; drop their samples
+                # (and do not count their late results)
+                _wait_for_results(recognizer)
+                recognizer.latency.reset()
+                start_time = time.perf_counter()
+                start_results = recognizer.results_handled
+
+            recognizer.frame_timing = {}
+
+            with recognizer.latency.measure('process_frame'):
+                frame_result = recognizer.process_frame(frame)
+
+            with recognizer.latency.measure('annotate'):
+                recognizer.render_preview(frame, frame_result)
+
+            for stage, duration_ms in recognizer.frame_timing.items():
+                recognizer.latency.record(stage, duration_ms)
+
+            if start_time is not None:
+                measured += 1
+
+        # Stop the clock when the last frame was processed or its result
+        # arrived, whichever is later
+        loop_end_time = time.perf_counter()
+        _wait_for_results(recognizer)
+        results = recognizer.results_handled - start_results
+        elapsed = max(loop_end_time, recognizer.last_result_time or 0.0) - start_time
+        latency = recognizer.get_latency_statistics()
+
+    finally:
+        recognizer.cleanup()
+
+    return {
+        'frames': measured,
+        'results': results,
+        'elapsed_s': round(elapsed, 3),
+        'fps': round(results / elapsed, 2) if elapsed > 0 else 0.0,
+        'latency_ms': latency
+    }
+
+
+def benchmark_stream(case):
+    """
+    Benchmark the full replay loop over a clip on disk
+
+    Args:
+        case: Benchmark case dictionary
+
+    Returns:
+        Dictionary with frames, elapsed seconds, fps and stage latencies
+    """
+    recognizer = _create_recognizer(case, camera_index=case['stream_source'], replay=True)
+    recognizer.run()
+
+    if recognizer.frame_count == 0:
+        raise RuntimeError(f"No frames processed from {case['stream_source']}")
+
+    elapsed = recognizer.replay_elapsed
+    return {
+        'frames': recognizer.frame_count,
+        'elapsed_s': round(elapsed, 3),
+        'fps': round(recognizer.frame_count / elapsed, 2) if elapsed > 0 else 0.0,
+        'effective_running_mode': recognizer.running_mode,
+        'latency_ms': recognizer.get_latency_statistics()
+    }
+
+
+def run_case(case):
+    """
+    Run one benchmark case in the current process
+
+    Args:
+        case: Benchmark case dictionary
+
+    Returns:
+        Result dictionary (case parameters plus measurements)
+    """
+    result = {key: case[key] for key in
+              ('pipeline', 'source', 'resolution', 'hands', 'running_mode', 'inference_workers')}
+
+    try:
+        if case['pipeline'] == 'frame':
+            result.update(benchmark_process_frame(case))
+        else:
+            result.update(benchmark_stream(case))
+    except Exception as e:
+        logger.error(f'Benchmark case failed: {e}')
+        result['error'] = str(e)
+
+    result['peak_rss_mb'], result['peak_children_rss_mb'] = peak_rss_mb()
+    return result
+
+
+def _case_process_main(case, result_queue):
+    """Entry point of an isolated benchmark process"""
+    logging.getLogger().setLevel(case['log_level'])
+    result_queue.put(run_case(case))
+
+
+def run_case_isolated(case, context):
+    """
+    Run one benchmark case in a fresh process, so peak RSS is per case
+
+    Args:
+        case: Benchmark case dictionary
+        context: multiprocessing context
+
+    Returns:
+        Result dictionary
+    """
+    result_queue = context.Queue()
+    process = context.Process(target=_case_process_main, args=(case, result_queue))
+    process.start()
+
+    deadline = time.monotonic() + CASE_TIMEOUT
+    result = None
+
+    while result is None and time.monotonic() < deadline:
+        try:
+            result = result_queue.get(timeout=1.0)
+        except queue.Empty:
+            if not process.is_alive():
+                break
+
+    process.join(timeout=5)
+    if process.is_alive():
+        process.terminate()
+
+    if result is None:
+        result = {key: case[key] for key in
+                  ('pipeline', 'source', 'resolution', 'hands', 'running_mode', 'inference_workers')}
+        result['error'] = f'Benchmark process exited with code {process.exitcode}'
+
+    return result
+
+
+def build_cases(args, stream_sources):
+    """
+    Build the benchmark matrix
+
+    Args:
+        args: Parsed command line arguments
+        stream_sources: Dictionary of (source, resolution, hands) to the path
+            the stream pipeline reads from
+
+    Returns:
+        List of case dictionaries
+    """
+    sources = args.clip or ['synthetic']
+    cases = []
+
+    for pipeline in args.pipelines:
+        for source in sources:
+            for resolution in args.resolutions:
+                # Recorded clips contain however many hands were filmed; the
+                # hand count only sets the recognizer's maximum then
+                for hands in args.hands:
+                    for running_mode in args.running_modes:
+                        # Replay runs LIVE_STREAM as VIDEO, nothing new to measure
+                        if pipeline == 'stream' and running_mode == 'LIVE_STREAM':
+                            continue
+
+                        cases.append({
+                            'pipeline': pipeline,
+                            'source': source,
+                            'stream_source': stream_sources.get((source, resolution, hands), source),
+                            'resolution': list(resolution),
+                            'hands': hands,
+                            'running_mode': running_mode,
+                            'inference_workers': args.inference_workers,
+                            'model_path': args.model,
+                            'frames': args.frames,
+                            'warmup': args.warmup,
+                            'log_level': args.log_level
+                        })
+
+    return cases
+
+
+def get_environment():
+    """
+    Describe the machine and library versions the benchmark ran on
+
+    Returns:
+        Dictionary with environment information
+    """
+    try:
+        import mediapipe as mp
+        mediapipe_version = getattr(mp, '__version__', 'unknown')
+    except ImportError:
+        mediapipe_version = None
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'opencv': cv2.__version__,
+        'numpy': np.__version__,
+        'mediapipe': mediapipe_version
+    }
+
+
+def main():
+    """Main entry point"""
+    from gesture_stream import RUNNING_MODES
+
+    parser = argparse.ArgumentParser(description='Gesture recognition pipeline benchmark')
+    parser.add_argument('--model', type=str, default='gesture_recognizer.task',
+                       help='Path to gesture recognizer model')
+    parser.add_argument('--clip', type=str, nargs='*', default=[],
+                       help='Recorded video files or image directories (default: synthetic frames)')
+    parser.add_argument('--resolutions', type=parse_resolution, nargs='+',
+                       default=[parse_resolution(r) for r in DEFAULT_RESOLUTIONS],
+                       help='Inference resolutions as WIDTHxHEIGHT')
+    parser.add_argument('--hands', type=int, nargs='+', default=list(DEFAULT_HAND_COUNTS),
+                       help='Hand counts (synthetic blobs drawn and maximum hands detected)')
+    parser.add_argument('--running-modes', type=str, nargs='+', default=list(RUNNING_MODES),
+                       choices=RUNNING_MODES, help='MediaPipe running modes')
+    parser.add_argument('--pipelines', type=str, nargs='+', default=list(PIPELINES),
+                       choices=PIPELINES, help='Pipelines to measure')
+    parser.add_argument('--inference-workers', type=int, default=0,
+                       help='Worker processes for recognition (0 runs it in-process)')
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAME_COUNT,
+                       help='Measured frames per case (frame pipeline and synthetic clips)')
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP_FRAMES,
+                       help='Unmeasured warmup frames per case (frame pipeline)')
+    parser.add_argument('--no-isolate', action='store_true',
+                       help='Run all cases in this process (peak RSS is then cumulative)')
+    parser.add_argument('--output', type=str, default=None,
+                       help='Write the JSON report to this file (default: stdout)')
+    parser.add_argument('--log-level', type=str, default='WARNING',
+                       choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                       help='Logging level while benchmarking')
+
+    args = parser.parse_args()
+    logging.getLogger().setLevel(args.log_level)
+
+    if args.frames < 1 or args.warmup < 0:
+        parser.error('--frames must be at least 1 and --warmup not negative')
+
+    if not os.path.exists(args.model):
+        logger.error(f'Model file not found: {args.model}')
+        sys.exit(1)
+
+    for clip in args.clip:
+        if not os.path.exists(clip):
+            logger.error(f'Clip not found: {clip}')
+            sys.exit(1)
+
+    # The stream pipeline reads from disk, so synthetic clips are written out
+    # once per resolution and hand count
+    temp_dir = tempfile.mkdtemp(prefix='gesture_benchmark_')
+    stream_sources = {}
+
+    try:
+        if 'stream' in args.pipelines and not args.clip:
+            for width, height in args.resolutions:
+                for hands in args.hands:
+                    directory = os.path.join(temp_dir, f'{width}x{height}_{hands}')
+                    os.makedirs(directory)
+                    write_image_directory(generate_frames(width, height, args.frames, hands), directory)
+                    stream_sources[('synthetic', (width, height), hands)] = directory
+
+        cases = build_cases(args, stream_sources)
+        context = multiprocessing.get_context('spawn')
+        started = datetime.now(timezone.utc)
+        results = []
+
+        for i, case in enumerate(cases, 1):
+            print(f"[{i}/{len(cases)}] {case['pipeline']} {case['source']} "
+                  f"{case['resolution'][0]}x{case['resolution'][1]} hands={case['hands']} "
+                  f"{case['running_mode']}", file=sys.stderr)
+
+            result = run_case(case) if args.no_isolate else run_case_isolated(case, context)
+            results.append(result)
+
+            if 'error' in result:
+                print(f"    error: {result['error']}", file=sys.stderr)
+            else:
+                print(f"    {result['fps']:.1f} FPS, peak RSS {result['peak_rss_mb']} MB",
+                      file=sys.stderr)
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    report = {
+        'started': started.isoformat(),
+        'isolated': not args.no_isolate,
+        'environment': get_environment(),
+        'results': results
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f'Report written to {args.output}', file=sys.stderr)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if any('error' in result for result in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+"""
+Event Coalescing Check
+
+Feeds N recognizer results of the same gesture through
+GestureRecognizer.handle_gesture_result with coalescing on, all within one
+batch window, and checks that the controller side receives a single event
+with frame_count == N (and, with coalescing off, that the debounce lets
+only the first frame through). Exits non-zero on failure.
+
+Usage:
+    python check_coalescing.py --frames 10 --batch-ms 500
+"""
+
+import sys
+import json
+import socket
+import logging
+import argparse
+import threading
+from types import SimpleNamespace
+
+from gesture_stream import GestureRecognizer
+
+logger = logging.getLogger(__name__)
+
+
+def fake_result(gesture_name, confidence, hand='Right'):
+    """
+    Build a minimal stand-in for a MediaPipe GestureRecognizerResult
+
+    Args:
+        gesture_name: Top gesture category
+        confidence: Gesture score
+        hand: Handedness category
+
+    Returns:
+        Object with the attributes handle_gesture_result reads
+    """
+    category = SimpleNamespace(category_name=gesture_name, score=confidence)
+    handedness = SimpleNamespace(category_name=hand, score=1.0)
+    return SimpleNamespace(gestures=[[category]], handedness=[[handedness]], hand_landmarks=[[]])
+
+
+class EventCollector:
+    """TCP listener collecting the JSON events of one connection"""
+
+    def __init__(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+        self.events = []
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        """Read newline-delimited events until the sender disconnects"""
+        conn, _ = self.server.accept()
+        buffer = b''
+        with conn:
+            while True:
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                buffer += chunk
+                *lines, buffer = buffer.split(b'\n')
+                for line in lines:
+                    message = json.loads(line)
+                    # Leave the hello unanswered so the sender stays on JSON
+                    if message.get('type') != 'hello':
+                        self.events.append(message)
+
+    def wait(self, timeout=5.0):
+        """Wait for the connection to close, then stop listening"""
+        self.thread.join(timeout)
+        self.server.close()
+        return self.events
+
+
+def run_frames(frames, batch_ms, coalesce):
+    """
+    Send same-gesture frames 33 ms apart through a GestureRecognizer
+
+    Args:
+        frames: Number of frames
+        batch_ms: Batch interval in milliseconds
+        coalesce: Coalescing on or off
+
+    Returns:
+        Events received by the collector
+    """
+    collector = EventCollector()
+    recognizer = GestureRecognizer(
+        socket_host='127.0.0.1',
+        socket_port=collector.port,
+        wire_protocol='json',
+        frame_bus_name=None,
+        publish_latency=False,
+        batch_interval_ms=batch_ms,
+        batch_max_events=frames + 1,
+        coalesce_events=coalesce
+    )
+    recognizer.connect_socket()
+
+    for i in range(frames):
+        recognizer.handle_gesture_result(
+            fake_result('Thumb_Up', 0.6 + 0.3 * i / max(frames - 1, 1)),
+            timestamp_ms=1_000_000 + i * 33
+        )
+
+    recognizer.event_sender.stop()
+    return collector.wait()
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Check gesture event coalescing')
+    parser.add_argument('--frames', type=int, default=10,
+                        help='Same-gesture frames sent within one batch window')
+    parser.add_argument('--batch-ms', type=float, default=500,
+                        help='Batch interval (must cover all frames)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    failures = []
+
+    events = run_frames(args.frames, args.batch_ms, coalesce=True)
+    if len(events) != 1 or events[0].get('frame_count') != args.frames:
+        failures.append(f'coalescing: expected 1 event with frame_count={args.frames}, got '
+                        f'{[event.get("frame_count", 1) for event in events]}')
+    else:
+        event = events[0]
+        if not event['confidence_min'] <= event['confidence'] <= event['confidence_max']:
+            failures.append(f'coalescing: mean confidence outside its range: {event}')
+        if event['first_timestamp'] != 1_000_000:
+            failures.append(f'coalescing: wrong first_timestamp: {event["first_timestamp"]}')
+
+    events = run_frames(args.frames, args.batch_ms, coalesce=False)
+    if len(events) != 1 or 'frame_count' in events[0]:
+        failures.append(f'debounce: expected 1 plain event, got {len(events)}')
+
+    for failure in failures:
+        print(f'FAIL {failure}')
+    if failures:
+        sys.exit(1)
+    print(f'OK {args.frames} frames coalesced into one event')
+
+
+if __name__ == '__main__':
+    main()
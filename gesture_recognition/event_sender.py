@@ -0,0 +1,407 @@
+"""
+Gesture Event Sender
+
+Delivers gesture events to the controller from a dedicated thread, so a
+slow or missing controller never blocks the frame loop. Events wait in a
+bounded queue that drops the oldest event when full; the connection is
+re-established with exponential backoff whenever it fails or was never up.
+
+Optionally, events are batched: whatever accumulates within the batch
+interval (or up to the batch size) goes out in one write, and consecutive
+events of the same gesture can be coalesced into one summary event.
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import random
+import select
+import logging
+import threading
+from collections import deque
+
+# Add this directory to path for sibling imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from transport import unix_socket_address
+from wire_protocol import (
+    PROTOCOL_BINARY, PROTOCOL_JSON, BinaryEventEncoder, make_hello, parse_hello_ack
+)
+
+logger = logging.getLogger(__name__)
+
+
+def coalesce_events(events):
+    """
+    Collapse consecutive events of the same gesture into summary events
+
+    Runs are tracked per (source, hand), so two hands interleaving do not
+    break each other's runs. A run of one event is passed through unchanged;
+    longer runs become one event with the last event's timestamp, capture
+    time, the mean confidence, and:
+
+        frame_count        number of events collapsed
+        confidence_min     lowest confidence in the run
+        confidence_max     highest confidence in the run
+        first_timestamp    timestamp of the first event in the run
+
+    Args:
+        events: Gesture event dictionaries in emission order
+
+    Returns:
+        List of events, ordered by the start of each run
+    """
+    runs = []
+    open_runs = {}
+
+    for event in events:
+        key = (event.get('source'), event.get('hand'))
+        run = open_runs.get(key)
+
+        if run is not None and run[-1].get('gesture') == event.get('gesture'):
+            run.append(event)
+        else:
+            run = [event]
+            runs.append(run)
+            open_runs[key] = run
+
+    coalesced = []
+    for run in runs:
+        if len(run) == 1:
+            coalesced.append(run[0])
+            continue
+
+        confidences = [event['confidence'] for event in run]
+        summary = dict(run[-1])
+        summary.update({
+            'confidence': sum(confidences) / len(confidences),
+            'frame_count': len(run),
+            'confidence_min': min(confidences),
+            'confidence_max': max(confidences),
+            'first_timestamp': run[0]['timestamp']
+        })
+        coalesced.append(summary)
+
+    return coalesced
+
+
+class EventSender:
+    """Background sender with a drop-oldest queue and automatic reconnect"""
+
+    def __init__(self, host=None, port=None, socket_path=None, wire_protocol='json',
+                 sources=(), queue_size=256, reconnect_initial_delay=0.5,
+                 reconnect_max_delay=30.0, hello_timeout=1.0, send_timeout=5.0,
+                 batch_interval=0.0, batch_max_events=32, coalesce=False,
+                 latency=None):
+        """
+        Initialize sender
+
+        Args:
+            host: Controller host (TCP)
+            port: Controller port (TCP)
+            socket_path: Controller Unix socket, used instead of TCP if set
+                ('@name' for an abstract-namespace socket)
+            wire_protocol: 'binary' offers binary framing on every connect,
+                'json' always sends newline-delimited JSON
+            sources: Source ids announced in the binary protocol hello
+            queue_size: Maximum number of queued events
+            reconnect_initial_delay: First reconnect delay in seconds
+            reconnect_max_delay: Upper bound for the reconnect delay
+            hello_timeout: Seconds to wait for the protocol ack
+            send_timeout: Seconds before a stalled send counts as a failure
+            batch_interval: Seconds to collect events before one write
+                (0 sends every event on its own)
+            batch_max_events: Events that flush a batch early
+            coalesce: Collapse consecutive same-gesture events within a
+                batch (see coalesce_events)
+            latency: LatencyRecorder for the 'send' stage (queue wait plus
+                socket write), optional
+        """
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.wire_protocol = wire_protocol
+        self.sources = list(sources)
+        self.queue_size = queue_size
+        self.reconnect_initial_delay = reconnect_initial_delay
+        self.reconnect_max_delay = reconnect_max_delay
+        self.hello_timeout = hello_timeout
+        self.send_timeout = send_timeout
+        self.batch_interval = batch_interval
+        self.batch_max_events = max(1, batch_max_events) if batch_interval > 0 else 1
+        self.coalesce = coalesce
+        self.latency = latency
+
+        self.address = f'unix:{socket_path}' if socket_path else f'{host}:{port}'
+
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._stopping = threading.Event()
+        self._flush_deadline = 0.0
+        self._thread = None
+
+        self._sock = None
+        self._encoder = None
+        self.protocol = None
+
+        # Statistics
+        self.events_queued = 0
+        self.events_sent = 0
+        self.events_coalesced = 0
+        self.writes = 0
+        self.events_dropped = 0
+        self.connect_attempts = 0
+        self.connections = 0
+        self.send_errors = 0
+
+    def start(self):
+        """Start the sender thread"""
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name='event-sender', daemon=True)
+        self._thread.start()
+
+    def send(self, event):
+        """
+        Queue an event for sending (never blocks on the network)
+
+        Args:
+            event: Gesture event dictionary
+        """
+        with self._cond:
+            if len(self._queue) >= self.queue_size:
+                self._queue.popleft()
+                self.events_dropped += 1
+
+            self._queue.append((event, time.perf_counter()))
+            self.events_queued += 1
+            self._cond.notify()
+
+    def is_connected(self):
+        """Check if the sender currently has a controller connection"""
+        return self._sock is not None
+
+    def _run(self):
+        """Sender thread main loop"""
+        delay = self.reconnect_initial_delay
+
+        while self._should_run():
+            if self._sock is None:
+                if self._stopping.is_set():
+                    break
+
+                if not self._connect():
+                    # Exponential backoff with jitter, interrupted by stop()
+                    self._stopping.wait(delay * random.uniform(0.8, 1.2))
+                    delay = min(delay * 2, self.reconnect_max_delay)
+                    continue
+
+                delay = self.reconnect_initial_delay
+
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._stopping.is_set(), timeout=1.0)
+
+            if self._peer_closed():
+                # A send to a closed TCP peer still succeeds once and the
+                # event is lost, so notice the close before sending
+                logger.warning(f'Socket connection to {self.address} closed by peer')
+                self._disconnect()
+                continue
+
+            batch = self._take_batch()
+            if not batch:
+                continue
+
+            try:
+                events = [event for event, _ in batch]
+                if self.coalesce and len(events) > 1:
+                    events = coalesce_events(events)
+
+                if self._encoder is not None:
+                    payload = b''.join(self._encoder.encode(event) for event in events)
+                else:
+                    payload = ''.join(json.dumps(event) + '\n' for event in events).encode('utf-8')
+
+                self._sock.sendall(payload)
+                self.writes += 1
+                self.events_sent += len(batch)
+                self.events_coalesced += len(batch) - len(events)
+
+                if self.latency is not None:
+                    sent_at = time.perf_counter()
+                    for _, queued_at in batch:
+                        self.latency.record('send', (sent_at - queued_at) * 1000)
+
+            except (OSError, ValueError) as e:
+                self.send_errors += 1
+                logger.warning(f'Failed to send gesture event to {self.address}: {e}')
+                self._disconnect()
+
+                # Retry the batch after reconnecting unless newer events filled the queue
+                with self._cond:
+                    for item in reversed(batch):
+                        if len(self._queue) < self.queue_size:
+                            self._queue.appendleft(item)
+                        else:
+                            self.events_dropped += 1
+
+        self._disconnect()
+
+    def _take_batch(self):
+        """
+        Take the next events to write
+
+        With batching enabled, waits until the oldest queued event is
+        batch_interval old or batch_max_events are queued.
+
+        Returns:
+            List of (event, queued_at) tuples (may be empty)
+        """
+        with self._cond:
+            if self._queue and self.batch_interval > 0:
+                deadline = self._queue[0][1] + self.batch_interval
+                self._cond.wait_for(
+                    lambda: (len(self._queue) >= self.batch_max_events or
+                             self._stopping.is_set()),
+                    timeout=max(0.0, deadline - time.perf_counter())
+                )
+
+            count = min(len(self._queue), self.batch_max_events)
+            return [self._queue.popleft() for _ in range(count)]
+
+    def _should_run(self):
+        """Keep running until stopped, then until the queue is flushed"""
+        if not self._stopping.is_set():
+            return True
+        return (bool(self._queue) and self._sock is not None and
+                time.monotonic() < self._flush_deadline)
+
+    def _peer_closed(self):
+        """Check if the controller closed the connection (it never sends after the ack)"""
+        try:
+            readable, _, _ = select.select([self._sock], [], [], 0)
+            return bool(readable) and not self._sock.recv(1, socket.MSG_PEEK)
+        except OSError:
+            return True
+
+    def _connect(self):
+        """
+        Open a connection and negotiate the wire protocol
+
+        Returns:
+            True if connected
+        """
+        self.connect_attempts += 1
+
+        try:
+            if self.socket_path:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                address = unix_socket_address(self.socket_path)
+            else:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                address = (self.host, self.port)
+
+            sock.settimeout(self.send_timeout)
+            sock.connect(address)
+
+            self._encoder = None
+            self.protocol = PROTOCOL_JSON
+            if self.wire_protocol == 'binary':
+                self.protocol = self._negotiate(sock)
+                if self.protocol == PROTOCOL_BINARY:
+                    self._encoder = BinaryEventEncoder(self.sources)
+
+        except OSError as e:
+            # Log the first failure of a series, then stay quiet until it works
+            log = logger.warning if self.connect_attempts == self.connections + 1 else logger.debug
+            log(f'Failed to connect to {self.address}: {e}')
+            return False
+
+        self._sock = sock
+        self.connections += 1
+        logger.info(f'Connected to socket {self.address} ({self.protocol})')
+        return True
+
+    def _negotiate(self, sock):
+        """
+        Offer binary framing and wait for the controller's answer
+
+        Controllers that do not know the hello never answer; after
+        hello_timeout the connection simply stays on JSON.
+
+        Args:
+            sock: Connected socket
+
+        Returns:
+            Negotiated protocol name
+        """
+        sock.sendall(make_hello(self.sources))
+        sock.settimeout(self.hello_timeout)
+
+        response = b''
+        try:
+            while not response.endswith(b'\n'):
+                chunk = sock.recv(256)
+                if not chunk:
+                    break
+                response += chunk
+        except socket.timeout:
+            return PROTOCOL_JSON
+        finally:
+            sock.settimeout(self.send_timeout)
+
+        return parse_hello_ack(response)
+
+    def _disconnect(self):
+        """Close the current connection, if any"""
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+    def stop(self, flush_timeout=2.0):
+        """
+        Stop the sender, first trying to deliver queued events
+
+        Args:
+            flush_timeout: Maximum time to spend sending queued events
+        """
+        self._flush_deadline = time.monotonic() + flush_timeout
+        self._stopping.set()
+
+        with self._cond:
+            self._cond.notify_all()
+
+        if self._thread:
+            self._thread.join(timeout=flush_timeout + self.send_timeout)
+            self._thread = None
+
+        logger.info(
+            f'Event sender stopped (sent: {self.events_sent}, dropped: {self.events_dropped}, '
+            f'unsent: {len(self._queue)})'
+        )
+
+    def get_statistics(self):
+        """
+        Get sender statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'address': self.address,
+            'connected': self.is_connected(),
+            'protocol': self.protocol,
+            'queued': len(self._queue),
+            'events_queued': self.events_queued,
+            'events_sent': self.events_sent,
+            'events_dropped': self.events_dropped,
+            'events_coalesced': self.events_coalesced,
+            'writes': self.writes,
+            'connect_attempts': self.connect_attempts,
+            'reconnects': max(self.connections - 1, 0),
+            'send_errors': self.send_errors
+        }
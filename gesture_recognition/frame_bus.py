@@ -0,0 +1,310 @@
+"""
+Shared-Memory Frame Bus
+
+Ring of fixed-size frame slots in POSIX shared memory, used to hand annotated
+preview frames from the gesture recognizer process to the web server without
+copying or re-serializing them.
+
+Layout:
+    header  | magic, width, height, channels, slot count, latest sequence,
+            | reader heartbeat, writer process id
+    slots   | per slot: sequence-begin, sequence-end, timestamp, pixel data
+
+A slot is written seqlock-style: the writer stores the new sequence number
+in sequence-begin, copies the pixels, then stores it in sequence-end. Readers
+use the pixels in place and afterwards check that sequence-begin still
+matches the sequence they started with.
+
+Readers are read-only except for the heartbeat field, which they refresh so
+the writer can skip rendering preview frames while nobody is watching.
+
+The writer's process id lets a new writer tell a segment left behind by a
+crashed process (reclaimed) from one that is still being published to
+(refused).
+"""
+
+import os
+import time
+import struct
+import logging
+from multiprocessing import shared_memory, resource_tracker
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BUS_MAGIC = b'GFB1'
+
+# magic, width, height, channels, slot_count
+HEADER_STRUCT = struct.Struct('<4sIIII')
+HEADER_SIZE = 64
+
+# uint64 fields after the fixed header
+LATEST_SEQ_OFFSET = 32
+HEARTBEAT_OFFSET = 40
+WRITER_PID_OFFSET = 48
+
+# seq_begin, seq_end, timestamp_ns (uint64 each), padded to 32 bytes
+SLOT_HEADER_SIZE = 32
+
+
+def _process_alive(pid):
+    """Check whether a process with this id exists"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists, owned by another user
+        return True
+    except OverflowError:
+        return False
+    return True
+
+
+class SharedFrameBus:
+    """Single-writer, multi-reader frame ring in shared memory"""
+
+    def __init__(self, shm, width, height, channels, slot_count, writer):
+        """
+        Wrap a shared memory segment (use create() or attach() instead)
+
+        Args:
+            shm: SharedMemory instance
+            width: Frame width in pixels
+            height: Frame height in pixels
+            channels: Channels per pixel
+            slot_count: Number of frame slots in the ring
+            writer: True if this side publishes frames
+        """
+        self.shm = shm
+        self.name = shm.name
+        self.width = width
+        self.height = height
+        self.channels = channels
+        self.slot_count = slot_count
+        self.writer = writer
+
+        self.frame_shape = (height, width, channels)
+        self.frame_size = width * height * channels
+        self.slot_size = SLOT_HEADER_SIZE + self.frame_size
+
+        buf = shm.buf
+        self._latest_seq = np.ndarray((1,), dtype=np.uint64, buffer=buf, offset=LATEST_SEQ_OFFSET)
+        self._heartbeat = np.ndarray((1,), dtype=np.uint64, buffer=buf, offset=HEARTBEAT_OFFSET)
+
+        self._slot_headers = []
+        self._slot_frames = []
+        for i in range(slot_count):
+            offset = HEADER_SIZE + i * self.slot_size
+            header = np.ndarray((3,), dtype=np.uint64, buffer=buf, offset=offset)
+            frame = np.ndarray(self.frame_shape, dtype=np.uint8, buffer=buf,
+                               offset=offset + SLOT_HEADER_SIZE)
+            if not writer:
+                frame.flags.writeable = False
+            self._slot_headers.append(header)
+            self._slot_frames.append(frame)
+
+    @staticmethod
+    def required_size(width, height, channels, slot_count):
+        """Get the shared memory size needed for a bus"""
+        return HEADER_SIZE + slot_count * (SLOT_HEADER_SIZE + width * height * channels)
+
+    @classmethod
+    def create(cls, name, width, height, channels=3, slot_count=4):
+        """
+        Create a bus for publishing frames
+
+        A stale segment with the same name (e.g. left behind by a crashed
+        writer) is replaced; one whose writer process is still running is
+        not.
+
+        Args:
+            name: Shared memory name
+            width: Frame width in pixels
+            height: Frame height in pixels
+            channels: Channels per pixel
+            slot_count: Number of frame slots in the ring
+
+        Returns:
+            SharedFrameBus in writer mode
+
+        Raises:
+            FileExistsError: If another running process publishes to this name
+        """
+        size = cls.required_size(width, height, channels, slot_count)
+
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            cls._remove_stale(name)
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        shm.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+        HEADER_STRUCT.pack_into(shm.buf, 0, BUS_MAGIC, width, height, channels, slot_count)
+        struct.pack_into('<Q', shm.buf, WRITER_PID_OFFSET, os.getpid())
+
+        logger.info(f'Frame bus created: {name} ({width}x{height}x{channels}, {slot_count} slots)')
+        return cls(shm, width, height, channels, slot_count, writer=True)
+
+    @staticmethod
+    def _remove_stale(name):
+        """
+        Remove an existing segment unless its writer is still running
+
+        Args:
+            name: Shared memory name
+
+        Raises:
+            FileExistsError: If the segment's writer process is alive
+        """
+        existing = shared_memory.SharedMemory(name=name)
+
+        writer_pid = 0
+        if existing.size >= HEADER_SIZE and bytes(existing.buf[:4]) == BUS_MAGIC:
+            writer_pid = struct.unpack_from('<Q', existing.buf, WRITER_PID_OFFSET)[0]
+
+        if writer_pid and _process_alive(writer_pid):
+            # Leave the segment to its writer (the tracker would unlink it)
+            try:
+                resource_tracker.unregister(existing._name, 'shared_memory')
+            except Exception:
+                pass
+            existing.close()
+            raise FileExistsError(f'Frame bus {name} is in use by process {writer_pid}')
+
+        logger.warning(f'Replacing stale frame bus segment: {name}')
+        existing.close()
+        existing.unlink()
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attach to an existing bus for reading
+
+        Args:
+            name: Shared memory name
+
+        Returns:
+            SharedFrameBus in reader mode
+
+        Raises:
+            FileNotFoundError: If no bus with this name exists
+            ValueError: If the segment is not a frame bus
+        """
+        shm = shared_memory.SharedMemory(name=name)
+
+        # Readers must not unlink the writer's segment when they exit
+        try:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        except Exception:
+            pass
+
+        magic, width, height, channels, slot_count = HEADER_STRUCT.unpack_from(shm.buf, 0)
+        if magic != BUS_MAGIC:
+            shm.close()
+            raise ValueError(f'Shared memory {name} is not a frame bus')
+
+        return cls(shm, width, height, channels, slot_count, writer=False)
+
+    def begin_write(self):
+        """
+        Claim the next slot for rendering a frame in place
+
+        Returns:
+            Tuple of (sequence_number, writable frame view); pass the sequence
+            number to commit() once the frame is complete
+        """
+        seq = int(self._latest_seq[0]) + 1
+        index = seq % self.slot_count
+
+        self._slot_headers[index][0] = seq
+        return seq, self._slot_frames[index]
+
+    def commit(self, seq, timestamp_ns=None):
+        """
+        Make a frame claimed with begin_write() visible to readers
+
+        Args:
+            seq: Sequence number returned by begin_write()
+            timestamp_ns: Capture time in nanoseconds (defaults to now)
+        """
+        header = self._slot_headers[seq % self.slot_count]
+        header[2] = timestamp_ns if timestamp_ns is not None else time.monotonic_ns()
+        header[1] = seq
+        self._latest_seq[0] = seq
+
+    def touch(self):
+        """Refresh the reader heartbeat (called by readers)"""
+        self._heartbeat[0] = time.monotonic_ns()
+
+    def has_active_reader(self, timeout):
+        """
+        Check if a reader refreshed the heartbeat recently
+
+        Args:
+            timeout: Maximum heartbeat age in seconds
+
+        Returns:
+            True if a reader is active
+        """
+        heartbeat = int(self._heartbeat[0])
+        return heartbeat > 0 and time.monotonic_ns() - heartbeat < timeout * 1e9
+
+    def get_latest(self, last_seq=0):
+        """
+        Get a read-only view of the newest complete frame
+
+        The view points straight into shared memory; call is_intact() after
+        using it to make sure the writer did not overwrite it meanwhile.
+
+        Args:
+            last_seq: Sequence number the caller already has
+
+        Returns:
+            Tuple of (sequence_number, frame_view, timestamp_ns) or None if
+            there is no newer frame
+        """
+        self.touch()
+
+        seq = int(self._latest_seq[0])
+        if seq == 0 or seq <= last_seq:
+            return None
+
+        header = self._slot_headers[seq % self.slot_count]
+        if int(header[1]) != seq:
+            return None
+
+        return seq, self._slot_frames[seq % self.slot_count], int(header[2])
+
+    def is_intact(self, seq):
+        """
+        Check that a frame returned by get_latest() was not overwritten
+
+        Args:
+            seq: Sequence number returned by get_latest()
+
+        Returns:
+            True if the slot still holds that frame
+        """
+        return int(self._slot_headers[seq % self.slot_count][0]) == seq
+
+    def get_latest_seq(self):
+        """Get the sequence number of the newest published frame"""
+        return int(self._latest_seq[0])
+
+    def close(self):
+        """Unmap the bus (and remove it if this side created it)"""
+        # Drop numpy views before closing, they hold exported buffers
+        self._slot_headers = []
+        self._slot_frames = []
+        self._latest_seq = None
+        self._heartbeat = None
+
+        try:
+            self.shm.close()
+            if self.writer:
+                self.shm.unlink()
+                logger.info(f'Frame bus removed: {self.name}')
+        except Exception as e:
+            logger.error(f'Error closing frame bus {self.name}: {e}')
@@ -0,0 +1,291 @@
+"""
+Frame Capture
+
+Reads frames from an OpenCV capture on a dedicated thread so that inference
+always works on the newest frame instead of draining a stale driver buffer.
+Also opens offline sources (video files and image directories) for replay.
+"""
+
+import os
+import time
+import threading
+import logging
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Number of preallocated frame slots (write, ready, read)
+FRAME_SLOT_COUNT = 3
+
+# File extensions read by ImageDirectorySource
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.webp')
+
+
+class ImageDirectorySource:
+    """Reads the images of a directory in name order, like a VideoCapture"""
+
+    def __init__(self, directory, fps=30.0):
+        """
+        Initialize image directory source
+
+        Args:
+            directory: Directory containing image files
+            fps: Nominal frame rate reported through CAP_PROP_FPS
+        """
+        self.directory = directory
+        self.fps = fps
+        self.files = sorted(
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        self.position = 0
+
+    def isOpened(self):
+        """Check if there are images to read"""
+        return bool(self.files)
+
+    def read(self, image=None):
+        """
+        Read the next image
+
+        Args:
+            image: Buffer to decode into when it has the right shape (optional)
+
+        Returns:
+            Tuple of (success, frame)
+        """
+        while self.position < len(self.files):
+            path = self.files[self.position]
+            self.position += 1
+
+            frame = cv2.imread(path, cv2.IMREAD_COLOR)
+            if frame is None:
+                logger.warning(f'Skipping unreadable image: {path}')
+                continue
+
+            if image is not None and image.shape == frame.shape:
+                np.copyto(image, frame)
+                return True, image
+            return True, frame
+
+        return False, None
+
+    def get(self, prop_id):
+        """Get a capture property (only FPS and frame count are known)"""
+        if prop_id == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return len(self.files)
+        return 0.0
+
+    def set(self, prop_id, value):
+        """Setting properties is not supported"""
+        return False
+
+    def release(self):
+        """Release the source"""
+        self.files = []
+
+
+def parse_source(source):
+    """
+    Normalize a source given on the command line
+
+    Args:
+        source: Camera index, video file path or image directory path
+
+    Returns:
+        int for camera indices, otherwise the path string
+    """
+    if isinstance(source, int):
+        return source
+    return int(source) if str(source).isdigit() else source
+
+
+def is_live_source(source):
+    """Check if a parsed source is a live camera device"""
+    return isinstance(source, int)
+
+
+def open_frame_source(source, fps=30.0):
+    """
+    Open a camera, video file or image directory
+
+    Args:
+        source: Parsed source (see parse_source)
+        fps: Nominal frame rate for image directories
+
+    Returns:
+        VideoCapture-like object
+    """
+    if is_live_source(source):
+        return cv2.VideoCapture(source)
+
+    if os.path.isdir(source):
+        return ImageDirectorySource(source, fps=fps)
+
+    return cv2.VideoCapture(source)
+
+
+class FrameGrabber:
+    """
+    Newest-frame-wins capture thread backed by a triple buffer
+
+    The capture thread always writes into its own slot and then swaps it with
+    the "ready" slot. The consumer swaps the ready slot with its own "read"
+    slot, so neither side ever copies a frame or waits on the other. A ready
+    frame that is replaced before it was consumed is counted as dropped.
+    """
+
+    def __init__(self, cap, name='camera', stop_at_end=False):
+        """
+        Initialize frame grabber
+
+        Args:
+            cap: Opened cv2.VideoCapture (or any object with read()/isOpened())
+            name: Name used for the thread and log messages
+            stop_at_end: Treat a failed read as the end of the stream (video
+                files and image directories) instead of retrying
+        """
+        self.cap = cap
+        self.name = name
+        self.stop_at_end = stop_at_end
+
+        # Slots are allocated from the first frame's shape
+        self._slots = None
+        self._write_idx = 0
+        self._ready_idx = 1
+        self._read_idx = 2
+
+        # Sequence number and capture time of the frame in the ready slot
+        self._ready_seq = 0
+        self._ready_time = 0.0
+        self._delivered_seq = 0
+
+        self._cond = threading.Condition()
+        self._thread = None
+        self.running = False
+        self.ended = False
+
+        # Statistics
+        self.frames_captured = 0
+        self.frames_delivered = 0
+        self.frames_dropped = 0
+        self.read_failures = 0
+
+    def start(self):
+        """Start the capture thread"""
+        self.running = True
+        self._thread = threading.Thread(
+            target=self._capture_loop,
+            name=f'capture-{self.name}',
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f'Capture thread started for {self.name}')
+
+    def stop(self):
+        """Stop the capture thread"""
+        self.running = False
+
+        with self._cond:
+            self._cond.notify_all()
+
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+        logger.info(
+            f'Capture thread stopped for {self.name} '
+            f'(captured: {self.frames_captured}, dropped: {self.frames_dropped})'
+        )
+
+    def _capture_loop(self):
+        """Capture thread main loop"""
+        while self.running:
+            if self._slots is None:
+                ret, frame = self.cap.read()
+            else:
+                ret, frame = self.cap.read(self._slots[self._write_idx])
+
+            if not ret:
+                if self.stop_at_end:
+                    logger.info(f'End of stream from {self.name}')
+                    with self._cond:
+                        self.ended = True
+                        self.running = False
+                        self._cond.notify_all()
+                    break
+
+                self.read_failures += 1
+                logger.warning(f'Failed to read frame from {self.name}')
+                time.sleep(0.1)
+                continue
+
+            capture_time = time.monotonic()
+
+            if self._slots is None:
+                self._slots = [frame] + [frame.copy() for _ in range(FRAME_SLOT_COUNT - 1)]
+            elif frame is not self._slots[self._write_idx]:
+                # Driver returned a new array (e.g. resolution changed)
+                self._slots[self._write_idx] = frame
+
+            with self._cond:
+                if self._ready_seq > self._delivered_seq:
+                    self.frames_dropped += 1
+
+                self._write_idx, self._ready_idx = self._ready_idx, self._write_idx
+                self.frames_captured += 1
+                self._ready_seq = self.frames_captured
+                self._ready_time = capture_time
+                self._cond.notify()
+
+    def read_latest(self, timeout=1.0):
+        """
+        Get the newest captured frame, waiting for one if necessary
+
+        The returned array stays valid until the next call to read_latest.
+
+        Args:
+            timeout: Maximum time to wait for a new frame in seconds
+
+        Returns:
+            Tuple of (sequence_number, frame, capture_time) or None on timeout
+            or once the stream has ended (see ended)
+        """
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._ready_seq > self._delivered_seq or not self.running,
+                timeout=timeout
+            ):
+                return None
+
+            if self._ready_seq <= self._delivered_seq:
+                return None
+
+            self._read_idx, self._ready_idx = self._ready_idx, self._read_idx
+            self._delivered_seq = self._ready_seq
+            self.frames_delivered += 1
+
+            return self._delivered_seq, self._slots[self._read_idx], self._ready_time
+
+    def get_statistics(self):
+        """
+        Get capture statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'frames_captured': self.frames_captured,
+            'frames_delivered': self.frames_delivered,
+            'frames_dropped': self.frames_dropped,
+            'read_failures': self.read_failures,
+            'drop_rate': (
+                self.frames_dropped / self.frames_captured * 100
+                if self.frames_captured > 0 else 0.0
+            )
+        }
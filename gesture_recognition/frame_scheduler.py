@@ -0,0 +1,98 @@
+"""
+Adaptive Frame Scheduler
+
+Paces the inference loop to a target frame rate, sleeping only for the part
+of the frame budget that inference did not use, and drops to a lower idle
+rate when no hand has been seen for a while.
+"""
+
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveFrameScheduler:
+    """Frame-rate scheduler with an idle back-off mode"""
+
+    def __init__(self, target_fps: float = 30.0, idle_fps: float = 5.0,
+                 idle_timeout: float = 10.0):
+        """
+        Initialize scheduler
+
+        Args:
+            target_fps: Inference rate while a hand is (or was recently) visible
+            idle_fps: Inference rate once no hand has been seen for idle_timeout
+            idle_timeout: Seconds without a hand before entering idle mode
+                (0 disables idle mode)
+        """
+        if target_fps <= 0 or idle_fps <= 0:
+            raise ValueError('Frame rates must be positive')
+
+        self.target_fps = target_fps
+        self.idle_fps = min(idle_fps, target_fps)
+        self.idle_timeout = idle_timeout
+
+        self.frame_start = time.monotonic()
+        self.last_hand_time = self.frame_start
+        self.idle = False
+
+        # Statistics
+        self.idle_transitions = 0
+        self.total_sleep_time = 0.0
+
+    def start_frame(self):
+        """Mark the start of a frame's processing"""
+        self.frame_start = time.monotonic()
+
+    def update(self, hand_present: bool):
+        """
+        Update idle state from the latest recognition result
+
+        Args:
+            hand_present: True if at least one hand was detected
+        """
+        now = time.monotonic()
+
+        if hand_present:
+            self.last_hand_time = now
+            if self.idle:
+                self.idle = False
+                logger.info(f'Hand detected, resuming full rate ({self.target_fps:g} FPS)')
+            return
+
+        if (not self.idle and self.idle_timeout > 0 and
+                now - self.last_hand_time >= self.idle_timeout):
+            self.idle = True
+            self.idle_transitions += 1
+            logger.info(
+                f'No hand for {self.idle_timeout:g}s, entering idle mode '
+                f'({self.idle_fps:g} FPS)'
+            )
+
+    def get_current_fps(self) -> float:
+        """Get the frame rate currently being targeted"""
+        return self.idle_fps if self.idle else self.target_fps
+
+    def wait(self):
+        """Sleep for whatever is left of the current frame budget"""
+        budget = 1.0 / self.get_current_fps()
+        remaining = budget - (time.monotonic() - self.frame_start)
+
+        if remaining > 0:
+            self.total_sleep_time += remaining
+            time.sleep(remaining)
+
+    def get_statistics(self):
+        """
+        Get scheduler statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'idle': self.idle,
+            'current_fps': self.get_current_fps(),
+            'idle_transitions': self.idle_transitions,
+            'total_sleep_time': self.total_sleep_time
+        }
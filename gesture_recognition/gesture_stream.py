@@ -8,17 +8,20 @@ and streams both gesture events and video frames.
 import cv2
 import mediapipe as mp
 import numpy as np
+from mediapipe.framework.formats import landmark_pb2
 import time
 import json
-import socket
 import threading
 import logging
 import sys
 import os
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
 
-# Add parent directory to path for imports
+# Add parent directory (config) and this directory (sibling modules) to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
     from config.constants import (
@@ -26,13 +29,46 @@ try:
         DEFAULT_CAMERA_WIDTH,
         DEFAULT_CAMERA_HEIGHT,
         DEFAULT_CAMERA_FPS,
+        INFERENCE_WIDTH,
+        INFERENCE_HEIGHT,
+        PREVIEW_WIDTH,
+        PREVIEW_HEIGHT,
+        FRAME_BUS_NAME,
+        FRAME_BUS_SLOTS,
+        PREVIEW_CONSUMER_TIMEOUT,
+        RECOGNIZER_POOL_SIZE,
+        INFERENCE_WORKERS,
+        INFERENCE_TASK_TIMEOUT,
+        INFERENCE_WORKER_RESTARTS,
+        REPLAY_DEFAULT_FPS,
         DEFAULT_SOCKET_HOST,
         DEFAULT_SOCKET_PORT,
+        DEFAULT_UNIX_SOCKET_PATH,
+        WIRE_PROTOCOL,
+        WIRE_HELLO_TIMEOUT,
+        EVENT_QUEUE_SIZE,
+        RECONNECT_INITIAL_DELAY,
+        RECONNECT_MAX_DELAY,
+        EVENT_SEND_TIMEOUT,
+        EVENT_BATCH_INTERVAL_MS,
+        EVENT_BATCH_MAX_EVENTS,
+        EVENT_COALESCE,
         MEDIAPIPE_MIN_DETECTION_CONFIDENCE,
         MEDIAPIPE_MIN_TRACKING_CONFIDENCE,
         MEDIAPIPE_MIN_HAND_PRESENCE_CONFIDENCE,
         MEDIAPIPE_MAX_NUM_HANDS,
-        FRAME_PROCESSING_DELAY,
+        MEDIAPIPE_RUNNING_MODE,
+        TARGET_INFERENCE_FPS,
+        IDLE_INFERENCE_FPS,
+        IDLE_TIMEOUT_SECONDS,
+        MOTION_THRESHOLD,
+        MOTION_PIXEL_DELTA,
+        MOTION_REFRESH_INTERVAL,
+        ROI_EXPAND_FACTOR,
+        ROI_FULL_FRAME_INTERVAL,
+        ROI_MIN_SIZE,
+        LATENCY_WINDOW_SIZE,
+        LATENCY_STATS_INTERVAL,
         GESTURE_DEBOUNCE_TIME
     )
 except ImportError:
@@ -41,15 +77,59 @@ except ImportError:
     DEFAULT_CAMERA_WIDTH = 640
     DEFAULT_CAMERA_HEIGHT = 480
     DEFAULT_CAMERA_FPS = 30
+    INFERENCE_WIDTH = 640
+    INFERENCE_HEIGHT = 480
+    PREVIEW_WIDTH = 640
+    PREVIEW_HEIGHT = 480
+    FRAME_BUS_NAME = 'ha_gesture_preview'
+    FRAME_BUS_SLOTS = 4
+    PREVIEW_CONSUMER_TIMEOUT = 2.0
+    RECOGNIZER_POOL_SIZE = 2
+    INFERENCE_WORKERS = 0
+    INFERENCE_TASK_TIMEOUT = 10.0
+    INFERENCE_WORKER_RESTARTS = 3
+    REPLAY_DEFAULT_FPS = 30.0
     DEFAULT_SOCKET_HOST = 'localhost'
     DEFAULT_SOCKET_PORT = 5555
+    DEFAULT_UNIX_SOCKET_PATH = '/tmp/gesture_control.sock'
+    WIRE_PROTOCOL = 'json'
+    WIRE_HELLO_TIMEOUT = 1.0
+    EVENT_QUEUE_SIZE = 256
+    RECONNECT_INITIAL_DELAY = 0.5
+    RECONNECT_MAX_DELAY = 30.0
+    EVENT_SEND_TIMEOUT = 5.0
+    EVENT_BATCH_INTERVAL_MS = 0
+    EVENT_BATCH_MAX_EVENTS = 32
+    EVENT_COALESCE = False
     MEDIAPIPE_MIN_DETECTION_CONFIDENCE = 0.7
     MEDIAPIPE_MIN_TRACKING_CONFIDENCE = 0.5
     MEDIAPIPE_MIN_HAND_PRESENCE_CONFIDENCE = 0.7
     MEDIAPIPE_MAX_NUM_HANDS = 2
-    FRAME_PROCESSING_DELAY = 0.01
+    MEDIAPIPE_RUNNING_MODE = 'VIDEO'
+    TARGET_INFERENCE_FPS = 30.0
+    IDLE_INFERENCE_FPS = 5.0
+    IDLE_TIMEOUT_SECONDS = 10.0
+    MOTION_THRESHOLD = 0.01
+    MOTION_PIXEL_DELTA = 25
+    MOTION_REFRESH_INTERVAL = 2.0
+    ROI_EXPAND_FACTOR = 1.5
+    ROI_FULL_FRAME_INTERVAL = 15
+    ROI_MIN_SIZE = 96
+    LATENCY_WINDOW_SIZE = 1000
+    LATENCY_STATS_INTERVAL = 5.0
     GESTURE_DEBOUNCE_TIME = 1.0
 
+from frame_bus import SharedFrameBus
+from frame_capture import FrameGrabber, open_frame_source, parse_source, is_live_source
+from frame_scheduler import AdaptiveFrameScheduler
+from event_sender import EventSender
+from inference_pool import ProcessInferenceBackend
+from latency_stats import LatencyRecorder, write_latency_snapshot
+from motion_gate import MotionGate
+from recognizer_pool import RecognizerPool
+from roi_tracker import HandRoiTracker
+from transport import load_socket_config
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -57,6 +137,87 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Supported MediaPipe running modes (IMAGE disables cross-frame hand tracking)
+RUNNING_MODES = ('IMAGE', 'VIDEO', 'LIVE_STREAM')
+
+
+def default_source_id(source):
+    """
+    Get the identifier used in gesture events for a frame source
+
+    Args:
+        source: Camera index, video file path or image directory path
+
+    Returns:
+        'camera<index>' for cameras, the file or directory name otherwise
+    """
+    source = parse_source(source)
+    if is_live_source(source):
+        return f'camera{source}'
+    return os.path.basename(os.path.normpath(source))
+
+
+def unique_source_ids(sources):
+    """
+    Get distinct identifiers for several frame sources
+
+    Sources whose default ids collide (e.g. the same file name in two
+    directories) get their position in the list as a suffix, so they never
+    share a frame bus or events file.
+
+    Args:
+        sources: Camera indices, video file paths or image directory paths
+
+    Returns:
+        List of source ids, in the order of sources
+    """
+    ids = [default_source_id(source) for source in sources]
+    counts = Counter(ids)
+    taken = set(ids)
+
+    unique = []
+    for index, source_id in enumerate(ids):
+        if counts[source_id] > 1:
+            candidate = f'{source_id}_{index}'
+            while candidate in taken:
+                candidate += f'_{index}'
+            taken.add(candidate)
+            source_id = candidate
+        unique.append(source_id)
+
+    return unique
+
+
+def create_mediapipe_recognizer(model_path, running_mode='IMAGE', result_callback=None,
+                                num_hands=MEDIAPIPE_MAX_NUM_HANDS):
+    """
+    Create a MediaPipe tasks GestureRecognizer
+
+    Args:
+        model_path: Path to MediaPipe gesture recognizer model
+        running_mode: MediaPipe running mode ('IMAGE', 'VIDEO' or 'LIVE_STREAM')
+        result_callback: Result callback (required for LIVE_STREAM)
+        num_hands: Maximum number of hands to detect
+
+    Returns:
+        mp.tasks.vision.GestureRecognizer instance
+    """
+    base_options = mp.tasks.BaseOptions(model_asset_path=model_path)
+    options = mp.tasks.vision.GestureRecognizerOptions(
+        base_options=base_options,
+        running_mode=getattr(mp.tasks.vision.RunningMode, running_mode),
+        num_hands=num_hands,
+        min_hand_detection_confidence=MEDIAPIPE_MIN_DETECTION_CONFIDENCE,
+        min_hand_presence_confidence=MEDIAPIPE_MIN_HAND_PRESENCE_CONFIDENCE,
+        min_tracking_confidence=MEDIAPIPE_MIN_TRACKING_CONFIDENCE
+    )
+
+    # LIVE_STREAM delivers results asynchronously through a callback
+    if running_mode == 'LIVE_STREAM':
+        options.result_callback = result_callback
+
+    return mp.tasks.vision.GestureRecognizer.create_from_options(options)
+
 
 class GestureRecognizer:
     """Hand gesture recognition using MediaPipe"""
@@ -64,71 +225,266 @@ class GestureRecognizer:
     def __init__(self, model_path='gesture_recognizer.task',
                  camera_index=DEFAULT_CAMERA_INDEX,
                  socket_host=DEFAULT_SOCKET_HOST,
-                 socket_port=DEFAULT_SOCKET_PORT):
+                 socket_port=DEFAULT_SOCKET_PORT,
+                 running_mode=MEDIAPIPE_RUNNING_MODE,
+                 target_fps=TARGET_INFERENCE_FPS,
+                 idle_fps=IDLE_INFERENCE_FPS,
+                 idle_timeout=IDLE_TIMEOUT_SECONDS,
+                 motion_threshold=MOTION_THRESHOLD,
+                 motion_refresh_interval=MOTION_REFRESH_INTERVAL,
+                 roi_tracking=False,
+                 capture_size=(DEFAULT_CAMERA_WIDTH, DEFAULT_CAMERA_HEIGHT),
+                 inference_size=(INFERENCE_WIDTH, INFERENCE_HEIGHT),
+                 preview_size=(PREVIEW_WIDTH, PREVIEW_HEIGHT),
+                 frame_bus_name=FRAME_BUS_NAME,
+                 source_id=None,
+                 recognizer_pool=None,
+                 inference_workers=INFERENCE_WORKERS,
+                 inference_backend=None,
+                 replay=False,
+                 events_path=None,
+                 max_num_hands=MEDIAPIPE_MAX_NUM_HANDS,
+                 publish_latency=True,
+                 wire_protocol=WIRE_PROTOCOL,
+                 socket_path=None,
+                 batch_interval_ms=EVENT_BATCH_INTERVAL_MS,
+                 batch_max_events=EVENT_BATCH_MAX_EVENTS,
+                 coalesce_events=EVENT_COALESCE):
         """
         Initialize gesture recognizer
 
         Args:
             model_path: Path to MediaPipe gesture recognizer model
-            camera_index: Camera device index (0 for default webcam)
-            socket_host: Host for TCP socket connection
+            camera_index: Camera device index (0 for default webcam), video
+                file path or image directory path
+            socket_host: Host for TCP socket connection (None or '' disables
+                sending events)
             socket_port: Port for TCP socket connection
+            running_mode: MediaPipe running mode ('IMAGE', 'VIDEO' or 'LIVE_STREAM')
+            target_fps: Inference rate while hands are visible
+            idle_fps: Inference rate after idle_timeout seconds without a hand
+            idle_timeout: Seconds without a hand before backing off (0 disables)
+            motion_threshold: Fraction of changed pixels needed to run inference
+                on a frame while no hand is visible (0 disables motion gating)
+            motion_refresh_interval: Seconds after which a frame is processed
+                even without motion
+            roi_tracking: Crop recognition to the area around the last
+                detected hands (IMAGE mode only)
+            capture_size: (width, height) requested from the camera
+            inference_size: (width, height) of the image fed to MediaPipe
+            preview_size: (width, height) of the annotated MJPEG preview
+            frame_bus_name: Shared memory name to publish preview frames to
+                for the web server (None or '' disables publishing)
+            source_id: Identifier added to every gesture event
+                (defaults to 'camera<index>' or the file/directory name)
+            recognizer_pool: Shared RecognizerPool to borrow IMAGE-mode
+                recognizers from instead of loading a private model
+            inference_workers: Run recognition in this many worker processes
+                (0 runs it in this process)
+            inference_backend: Shared ProcessInferenceBackend to submit frames
+                to (takes precedence over inference_workers)
+            replay: Process every frame of an offline source as fast as
+                possible, with timestamps derived from the frame index
+            events_path: Append every emitted gesture event to this NDJSON file
+            max_num_hands: Maximum number of hands the private recognizer
+                detects (pooled recognizers use MEDIAPIPE_MAX_NUM_HANDS)
+            publish_latency: Write latency snapshots for the web server's
+                /health endpoint
+            wire_protocol: 'binary' offers compact binary event frames to the
+                controller (falls back to JSON if it declines), 'json' always
+                sends newline-delimited JSON
+            socket_path: Send events over this Unix domain socket instead of
+                TCP ('@name' for an abstract-namespace socket)
+            batch_interval_ms: Collect events for this long and send them in
+                one write (0 sends each event immediately)
+            batch_max_events: Events that flush a batch before the interval
+            coalesce_events: Send every recognized frame (no debounce) and
+                collapse a batch's consecutive same-gesture frames into one
+                event with frame count, confidence range and first/last
+                timestamps
         """
+        if running_mode not in RUNNING_MODES:
+            raise ValueError(f'Invalid running mode: {running_mode} (must be one of {RUNNING_MODES})')
+
+        # Replay must be deterministic: results have to arrive for the frame
+        # that produced them, and nothing may depend on wall-clock time
+        if replay:
+            if running_mode == 'LIVE_STREAM':
+                logger.warning('LIVE_STREAM is asynchronous, using VIDEO mode for replay')
+                running_mode = 'VIDEO'
+            motion_threshold = 0
+            idle_timeout = 0
+
         self.model_path = model_path
-        self.camera_index = camera_index
+        self.camera_index = parse_source(camera_index)
         self.socket_host = socket_host
         self.socket_port = socket_port
-
-        # MediaPipe setup
+        self.running_mode = running_mode
+        self.capture_size = tuple(capture_size)
+        self.inference_size = tuple(inference_size)
+        self.preview_size = tuple(preview_size)
+        self.replay = replay
+        self.events_path = events_path
+        self.max_num_hands = max_num_hands
+        self.publish_latency = publish_latency
+
+        self.source_id = source_id or default_source_id(self.camera_index)
+
+        # MediaPipe setup (drawing helpers only - detection is done by the
+        # tasks GestureRecognizer, which also returns hand landmarks)
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
 
-        # Initialize gesture recognizer
+        # Initialize gesture recognizer. Pooled recognizers carry no per-stream
+        # tracking state, so sharing them is only possible in IMAGE mode.
         self.recognizer = None
-        self.hands = None
+        self.recognizer_pool = None
+        if recognizer_pool is not None:
+            if running_mode == 'IMAGE':
+                self.recognizer_pool = recognizer_pool
+            else:
+                logger.warning(
+                    f'Shared recognizer pool requires IMAGE mode, '
+                    f'{self.source_id} loads its own model in {running_mode} mode'
+                )
 
-        # Video capture
-        self.cap = None
+        # Process-pool inference. Workers see frames out of order, so they run
+        # in IMAGE mode; results come back pipelined, in frame order.
+        self.inference_workers = inference_workers
+        self.inference_backend = inference_backend
+        self.owns_inference_backend = False
+        self.inference_stream = None
+        if (inference_backend is not None or inference_workers > 0) and running_mode != 'IMAGE':
+            logger.warning(f'Process-pool inference runs in IMAGE mode, ignoring {running_mode}')
 
-        # Socket connection
-        self.socket_conn = None
-        self.socket_connected = False
+        # Video capture (frames are read on the grabber's own thread)
+        self.cap = None
+        self.grabber = None
+
+        # Preallocated inference buffers (scaled BGR and its RGB conversion)
+        self.inference_frame = None
+        self.inference_rgb = None
+
+        # Socket connection (owned by the sender thread, which reconnects
+        # and negotiates the wire protocol on its own)
+        self.event_sender = None
+        self.socket_path = socket_path
+        self.wire_protocol = wire_protocol
+        self.batch_interval_ms = batch_interval_ms
+        self.batch_max_events = batch_max_events
+        self.coalesce_events = coalesce_events
+        if coalesce_events and batch_interval_ms <= 0:
+            logger.warning('Coalescing without a batch interval sends every frame as its own event')
+
+        # NDJSON event log (optional)
+        self.events_file = None
+
+        # Replay clock: frame index based timestamps
+        self.replay_fps = REPLAY_DEFAULT_FPS
+        self.replay_timestamp_ms = 0
+        self.replay_elapsed = 0.0
+
+        # Latency instrumentation. Stage durations of the frame being
+        # processed are collected in frame_timing; frames whose results arrive
+        # later (LIVE_STREAM, worker processes) park their capture time in
+        # pending_frames until then.
+        self.latency = LatencyRecorder(window_size=LATENCY_WINDOW_SIZE)
+        self.frame_capture_time = None
+        self.frame_timing = {}
+        self.pending_frames = {}
+        self.pending_lock = threading.Lock()
+        self.last_latency_snapshot = 0.0
 
         # State
         self.running = False
         self.frame_count = 0
         self.last_gesture = None
         self.last_gesture_time = 0
-
-        # MJPEG streaming
-        self.current_frame = None
+        self.last_timestamp_ms = 0
+        self.hand_present = False
+
+        # Frame pacing (full rate with hands in view, idle rate otherwise)
+        self.scheduler = AdaptiveFrameScheduler(
+            target_fps=target_fps,
+            idle_fps=idle_fps,
+            idle_timeout=idle_timeout
+        )
+
+        # Skip inference on static scenes
+        self.motion_gate = MotionGate(
+            threshold=motion_threshold,
+            refresh_interval=motion_refresh_interval,
+            pixel_delta=MOTION_PIXEL_DELTA
+        )
+
+        # Crop recognition around the last hands. VIDEO/LIVE_STREAM already
+        # track hands internally and expect an unchanging image geometry.
+        self.roi_tracker = None
+        if roi_tracking:
+            if running_mode == 'IMAGE':
+                self.roi_tracker = HandRoiTracker(
+                    expand_factor=ROI_EXPAND_FACTOR,
+                    full_frame_interval=ROI_FULL_FRAME_INTERVAL,
+                    min_size=ROI_MIN_SIZE
+                )
+            else:
+                logger.warning(f'ROI tracking requires IMAGE mode, disabled in {running_mode} mode')
+
+        # Latest recognizer result (written by the LIVE_STREAM callback thread)
+        # and the number of results handled so far, in every mode
+        self.latest_result = None
+        self.results_handled = 0
+        self.last_result_time = None
+        self.result_lock = threading.Lock()
+
+        # MJPEG streaming (in-process via get_current_frame, cross-process
+        # via the shared-memory frame bus). Preview frames are only produced
+        # while a consumer has asked for one recently.
+        self.preview_frame = None
+        self.preview_result = None
         self.frame_lock = threading.Lock()
+        self.last_preview_request = 0.0
+        self.frame_bus_name = frame_bus_name
+        self.frame_bus = None
 
     def initialize_mediapipe(self):
         """Initialize MediaPipe components"""
-        try:
-            # Initialize hands detector
-            self.hands = self.mp_hands.Hands(
-                static_image_mode=False,
-                max_num_hands=MEDIAPIPE_MAX_NUM_HANDS,
-                min_detection_confidence=MEDIAPIPE_MIN_DETECTION_CONFIDENCE,
-                min_tracking_confidence=MEDIAPIPE_MIN_TRACKING_CONFIDENCE
-            )
+        if self.inference_backend is None and self.inference_workers > 0:
+            try:
+                width, height = self.inference_size
+                self.inference_backend = ProcessInferenceBackend(
+                    self.model_path, self.inference_workers, (height, width, 3),
+                    task_timeout=INFERENCE_TASK_TIMEOUT,
+                    max_restarts=INFERENCE_WORKER_RESTARTS
+                )
+                self.inference_backend.start()
+                self.owns_inference_backend = True
+
+            except Exception as e:
+                logger.error(f'Failed to start inference workers: {e}')
+                self.inference_backend = None
+                return False
 
+        if self.inference_backend is not None:
+            self.inference_stream = self.inference_backend.open_stream()
+            logger.info(f'{self.source_id} using process-pool inference')
+            return True
+
+        if self.recognizer_pool is not None:
+            logger.info(f'{self.source_id} using shared recognizer pool')
+            return True
+
+        try:
             # Initialize gesture recognizer
-            base_options = mp.tasks.BaseOptions(model_asset_path=self.model_path)
-            options = mp.tasks.vision.GestureRecognizerOptions(
-                base_options=base_options,
-                running_mode=mp.tasks.vision.RunningMode.IMAGE,
-                num_hands=MEDIAPIPE_MAX_NUM_HANDS,
-                min_hand_detection_confidence=MEDIAPIPE_MIN_DETECTION_CONFIDENCE,
-                min_hand_presence_confidence=MEDIAPIPE_MIN_HAND_PRESENCE_CONFIDENCE,
-                min_tracking_confidence=MEDIAPIPE_MIN_TRACKING_CONFIDENCE
+            self.recognizer = create_mediapipe_recognizer(
+                self.model_path,
+                running_mode=self.running_mode,
+                result_callback=self._on_live_stream_result,
+                num_hands=self.max_num_hands
             )
-            self.recognizer = mp.tasks.vision.GestureRecognizer.create_from_options(options)
 
-            logger.info('MediaPipe initialized successfully')
+            logger.info(f'MediaPipe initialized successfully ({self.running_mode} mode)')
             return True
 
         except Exception as e:
@@ -136,147 +492,672 @@ class GestureRecognizer:
             return False
 
     def initialize_camera(self):
-        """Initialize video capture"""
+        """Initialize video capture (camera, video file or image directory)"""
         try:
-            self.cap = cv2.VideoCapture(self.camera_index)
+            self.cap = open_frame_source(self.camera_index, fps=REPLAY_DEFAULT_FPS)
 
             if not self.cap.isOpened():
-                logger.error(f'Failed to open camera {self.camera_index}')
+                logger.error(f'Failed to open source {self.camera_index}')
                 return False
 
-            # Set camera properties
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, DEFAULT_CAMERA_WIDTH)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, DEFAULT_CAMERA_HEIGHT)
-            self.cap.set(cv2.CAP_PROP_FPS, DEFAULT_CAMERA_FPS)
+            if is_live_source(self.camera_index):
+                # Set camera properties
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.capture_size[0])
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.capture_size[1])
+                self.cap.set(cv2.CAP_PROP_FPS, DEFAULT_CAMERA_FPS)
+
+                # Keep the driver queue short; the grabber thread drains it anyway
+                self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            else:
+                fps = self.cap.get(cv2.CAP_PROP_FPS)
+                self.replay_fps = fps if fps and fps > 0 else REPLAY_DEFAULT_FPS
+
+            # Replay reads every frame itself; live capture keeps only the newest
+            if not self.replay:
+                self.grabber = FrameGrabber(
+                    self.cap,
+                    name=f'source {self.camera_index}',
+                    stop_at_end=not is_live_source(self.camera_index)
+                )
 
-            logger.info(f'Camera {self.camera_index} initialized successfully')
+            logger.info(f'Source {self.camera_index} initialized successfully')
             return True
 
         except Exception as e:
             logger.error(f'Failed to initialize camera: {e}')
             return False
 
-    def connect_socket(self):
-        """Connect to TCP socket for sending gesture events"""
+    def initialize_frame_bus(self):
+        """Create the shared-memory frame bus for the preview stream"""
+        if not self.frame_bus_name:
+            return False
+
+        try:
+            width, height = self.preview_size
+            self.frame_bus = SharedFrameBus.create(
+                self.frame_bus_name, width, height, slot_count=FRAME_BUS_SLOTS
+            )
+            return True
+
+        except Exception as e:
+            logger.warning(f'Failed to create frame bus: {e}')
+            self.frame_bus = None
+            return False
+
+    def open_events_log(self):
+        """Open the NDJSON file that every emitted gesture event is appended to"""
+        if not self.events_path:
+            return False
+
         try:
-            self.socket_conn = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket_conn.connect((self.socket_host, self.socket_port))
-            self.socket_connected = True
-            logger.info(f'Connected to socket {self.socket_host}:{self.socket_port}')
+            directory = os.path.dirname(self.events_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.events_file = open(self.events_path, 'a', encoding='utf-8')
+            logger.info(f'Writing gesture events to {self.events_path}')
             return True
 
         except Exception as e:
-            logger.warning(f'Failed to connect to socket: {e}')
-            self.socket_connected = False
+            logger.warning(f'Failed to open events file: {e}')
+            self.events_file = None
             return False
 
+    def connect_socket(self):
+        """
+        Start the background sender for the TCP or Unix socket
+
+        The controller does not have to be up yet: the sender keeps
+        reconnecting with exponential backoff and queues events meanwhile.
+        """
+        if not self.socket_host and not self.socket_path:
+            return False
+
+        self.event_sender = EventSender(
+            host=self.socket_host,
+            port=self.socket_port,
+            socket_path=self.socket_path,
+            wire_protocol=self.wire_protocol,
+            sources=[self.source_id],
+            queue_size=EVENT_QUEUE_SIZE,
+            reconnect_initial_delay=RECONNECT_INITIAL_DELAY,
+            reconnect_max_delay=RECONNECT_MAX_DELAY,
+            hello_timeout=WIRE_HELLO_TIMEOUT,
+            send_timeout=EVENT_SEND_TIMEOUT,
+            batch_interval=self.batch_interval_ms / 1000,
+            batch_max_events=self.batch_max_events,
+            coalesce=self.coalesce_events,
+            latency=self.latency
+        )
+        self.event_sender.start()
+        return True
+
     def send_gesture_event(self, gesture_data):
         """
-        Send gesture event through socket
+        Send gesture event through socket (queued; never blocks on the network)
 
         Args:
             gesture_data: Dictionary containing gesture information
         """
-        if not self.socket_connected:
-            return
+        if self.events_file is not None:
+            self.events_file.write(json.dumps(gesture_data) + '\n')
+
+        if self.event_sender is not None:
+            self.event_sender.send(gesture_data)
+
+    def _draw_hand_landmarks(self, image, hand_landmarks):
+        """
+        Draw one hand's landmarks and connections onto an image
+
+        Args:
+            image: OpenCV frame (BGR format) to draw on
+            hand_landmarks: List of normalized landmarks from the recognizer
+        """
+        landmark_list = landmark_pb2.NormalizedLandmarkList()
+        landmark_list.landmark.extend([
+            landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z)
+            for lm in hand_landmarks
+        ])
+
+        self.mp_drawing.draw_landmarks(
+            image,
+            landmark_list,
+            self.mp_hands.HAND_CONNECTIONS,
+            self.mp_drawing_styles.get_default_hand_landmarks_style(),
+            self.mp_drawing_styles.get_default_hand_connections_style()
+        )
+
+    def _next_timestamp_ms(self):
+        """
+        Get a monotonic, strictly increasing timestamp for the recognizer
+
+        In replay mode this is the timestamp of the current frame index.
+
+        Returns:
+            Timestamp in milliseconds
+        """
+        if self.replay:
+            self.last_timestamp_ms = self.replay_timestamp_ms
+            return self.replay_timestamp_ms
+
+        timestamp_ms = max(int(time.monotonic() * 1000), self.last_timestamp_ms + 1)
+        self.last_timestamp_ms = timestamp_ms
+        return timestamp_ms
 
+    @contextmanager
+    def _timed(self, stage):
+        """
+        Add the duration of a with-block to the current frame's stage timing
+
+        Args:
+            stage: Stage name (e.g. 'convert')
+        """
+        start = time.perf_counter()
         try:
-            # Convert to JSON and send
-            message = json.dumps(gesture_data) + '\n'
-            self.socket_conn.sendall(message.encode('utf-8'))
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.frame_timing[stage] = self.frame_timing.get(stage, 0.0) + elapsed_ms
+
+    def _begin_frame_timing(self, capture_time, read_ms):
+        """
+        Start collecting stage durations for a new frame
+
+        Args:
+            capture_time: time.monotonic() when the frame was captured
+            read_ms: Time spent getting the frame to the processing loop
+        """
+        self.frame_capture_time = capture_time
+        self.frame_timing = {'read': read_ms}
+
+    def _finish_frame_timing(self):
+        """Record the current frame's stage durations and its total time"""
+        for stage, duration_ms in self.frame_timing.items():
+            self.latency.record(stage, duration_ms)
+
+        if self.frame_capture_time is not None:
+            self.latency.record('frame', (time.monotonic() - self.frame_capture_time) * 1000)
+
+        now = time.monotonic()
+        if now - self.last_latency_snapshot >= LATENCY_STATS_INTERVAL:
+            self.last_latency_snapshot = now
+            self._publish_latency()
+
+    def _publish_latency(self):
+        """Write the latency summary for the web server (if enabled)"""
+        if self.publish_latency:
+            write_latency_snapshot(f'gesture_stream_{self.source_id}', self.latency.get_statistics())
+
+    def _park_frame(self, key):
+        """
+        Keep the current frame's capture time until its asynchronous result arrives
 
+        Args:
+            key: Recognizer timestamp (LIVE_STREAM) or worker sequence number
+        """
+        with self.pending_lock:
+            self.pending_frames[key] = {
+                'timestamp_ms': self.replay_timestamp_ms if self.replay else None,
+                'capture_time': self.frame_capture_time,
+                'submitted': time.perf_counter()
+            }
+
+    def _unpark_frame(self, key):
+        """
+        Get a parked frame and record its inference latency
+
+        Frames parked before this one never produced a result (skipped by
+        MediaPipe or dropped by the workers) and are discarded.
+
+        Args:
+            key: Key passed to _park_frame()
+
+        Returns:
+            Parked frame dictionary, or None if the frame is unknown
+        """
+        with self.pending_lock:
+            for stale in [k for k in self.pending_frames if k < key]:
+                del self.pending_frames[stale]
+            frame = self.pending_frames.pop(key, None)
+
+        if frame is not None:
+            self.latency.record('inference', (time.perf_counter() - frame['submitted']) * 1000)
+
+        return frame
+
+    def _on_live_stream_result(self, result, output_image, timestamp_ms):
+        """
+        Result callback for LIVE_STREAM mode (runs on a MediaPipe thread)
+
+        Args:
+            result: GestureRecognizerResult
+            output_image: Image the result was computed for
+            timestamp_ms: Timestamp passed to recognize_async
+        """
+        try:
+            frame = self._unpark_frame(timestamp_ms) or {}
+            self.handle_gesture_result(
+                result,
+                capture_time=frame.get('capture_time')
+            )
         except Exception as e:
-            logger.error(f'Failed to send gesture event: {e}')
-            self.socket_connected = False
+            logger.error(f'Error handling gesture result: {e}')
+
+    def handle_gesture_result(self, gesture_results, timestamp_ms=None, capture_time=None):
+        """
+        Store a recognizer result and emit gesture events for it
+
+        Args:
+            gesture_results: GestureRecognizerResult from MediaPipe
+            timestamp_ms: Event timestamp (defaults to the wall clock, or the
+                current frame's timestamp in replay mode)
+            capture_time: time.monotonic() capture time of the frame (defaults
+                to the frame being processed)
+        """
+        if timestamp_ms is None:
+            timestamp_ms = self.replay_timestamp_ms if self.replay else int(time.time() * 1000)
+        if capture_time is None:
+            capture_time = self.frame_capture_time
+
+        with self.result_lock:
+            self.latest_result = gesture_results
+            self.results_handled += 1
+            self.last_result_time = time.perf_counter()
+
+        self.hand_present = bool(gesture_results.hand_landmarks)
+
+        for i, gesture_list in enumerate(gesture_results.gestures):
+            if not gesture_list:
+                continue
+
+            # Get top gesture
+            gesture = gesture_list[0]
+            gesture_name = gesture.category_name
+            confidence = gesture.score
+
+            # Get handedness (Left or Right)
+            handedness = "Unknown"
+            if i < len(gesture_results.handedness):
+                handedness = gesture_results.handedness[i][0].category_name
+
+            # Create gesture event
+            gesture_data = {
+                'timestamp': timestamp_ms,
+                'source': self.source_id,
+                'hand': handedness,
+                'gesture': gesture_name,
+                'confidence': float(confidence)
+            }
+
+            # Monotonic capture time (same clock in every process on this
+            # host) so the controller can measure the rest of the path
+            if capture_time is not None:
+                gesture_data['capture_time'] = capture_time
+
+            # Send gesture event. When coalescing, every frame goes to the
+            # sender, which collapses a batch's consecutive same-gesture frames
+            # into one event; otherwise debounce on the event clock (so
+            # replays debounce the same way every run)
+            current_time = timestamp_ms / 1000
+            gesture_key = f"{handedness}_{gesture_name}"
+
+            if (self.coalesce_events or self.last_gesture != gesture_key or
+                current_time - self.last_gesture_time > GESTURE_DEBOUNCE_TIME):
+
+                self.send_gesture_event(gesture_data)
+                self.last_gesture = gesture_key
+                self.last_gesture_time = current_time
+
+                logger.debug(f'Gesture: {gesture_name} ({handedness}) - {confidence:.2f}')
+
+    def annotate_frame(self, frame, gesture_results):
+        """
+        Draw landmarks and gesture labels for a recognizer result
+
+        Args:
+            frame: OpenCV frame (BGR format), drawn on in place
+            gesture_results: GestureRecognizerResult or None
+        """
+        if gesture_results is None:
+            return
+
+        # Draw hand landmarks
+        for hand_landmarks in gesture_results.hand_landmarks:
+            self._draw_hand_landmarks(frame, hand_landmarks)
+
+        # Draw gesture text on frame
+        for i, gesture_list in enumerate(gesture_results.gestures):
+            if not gesture_list:
+                continue
+
+            handedness = "Unknown"
+            if i < len(gesture_results.handedness):
+                handedness = gesture_results.handedness[i][0].category_name
+
+            text = f'{handedness}: {gesture_list[0].category_name} ({gesture_list[0].score:.2f})'
+            cv2.putText(frame, text,
+                       (10, 30 + i * 30),
+                       cv2.FONT_HERSHEY_SIMPLEX,
+                       0.7, (0, 255, 0), 2)
 
     def process_frame(self, frame):
         """
         Process a single frame for gesture recognition
 
+        A single recognizer pass provides both the gesture classification and
+        the hand landmarks used for the overlay. In LIVE_STREAM mode the frame
+        is submitted asynchronously and the most recent result delivered by
+        the callback is returned. Frames without motion (and without a hand
+        in view) skip recognition and keep the previous result.
+
+        Recognition runs on a copy scaled to the inference resolution. No
+        drawing happens here; the overlay is rendered from the stored result
+        only for preview consumers (see render_preview). Landmarks are
+        normalized, so they apply at any resolution.
+
+        Args:
+            frame: OpenCV frame (BGR format) at capture resolution
+
+        Returns:
+            Most recent GestureRecognizerResult (None before the first result)
+        """
+        with self._timed('resize'):
+            inference_frame = self._scale_for_inference(frame)
+
+        if self.motion_gate.should_process(inference_frame, self.hand_present):
+            self._recognize(inference_frame)
+
+        with self.result_lock:
+            return self.latest_result
+
+    def render_preview(self, frame, gesture_results, out=None):
+        """
+        Scale a frame to the preview resolution and draw the overlay on it
+
+        Args:
+            frame: OpenCV frame (BGR format) at capture resolution
+            gesture_results: GestureRecognizerResult to draw (or None)
+            out: Preallocated preview-size buffer to render into (optional)
+
+        Returns:
+            Annotated frame at preview resolution
+        """
+        if (frame.shape[1], frame.shape[0]) == self.preview_size:
+            if out is None:
+                out = frame.copy()
+            else:
+                np.copyto(out, frame)
+        else:
+            out = cv2.resize(frame, self.preview_size, dst=out, interpolation=cv2.INTER_AREA)
+
+        self.annotate_frame(out, gesture_results)
+        return out
+
+    def _update_preview(self, frame, gesture_results):
+        """
+        Hand the current frame to preview consumers, if there are any
+
+        The frame bus slot is rendered in place in shared memory; in-process
+        consumers get an unannotated snapshot that get_current_frame() draws
+        on when it is requested.
+
+        Args:
+            frame: OpenCV frame (BGR format) at capture resolution
+            gesture_results: GestureRecognizerResult for the frame
+        """
+        if self.frame_bus is not None and self.frame_bus.has_active_reader(PREVIEW_CONSUMER_TIMEOUT):
+            seq, slot = self.frame_bus.begin_write()
+            with self.latency.measure('annotate'):
+                self.render_preview(frame, gesture_results, out=slot)
+            self.frame_bus.commit(seq)
+
+        if time.monotonic() - self.last_preview_request < PREVIEW_CONSUMER_TIMEOUT:
+            if (frame.shape[1], frame.shape[0]) == self.preview_size:
+                snapshot = frame.copy()
+            else:
+                snapshot = cv2.resize(frame, self.preview_size, interpolation=cv2.INTER_AREA)
+
+            with self.frame_lock:
+                self.preview_frame = snapshot
+                self.preview_result = gesture_results
+
+    def _scale_for_inference(self, frame):
+        """
+        Scale a frame to the inference resolution
+
+        The result is written into a buffer that is allocated once and reused
+        for every frame.
+
+        Args:
+            frame: OpenCV frame (BGR format) at capture resolution
+
+        Returns:
+            Frame at inference resolution (the input itself if already that size)
+        """
+        width, height = self.inference_size
+
+        if frame.shape[1] == width and frame.shape[0] == height:
+            return frame
+
+        if self.inference_frame is None or self.inference_frame.shape != (height, width, 3):
+            self.inference_frame = np.empty((height, width, 3), dtype=np.uint8)
+
+        cv2.resize(frame, self.inference_size, dst=self.inference_frame,
+                   interpolation=cv2.INTER_AREA)
+        return self.inference_frame
+
+    def _to_rgb(self, frame):
+        """
+        Convert a BGR frame to RGB, reusing a preallocated buffer when possible
+
         Args:
             frame: OpenCV frame (BGR format)
 
         Returns:
-            Processed frame with annotations
+            RGB frame
         """
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if not frame.flags['C_CONTIGUOUS']:
+            # ROI crops are views; convert into a fresh array of the crop size
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
-        # Detect hands
-        hands_results = self.hands.process(rgb_frame)
+        if self.inference_rgb is None or self.inference_rgb.shape != frame.shape:
+            self.inference_rgb = np.empty_like(frame)
 
-        # Draw hand landmarks
-        annotated_frame = frame.copy()
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.inference_rgb)
+        return self.inference_rgb
 
-        if hands_results.multi_hand_landmarks:
-            for hand_landmarks in hands_results.multi_hand_landmarks:
-                self.mp_drawing.draw_landmarks(
-                    annotated_frame,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                    self.mp_drawing_styles.get_default_hand_connections_style()
-                )
+    @contextmanager
+    def _checkout_recognizer(self):
+        """
+        Get exclusive use of a recognizer (the private one or a pooled one)
+
+        Yields:
+            MediaPipe GestureRecognizer instance
+        """
+        if self.recognizer_pool is None:
+            yield self.recognizer
+            return
+
+        with self.recognizer_pool.acquire() as recognizer:
+            yield recognizer
+
+    def _recognize(self, frame):
+        """
+        Run the recognizer on a frame according to the running mode
+
+        With ROI tracking enabled only the region around the last hands is
+        recognized; landmarks are mapped back to full-frame coordinates
+        before any event is emitted or anything is drawn.
+
+        Args:
+            frame: OpenCV frame (BGR format) at inference resolution
+        """
+        if self.inference_stream is not None:
+            self._recognize_in_workers(frame)
+            return
+
+        roi = self.roi_tracker.get_roi() if self.roi_tracker else None
+
+        if roi is not None:
+            x0, y0, x1, y1 = roi
+            source = frame[y0:y1, x0:x1]
+        else:
+            source = frame
+
+        # Convert BGR to RGB (mp.Image copies the pixel data)
+        with self._timed('convert'):
+            rgb_frame = self._to_rgb(source)
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
 
         # Recognize gestures
         try:
-            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
-            gesture_results = self.recognizer.recognize(mp_image)
-
-            if gesture_results.gestures:
-                for i, gesture_list in enumerate(gesture_results.gestures):
-                    if not gesture_list:
-                        continue
-
-                    # Get top gesture
-                    gesture = gesture_list[0]
-                    gesture_name = gesture.category_name
-                    confidence = gesture.score
-
-                    # Get handedness (Left or Right)
-                    handedness = "Unknown"
-                    if i < len(gesture_results.handedness):
-                        handedness = gesture_results.handedness[i][0].category_name
-
-                    # Create gesture event
-                    gesture_data = {
-                        'timestamp': int(time.time() * 1000),
-                        'hand': handedness,
-                        'gesture': gesture_name,
-                        'confidence': float(confidence)
-                    }
-
-                    # Send gesture event (with debouncing)
-                    current_time = time.time()
-                    gesture_key = f"{handedness}_{gesture_name}"
-
-                    if (self.last_gesture != gesture_key or
-                        current_time - self.last_gesture_time > GESTURE_DEBOUNCE_TIME):
-
-                        self.send_gesture_event(gesture_data)
-                        self.last_gesture = gesture_key
-                        self.last_gesture_time = current_time
-
-                        logger.debug(f'Gesture: {gesture_name} ({handedness}) - {confidence:.2f}')
-
-                    # Draw gesture text on frame
-                    text = f'{handedness}: {gesture_name} ({confidence:.2f})'
-                    cv2.putText(annotated_frame, text,
-                               (10, 30 + i * 30),
-                               cv2.FONT_HERSHEY_SIMPLEX,
-                               0.7, (0, 255, 0), 2)
+            if self.running_mode == 'LIVE_STREAM':
+                timestamp_ms = self._next_timestamp_ms()
+                self._park_frame(timestamp_ms)
+                self.recognizer.recognize_async(mp_image, timestamp_ms)
+            elif self.running_mode == 'VIDEO':
+                with self._timed('inference'):
+                    gesture_results = self.recognizer.recognize_for_video(
+                        mp_image, self._next_timestamp_ms()
+                    )
+                self.handle_gesture_result(gesture_results)
+            else:
+                with self._timed('inference'):
+                    with self._checkout_recognizer() as recognizer:
+                        gesture_results = recognizer.recognize(mp_image)
+
+                if self.roi_tracker:
+                    self.roi_tracker.update(gesture_results, roi, frame.shape)
+
+                self.handle_gesture_result(gesture_results)
 
         except Exception as e:
             logger.error(f'Error recognizing gesture: {e}')
 
-        return annotated_frame
+    def _recognize_in_workers(self, frame):
+        """
+        Submit a frame to the worker processes and handle finished results
+
+        Results arrive a few frames later, in the order frames were submitted.
+        Replay waits for a free slot instead of dropping the frame.
+
+        Args:
+            frame: OpenCV frame (BGR format) at inference resolution
+        """
+        try:
+            with self._timed('convert'):
+                rgb_frame = self._to_rgb(frame)
+
+            # Park before submitting so a fast worker cannot beat us to it
+            seq = self.inference_stream.next_seq
+            self._park_frame(seq)
+            self.inference_stream.submit(rgb_frame, timeout=None if self.replay else 1.0)
+
+            self._handle_worker_results()
+
+        except Exception as e:
+            logger.error(f'Error recognizing gesture: {e}')
+
+    def _handle_worker_results(self):
+        """Handle the worker results that are ready, in frame order"""
+        for seq, gesture_results in self.inference_stream.collect():
+            frame = self._unpark_frame(seq) or {}
+            self.handle_gesture_result(
+                gesture_results,
+                timestamp_ms=frame.get('timestamp_ms'),
+                capture_time=frame.get('capture_time')
+            )
+
+    def _drain_inference(self, timeout=10.0):
+        """
+        Wait for frames still in the worker processes and handle their results
+
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        if self.inference_stream is None:
+            return
+
+        deadline = time.monotonic() + timeout
+        while self.inference_stream.in_flight() > 0 and time.monotonic() < deadline:
+            time.sleep(0.005)
+            self._handle_worker_results()
+
+        self._handle_worker_results()
 
     def get_current_frame(self):
-        """Get the current frame for MJPEG streaming"""
+        """
+        Get the current annotated frame for MJPEG streaming
+
+        Calling this also registers the caller as a preview consumer, so the
+        recognizer keeps producing preview snapshots while it is polled.
+
+        Returns:
+            Annotated frame at preview resolution, or None if not available yet
+        """
+        self.last_preview_request = time.monotonic()
+
         with self.frame_lock:
-            if self.current_frame is not None:
-                return self.current_frame.copy()
-        return None
+            frame = self.preview_frame
+            gesture_results = self.preview_result
+
+        if frame is None:
+            return None
+
+        annotated_frame = frame.copy()
+        self.annotate_frame(annotated_frame, gesture_results)
+        return annotated_frame
+
+    def get_capture_statistics(self):
+        """
+        Get capture thread statistics (captured, delivered and dropped frames)
+
+        Returns:
+            Statistics dictionary
+        """
+        if self.grabber is None:
+            return {}
+        return self.grabber.get_statistics()
+
+    def get_motion_statistics(self):
+        """
+        Get motion gating statistics (frames checked and skipped)
+
+        Returns:
+            Statistics dictionary
+        """
+        return self.motion_gate.get_statistics()
+
+    def get_latency_statistics(self):
+        """
+        Get rolling per-stage latency percentiles (read, resize, convert,
+        inference, annotate, send and the whole frame), in milliseconds
+
+        Returns:
+            Statistics dictionary
+        """
+        return self.latency.get_statistics()
+
+    def get_sender_statistics(self):
+        """
+        Get event sender statistics (queue depth, drops, reconnects)
+
+        Returns:
+            Statistics dictionary, or None if no socket is configured
+        """
+        if self.event_sender is None:
+            return None
+        return self.event_sender.get_statistics()
+
+    def get_roi_statistics(self):
+        """
+        Get ROI tracking statistics (cropped vs. full-frame passes)
+
+        Returns:
+            Statistics dictionary
+        """
+        if self.roi_tracker is None:
+            return {}
+        return self.roi_tracker.get_statistics()
 
     def run(self):
         """Main loop for gesture recognition"""
@@ -291,34 +1172,58 @@ class GestureRecognizer:
             logger.error('Failed to initialize camera')
             return
 
-        # Try to connect to socket (optional)
+        # Preview stream for the web server (optional)
+        self.initialize_frame_bus()
+
+        # Event log and socket (both optional)
+        self.open_events_log()
         self.connect_socket()
 
         self.running = True
+
+        if self.replay:
+            try:
+                self._run_replay()
+            except KeyboardInterrupt:
+                logger.info('Stopping replay (keyboard interrupt)')
+            except Exception as e:
+                logger.error(f'Error in replay loop: {e}')
+            finally:
+                self.cleanup()
+            return
+
+        self.grabber.start()
         logger.info('Gesture recognition running')
 
         try:
             while self.running:
-                # Read frame
-                ret, frame = self.cap.read()
-
-                if not ret:
-                    logger.warning('Failed to read frame from camera')
-                    time.sleep(0.1)
+                # Take the newest frame; older unprocessed frames are dropped
+                latest = self.grabber.read_latest(timeout=1.0)
+
+                if latest is None:
+                    if self.grabber.ended:
+                        logger.info(f'Source {self.camera_index} ended')
+                        break
+                    logger.warning('No new frame from camera')
                     continue
 
+                _, frame, capture_time = latest
+                self._begin_frame_timing(capture_time, (time.monotonic() - capture_time) * 1000)
+
                 # Process frame
-                annotated_frame = self.process_frame(frame)
+                self.scheduler.start_frame()
+                gesture_results = self.process_frame(frame)
 
-                # Store frame for MJPEG streaming
-                with self.frame_lock:
-                    self.current_frame = annotated_frame
+                # Preview for MJPEG streaming (skipped when nobody watches)
+                self._update_preview(frame, gesture_results)
 
                 # Update frame count
                 self.frame_count += 1
+                self._finish_frame_timing()
 
-                # Small delay to prevent CPU overload
-                time.sleep(FRAME_PROCESSING_DELAY)
+                # Sleep only for what is left of the frame budget
+                self.scheduler.update(self.hand_present)
+                self.scheduler.wait()
 
         except KeyboardInterrupt:
             logger.info('Stopping gesture recognition (keyboard interrupt)')
@@ -329,6 +1234,44 @@ class GestureRecognizer:
         finally:
             self.cleanup()
 
+    def _run_replay(self):
+        """
+        Process every frame of an offline source without real-time pacing
+
+        Frame i is stamped int(i * 1000 / fps), so recognition, debouncing
+        and the emitted events are the same on every run.
+        """
+        logger.info(f'Replaying {self.camera_index} at {self.replay_fps:g} FPS timestamps')
+
+        frame = None
+        start_time = time.monotonic()
+
+        while self.running:
+            read_start = time.monotonic()
+            ret, frame = self.cap.read() if frame is None else self.cap.read(frame)
+            if not ret:
+                break
+
+            capture_time = time.monotonic()
+            self._begin_frame_timing(capture_time, (capture_time - read_start) * 1000)
+            self.replay_timestamp_ms = int(self.frame_count * 1000 / self.replay_fps)
+
+            gesture_results = self.process_frame(frame)
+            self._update_preview(frame, gesture_results)
+
+            self.frame_count += 1
+            self._finish_frame_timing()
+
+        self._drain_inference()
+        self._publish_latency()
+
+        elapsed = time.monotonic() - start_time
+        self.replay_elapsed = elapsed
+        logger.info(
+            f'Replay finished: {self.frame_count} frames in {elapsed:.2f}s '
+            f'({self.frame_count / elapsed if elapsed > 0 else 0.0:.1f} FPS)'
+        )
+
     def stop(self):
         """Stop gesture recognition"""
         logger.info('Stopping gesture recognition...')
@@ -338,6 +1281,13 @@ class GestureRecognizer:
         """Clean up resources safely"""
         logger.info('Cleaning up resources...')
 
+        # Stop capture thread before releasing the camera it reads from
+        if self.grabber is not None:
+            try:
+                self.grabber.stop()
+            except Exception as e:
+                logger.error(f'Error stopping capture thread: {e}')
+
         # Safely release camera
         if self.cap is not None:
             try:
@@ -347,12 +1297,11 @@ class GestureRecognizer:
                 logger.error(f'Error releasing camera: {e}')
 
         # Safely close MediaPipe components
-        if self.hands is not None:
+        if self.owns_inference_backend and self.inference_backend is not None:
             try:
-                self.hands.close()
-                logger.info('MediaPipe hands closed')
+                self.inference_backend.close()
             except Exception as e:
-                logger.error(f'Error closing hands: {e}')
+                logger.error(f'Error stopping inference workers: {e}')
 
         if self.recognizer is not None:
             try:
@@ -361,17 +1310,186 @@ class GestureRecognizer:
             except Exception as e:
                 logger.error(f'Error closing recognizer: {e}')
 
-        # Safely close socket
-        if self.socket_conn is not None:
+        # Safely remove frame bus
+        if self.frame_bus is not None:
+            self.frame_bus.close()
+            self.frame_bus = None
+
+        # Safely close event log
+        if self.events_file is not None:
             try:
-                self.socket_conn.close()
-                logger.info('Socket connection closed')
+                self.events_file.close()
             except Exception as e:
-                logger.error(f'Error closing socket: {e}')
+                logger.error(f'Error closing events file: {e}')
+            self.events_file = None
+
+        # Flush queued events and close the socket
+        if self.event_sender is not None:
+            try:
+                self.event_sender.stop()
+            except Exception as e:
+                logger.error(f'Error stopping event sender: {e}')
+            self.event_sender = None
 
         logger.info('Cleanup complete')
 
 
+class MultiCameraGestureStream:
+    """Runs several camera sources in one process with a shared recognizer pool"""
+
+    def __init__(self, camera_indices, model_path='gesture_recognizer.task',
+                 pool_size=RECOGNIZER_POOL_SIZE,
+                 running_mode=MEDIAPIPE_RUNNING_MODE,
+                 frame_bus_name=FRAME_BUS_NAME,
+                 inference_workers=INFERENCE_WORKERS,
+                 **recognizer_kwargs):
+        """
+        Initialize multi-camera stream
+
+        Args:
+            camera_indices: List of camera indices, video files or image directories
+            model_path: Path to MediaPipe gesture recognizer model
+            pool_size: Maximum number of recognizer instances shared by all
+                cameras (IMAGE mode only)
+            running_mode: MediaPipe running mode for all sources
+            frame_bus_name: Shared memory name; the first source publishes to
+                it (so the web preview shows it) and every further source to
+                '<name>_<source_id>' (None or '' disables publishing)
+            inference_workers: Worker processes shared by all cameras
+                (0 uses the in-process recognizer pool instead)
+            **recognizer_kwargs: Further GestureRecognizer arguments
+        """
+        self.camera_indices = list(camera_indices)
+        self.model_path = model_path
+        self.pool_size = max(1, min(pool_size, len(self.camera_indices)))
+        self.running_mode = running_mode
+        self.frame_bus_name = frame_bus_name
+        self.inference_workers = inference_workers
+        self.recognizer_kwargs = recognizer_kwargs
+
+        self.pool = None
+        self.inference_backend = None
+        self.sources = []
+        self.threads = []
+        self.running = False
+
+    def run(self):
+        """Start all sources and block until they stop"""
+        logger.info(f'Starting gesture recognition for cameras: {self.camera_indices}')
+
+        if self.inference_workers > 0:
+            try:
+                width, height = self.recognizer_kwargs.get(
+                    'inference_size', (INFERENCE_WIDTH, INFERENCE_HEIGHT)
+                )
+                self.inference_backend = ProcessInferenceBackend(
+                    self.model_path, self.inference_workers, (height, width, 3),
+                    task_timeout=INFERENCE_TASK_TIMEOUT,
+                    max_restarts=INFERENCE_WORKER_RESTARTS
+                )
+                self.inference_backend.start()
+            except Exception as e:
+                logger.error(f'Failed to start inference workers: {e}')
+                return
+        elif self.running_mode == 'IMAGE':
+            try:
+                self.pool = RecognizerPool(
+                    lambda: create_mediapipe_recognizer(self.model_path),
+                    self.pool_size
+                )
+            except Exception as e:
+                logger.error(f'Failed to create recognizer pool: {e}')
+                return
+        else:
+            logger.warning(f'{self.running_mode} mode keeps per-camera tracking state, so each of '
+                           f'the {len(self.camera_indices)} cameras loads its own model; use '
+                           '--running-mode IMAGE or --inference-workers to share one')
+
+        recognizer_kwargs = dict(self.recognizer_kwargs)
+        events_path = recognizer_kwargs.pop('events_path', None)
+
+        source_ids = unique_source_ids(self.camera_indices)
+        for position, (camera_index, source_id) in enumerate(zip(self.camera_indices, source_ids)):
+            bus_name = None
+            if self.frame_bus_name:
+                bus_name = self.frame_bus_name if position == 0 else f'{self.frame_bus_name}_{source_id}'
+
+            # One event file per source keeps each file in frame order
+            source_events_path = None
+            if events_path:
+                stem, ext = os.path.splitext(events_path)
+                source_events_path = f'{stem}_{source_id}{ext}'
+
+            self.sources.append(GestureRecognizer(
+                model_path=self.model_path,
+                camera_index=camera_index,
+                running_mode=self.running_mode,
+                frame_bus_name=bus_name,
+                source_id=source_id,
+                recognizer_pool=self.pool,
+                inference_backend=self.inference_backend,
+                events_path=source_events_path,
+                **recognizer_kwargs
+            ))
+
+        self.running = True
+        for source in self.sources:
+            thread = threading.Thread(
+                target=source.run,
+                name=f'recognizer-{source.source_id}',
+                daemon=True
+            )
+            thread.start()
+            self.threads.append(thread)
+
+        try:
+            while self.running and any(thread.is_alive() for thread in self.threads):
+                time.sleep(0.5)
+
+        except KeyboardInterrupt:
+            logger.info('Stopping gesture recognition (keyboard interrupt)')
+
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Stop all sources and release the shared pool"""
+        self.running = False
+
+        for source in self.sources:
+            source.stop()
+
+        for thread in self.threads:
+            thread.join(timeout=5)
+        self.threads = []
+
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+
+        if self.inference_backend is not None:
+            self.inference_backend.close()
+            self.inference_backend = None
+
+    def get_statistics(self):
+        """
+        Get per-source capture statistics and pool usage
+
+        Returns:
+            Statistics dictionary
+        """
+        return {
+            'sources': {
+                source.source_id: source.get_capture_statistics()
+                for source in self.sources
+            },
+            'pool': self.pool.get_statistics() if self.pool else {},
+            'inference_backend': (
+                self.inference_backend.get_statistics() if self.inference_backend else {}
+            )
+        }
+
+
 def main():
     """Main entry point"""
     import argparse
@@ -381,12 +1499,73 @@ def main():
     parser.add_argument('--model', type=str,
                        default='gesture_recognizer.task',
                        help='Path to gesture recognizer model')
-    parser.add_argument('--camera', type=int, default=0,
-                       help='Camera device index')
-    parser.add_argument('--socket-host', type=str, default='localhost',
-                       help='Socket host for gesture events')
-    parser.add_argument('--socket-port', type=int, default=5555,
-                       help='Socket port for gesture events')
+    parser.add_argument('--camera', type=parse_source, nargs='+', default=[DEFAULT_CAMERA_INDEX],
+                       help='Camera device index, video file or image directory '
+                            '(several sources run in one process; they share models only '
+                            'in IMAGE mode or with --inference-workers, VIDEO and '
+                            'LIVE_STREAM load one model per source)')
+    parser.add_argument('--pool-size', type=int, default=RECOGNIZER_POOL_SIZE,
+                       help='Recognizer instances shared by multiple cameras (IMAGE mode)')
+    parser.add_argument('--inference-workers', type=int, default=INFERENCE_WORKERS,
+                       help='Worker processes for recognition (0 runs it in-process)')
+    parser.add_argument('--capture-size', type=int, nargs=2,
+                       default=[DEFAULT_CAMERA_WIDTH, DEFAULT_CAMERA_HEIGHT],
+                       metavar=('WIDTH', 'HEIGHT'),
+                       help='Resolution requested from the camera')
+    parser.add_argument('--inference-size', type=int, nargs=2,
+                       default=[INFERENCE_WIDTH, INFERENCE_HEIGHT],
+                       metavar=('WIDTH', 'HEIGHT'),
+                       help='Resolution fed to MediaPipe')
+    parser.add_argument('--preview-size', type=int, nargs=2,
+                       default=[PREVIEW_WIDTH, PREVIEW_HEIGHT],
+                       metavar=('WIDTH', 'HEIGHT'),
+                       help='Resolution of the annotated preview stream')
+    parser.add_argument('--frame-bus', type=str, default=FRAME_BUS_NAME,
+                       help="Shared memory name for the preview stream ('' disables)")
+    parser.add_argument('--config', type=str,
+                       default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            '..', 'config', 'gesture_config.yaml'),
+                       help='Configuration file whose socket_communication settings '
+                            'select the event transport (the socket flags override them)')
+    parser.add_argument('--socket-type', type=str, default=None, choices=['tcp', 'unix'],
+                       help='Gesture event transport (default: socket_communication.type)')
+    parser.add_argument('--socket-host', type=str, default=None,
+                       help='Socket host for gesture events (default: socket_communication.host)')
+    parser.add_argument('--socket-port', type=int, default=None,
+                       help='Socket port for gesture events (default: socket_communication.port)')
+    parser.add_argument('--running-mode', type=str,
+                       default=MEDIAPIPE_RUNNING_MODE,
+                       choices=RUNNING_MODES,
+                       help='MediaPipe running mode (VIDEO/LIVE_STREAM enable hand tracking)')
+    parser.add_argument('--target-fps', type=float, default=TARGET_INFERENCE_FPS,
+                       help='Inference frame rate while hands are visible')
+    parser.add_argument('--idle-fps', type=float, default=IDLE_INFERENCE_FPS,
+                       help='Inference frame rate when no hand has been seen recently')
+    parser.add_argument('--idle-timeout', type=float, default=IDLE_TIMEOUT_SECONDS,
+                       help='Seconds without a hand before switching to idle rate (0 disables)')
+    parser.add_argument('--motion-threshold', type=float, default=MOTION_THRESHOLD,
+                       help='Fraction of changed pixels that triggers inference (0 disables motion gating)')
+    parser.add_argument('--motion-refresh', type=float, default=MOTION_REFRESH_INTERVAL,
+                       help='Seconds after which a frame is processed even without motion')
+    parser.add_argument('--roi-tracking', action='store_true',
+                       help='Recognize only around the last detected hands (IMAGE mode only)')
+    parser.add_argument('--socket-path', type=str, default=None,
+                       help="Unix socket for gesture events instead of TCP ('@name' for abstract; "
+                            "default: socket_communication.unix_socket_path)")
+    parser.add_argument('--wire-protocol', type=str, default=WIRE_PROTOCOL,
+                       choices=['json', 'binary'],
+                       help='Gesture event encoding (binary is negotiated, falls back to JSON)')
+    parser.add_argument('--batch-ms', type=float, default=EVENT_BATCH_INTERVAL_MS,
+                       help='Send gesture events in batches collected over this many ms (0 disables)')
+    parser.add_argument('--batch-max-events', type=int, default=EVENT_BATCH_MAX_EVENTS,
+                       help='Events that flush a batch early')
+    parser.add_argument('--coalesce', action='store_true', default=EVENT_COALESCE,
+                       help='Send every frame (no debounce) and collapse same-gesture frames of a batch into one event')
+    parser.add_argument('--replay', action='store_true',
+                       help='Process every frame of a video file or image directory as fast '
+                            'as possible, with frame-index timestamps')
+    parser.add_argument('--events-out', type=str, default=None,
+                       help='Append emitted gesture events to this NDJSON file')
 
     args = parser.parse_args()
 
@@ -397,12 +1576,58 @@ def main():
         logger.info('https://storage.googleapis.com/mediapipe-models/gesture_recognizer/gesture_recognizer/float16/1/gesture_recognizer.task')
         return
 
+    # Same transport settings as the controller, flags take precedence
+    socket_config = load_socket_config(args.config)
+    socket_type = args.socket_type or ('unix' if args.socket_path else socket_config.get('type', 'tcp'))
+    if socket_type not in ('tcp', 'unix'):
+        parser.error(f'Invalid socket_communication.type: {socket_type} (must be tcp or unix)')
+
+    socket_path = None
+    if socket_type == 'unix':
+        socket_path = args.socket_path or socket_config.get('unix_socket_path', DEFAULT_UNIX_SOCKET_PATH)
+
+    recognizer_kwargs = dict(
+        socket_host=args.socket_host or socket_config.get('host', DEFAULT_SOCKET_HOST),
+        socket_port=args.socket_port or socket_config.get('port', DEFAULT_SOCKET_PORT),
+        target_fps=args.target_fps,
+        idle_fps=args.idle_fps,
+        idle_timeout=args.idle_timeout,
+        motion_threshold=args.motion_threshold,
+        motion_refresh_interval=args.motion_refresh,
+        roi_tracking=args.roi_tracking,
+        capture_size=args.capture_size,
+        inference_size=args.inference_size,
+        preview_size=args.preview_size,
+        replay=args.replay,
+        events_path=args.events_out,
+        wire_protocol=args.wire_protocol,
+        socket_path=socket_path,
+        batch_interval_ms=args.batch_ms,
+        batch_max_events=args.batch_max_events,
+        coalesce_events=args.coalesce
+    )
+
+    # Several cameras share one process and a bounded recognizer pool
+    if len(args.camera) > 1:
+        MultiCameraGestureStream(
+            args.camera,
+            model_path=args.model,
+            pool_size=args.pool_size,
+            running_mode=args.running_mode,
+            frame_bus_name=args.frame_bus,
+            inference_workers=args.inference_workers,
+            **recognizer_kwargs
+        ).run()
+        return
+
     # Create and run gesture recognizer
     recognizer = GestureRecognizer(
         model_path=args.model,
-        camera_index=args.camera,
-        socket_host=args.socket_host,
-        socket_port=args.socket_port
+        camera_index=args.camera[0],
+        running_mode=args.running_mode,
+        frame_bus_name=args.frame_bus,
+        inference_workers=args.inference_workers,
+        **recognizer_kwargs
     )
 
     try:
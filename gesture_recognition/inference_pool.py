@@ -0,0 +1,442 @@
+"""
+Process-Pool Inference Backend
+
+Fans frames out to worker processes, each holding its own MediaPipe
+GestureRecognizer, so recognition scales across CPU cores. Frames travel
+through a shared-memory slot array; only slot indices and small result
+tuples go through the queues. Results are delivered per stream in frame
+sequence order.
+
+Workers that die are respawned (up to a restart limit), and a frame
+whose result has not arrived within the task timeout is skipped, so a
+crashed worker never stalls a stream's in-order delivery.
+"""
+
+import time
+import queue
+import logging
+import itertools
+import threading
+import multiprocessing
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory, resource_tracker
+from typing import Dict, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Category:
+    """Classification entry (mirrors MediaPipe's Category)"""
+    category_name: str
+    score: float
+
+
+@dataclass
+class Landmark:
+    """Normalized landmark (mirrors MediaPipe's NormalizedLandmark)"""
+    x: float
+    y: float
+    z: float
+
+
+@dataclass
+class RecognitionResult:
+    """Recognition result with the fields of GestureRecognizerResult used here"""
+    gestures: List[List[Category]] = field(default_factory=list)
+    handedness: List[List[Category]] = field(default_factory=list)
+    hand_landmarks: List[List[Landmark]] = field(default_factory=list)
+
+
+def _serialize_result(result):
+    """Convert a GestureRecognizerResult to plain tuples for the result queue"""
+    return (
+        [[(c.category_name, c.score) for c in hand] for hand in result.gestures],
+        [[(c.category_name, c.score) for c in hand] for hand in result.handedness],
+        [[(lm.x, lm.y, lm.z) for lm in hand] for hand in result.hand_landmarks],
+    )
+
+
+def _deserialize_result(payload):
+    """Rebuild a RecognitionResult from _serialize_result() output"""
+    if payload is None:
+        return RecognitionResult()
+
+    gestures, handedness, hand_landmarks = payload
+    return RecognitionResult(
+        gestures=[[Category(*c) for c in hand] for hand in gestures],
+        handedness=[[Category(*c) for c in hand] for hand in handedness],
+        hand_landmarks=[[Landmark(*lm) for lm in hand] for hand in hand_landmarks],
+    )
+
+
+def _worker_main(model_path, shm_name, slot_size, task_queue, result_queue):
+    """
+    Worker process entry point
+
+    Args:
+        model_path: Path to MediaPipe gesture recognizer model
+        shm_name: Name of the frame slot shared memory
+        slot_size: Size of one frame slot in bytes
+        task_queue: Queue of (stream_id, seq, slot, shape) tasks (None stops)
+        result_queue: Queue for (stream_id, seq, slot, payload) results
+    """
+    import mediapipe as mp
+    from gesture_stream import create_mediapipe_recognizer
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    except Exception:
+        pass
+
+    recognizer = create_mediapipe_recognizer(model_path, running_mode='IMAGE')
+
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            stream_id, seq, slot, shape = task
+            payload = None
+
+            try:
+                frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf,
+                                   offset=slot * slot_size)
+                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame)
+                del frame
+                payload = _serialize_result(recognizer.recognize(mp_image))
+
+            except Exception as e:
+                logger.error(f'Inference worker error: {e}')
+
+            result_queue.put((stream_id, seq, slot, payload))
+
+    finally:
+        recognizer.close()
+        shm.close()
+
+
+class InferenceStream:
+    """Per-source handle that submits frames and returns results in order"""
+
+    def __init__(self, backend, stream_id):
+        """
+        Initialize stream (use ProcessInferenceBackend.open_stream())
+
+        Args:
+            backend: Owning ProcessInferenceBackend
+            stream_id: Stream identifier
+        """
+        self.backend = backend
+        self.stream_id = stream_id
+
+        self.next_seq = 0
+        self.next_delivery = 0
+        self.completed: Dict[int, RecognitionResult] = {}
+        self.lock = threading.Lock()
+
+        # Statistics
+        self.frames_submitted = 0
+        self.frames_dropped = 0
+
+    def submit(self, rgb_frame, timeout=1.0):
+        """
+        Queue a frame for recognition
+
+        Args:
+            rgb_frame: RGB frame (copied into shared memory)
+            timeout: Maximum time to wait for a free slot
+
+        Returns:
+            Sequence number, or None if the frame was dropped
+        """
+        with self.lock:
+            seq = self.next_seq
+            self.next_seq += 1
+
+        if not self.backend._submit(self.stream_id, seq, rgb_frame, timeout):
+            # Keep the sequence contiguous for reordering
+            self._deliver(seq, None)
+            self.frames_dropped += 1
+            return None
+
+        self.frames_submitted += 1
+        return seq
+
+    def _deliver(self, seq, result):
+        """Store a completed result (called from the collector thread)"""
+        with self.lock:
+            self.completed[seq] = result
+
+    def collect(self):
+        """
+        Get all results that are ready, in frame order
+
+        Returns:
+            List of (sequence_number, RecognitionResult) tuples (dropped
+            frames are skipped)
+        """
+        results = []
+
+        with self.lock:
+            while self.next_delivery in self.completed:
+                result = self.completed.pop(self.next_delivery)
+                if result is not None:
+                    results.append((self.next_delivery, result))
+                self.next_delivery += 1
+
+        return results
+
+    def in_flight(self):
+        """Get the number of submitted frames without a collected result"""
+        with self.lock:
+            return self.next_seq - self.next_delivery
+
+    def get_statistics(self):
+        """
+        Get stream statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'frames_submitted': self.frames_submitted,
+            'frames_dropped': self.frames_dropped,
+            'in_flight': self.in_flight()
+        }
+
+
+class ProcessInferenceBackend:
+    """Pool of recognizer worker processes fed through shared memory"""
+
+    def __init__(self, model_path, workers, frame_shape, slots_per_worker=2,
+                 task_timeout=10.0, max_restarts=3):
+        """
+        Initialize backend
+
+        Args:
+            model_path: Path to MediaPipe gesture recognizer model
+            workers: Number of worker processes
+            frame_shape: Largest (height, width, channels) frame to be submitted
+            slots_per_worker: Shared memory frame slots per worker
+            task_timeout: Seconds after which a frame without a result is
+                skipped (its worker is assumed dead)
+            max_restarts: Dead workers respawned over the backend's lifetime
+        """
+        if workers < 1:
+            raise ValueError('Inference backend needs at least one worker')
+
+        self.model_path = model_path
+        self.workers = workers
+        self.slot_size = int(np.prod(frame_shape))
+        self.slot_count = workers * slots_per_worker
+        self.task_timeout = task_timeout
+        self.max_restarts = max_restarts
+
+        self.shm = None
+        self.processes = []
+        self.streams: Dict[int, InferenceStream] = {}
+        self.stream_ids = itertools.count()
+        self.streams_lock = threading.Lock()
+        self.free_slots = queue.Queue()
+        self.collector_thread = None
+        self.running = False
+
+        # Submitted tasks without a result: (stream_id, seq) -> (slot, submitted_at)
+        self.pending: Dict[tuple, tuple] = {}
+        self.pending_lock = threading.Lock()
+
+        # Workers left dead after the restart limit; failed once none is left
+        self.abandoned_workers = set()
+        self.failed = False
+
+        # Statistics
+        self.worker_restarts = 0
+        self.tasks_timed_out = 0
+
+        # Spawned workers do not inherit the parent's threads or MediaPipe state
+        self.context = multiprocessing.get_context('spawn')
+        self.task_queue = self.context.Queue()
+        self.result_queue = self.context.Queue()
+
+    def start(self):
+        """Create the frame slots and start worker processes"""
+        self.shm = shared_memory.SharedMemory(create=True, size=self.slot_size * self.slot_count)
+        for slot in range(self.slot_count):
+            self.free_slots.put(slot)
+
+        for i in range(self.workers):
+            self.processes.append(self._spawn_worker(i))
+
+        self.running = True
+        self.collector_thread = threading.Thread(
+            target=self._collect_loop,
+            name='inference-collector',
+            daemon=True
+        )
+        self.collector_thread.start()
+
+        logger.info(f'Inference backend started with {self.workers} worker process(es)')
+
+    def _spawn_worker(self, index):
+        """Start one worker process"""
+        process = self.context.Process(
+            target=_worker_main,
+            args=(self.model_path, self.shm.name, self.slot_size,
+                  self.task_queue, self.result_queue),
+            name=f'inference-worker-{index}',
+            daemon=True
+        )
+        process.start()
+        return process
+
+    def open_stream(self):
+        """
+        Open a result stream for one frame source (thread-safe)
+
+        Returns:
+            InferenceStream
+        """
+        with self.streams_lock:
+            stream = InferenceStream(self, next(self.stream_ids))
+            self.streams[stream.stream_id] = stream
+        return stream
+
+    def _submit(self, stream_id, seq, rgb_frame, timeout):
+        """Copy a frame into a free slot and queue it for a worker"""
+        if rgb_frame.nbytes > self.slot_size:
+            raise ValueError(f'Frame of {rgb_frame.nbytes} bytes exceeds slot size {self.slot_size}')
+
+        if self.failed:
+            return False
+
+        try:
+            slot = self.free_slots.get(timeout=timeout)
+        except queue.Empty:
+            return False
+
+        view = np.ndarray(rgb_frame.shape, dtype=np.uint8, buffer=self.shm.buf,
+                          offset=slot * self.slot_size)
+        np.copyto(view, rgb_frame)
+        del view
+
+        with self.pending_lock:
+            self.pending[(stream_id, seq)] = (slot, time.monotonic())
+        self.task_queue.put((stream_id, seq, slot, rgb_frame.shape))
+        return True
+
+    def _collect_loop(self):
+        """Route worker results to their streams, recycle slots and watch workers"""
+        while self.running:
+            try:
+                item = self.result_queue.get(timeout=0.5)
+            except queue.Empty:
+                item = None
+
+            if item is not None:
+                stream_id, seq, slot, payload = item
+
+                with self.pending_lock:
+                    expected = self.pending.pop((stream_id, seq), None)
+
+                # A result arriving after its task timed out was already
+                # skipped, and its slot recycled
+                if expected is not None:
+                    self.free_slots.put(slot)
+
+                    stream = self.streams.get(stream_id)
+                    if stream is not None:
+                        stream._deliver(seq, _deserialize_result(payload))
+
+            self._check_workers()
+            self._expire_tasks()
+
+    def _check_workers(self):
+        """Respawn worker processes that have died"""
+        for i, process in enumerate(self.processes):
+            if process.is_alive() or i in self.abandoned_workers or not self.running:
+                continue
+
+            if self.worker_restarts >= self.max_restarts:
+                logger.error(f'Inference worker {i} died (exit code {process.exitcode}), '
+                             f'restart limit of {self.max_restarts} reached')
+                self.abandoned_workers.add(i)
+
+                if len(self.abandoned_workers) == len(self.processes):
+                    logger.error('No inference workers left, frames are dropped')
+                    self.failed = True
+                continue
+
+            self.worker_restarts += 1
+            logger.error(f'Inference worker {i} died (exit code {process.exitcode}), restarting '
+                         f'({self.worker_restarts}/{self.max_restarts})')
+            self.processes[i] = self._spawn_worker(i)
+
+    def _expire_tasks(self):
+        """Skip frames whose result is overdue so streams keep delivering in order"""
+        deadline = time.monotonic() - self.task_timeout
+
+        with self.pending_lock:
+            expired = [(key, slot) for key, (slot, submitted_at) in self.pending.items()
+                       if submitted_at < deadline]
+            for key, _ in expired:
+                del self.pending[key]
+
+        for (stream_id, seq), slot in expired:
+            self.tasks_timed_out += 1
+            logger.error(f'No inference result for stream {stream_id} frame {seq} '
+                         f'after {self.task_timeout}s, skipping it')
+            self.free_slots.put(slot)
+
+            stream = self.streams.get(stream_id)
+            if stream is not None:
+                stream._deliver(seq, None)
+
+    def get_statistics(self):
+        """
+        Get backend statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'workers': self.workers,
+            'alive_workers': sum(1 for p in self.processes if p.is_alive()),
+            'worker_restarts': self.worker_restarts,
+            'failed': self.failed,
+            'tasks_timed_out': self.tasks_timed_out,
+            'free_slots': self.free_slots.qsize(),
+            'streams': {
+                stream_id: stream.get_statistics()
+                for stream_id, stream in self.streams.items()
+            }
+        }
+
+    def close(self):
+        """Stop workers and release shared memory"""
+        # Stop watching first, so exiting workers are not respawned
+        self.running = False
+
+        for _ in self.processes:
+            self.task_queue.put(None)
+
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.processes = []
+
+        if self.collector_thread:
+            self.collector_thread.join(timeout=2)
+            self.collector_thread = None
+
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+        logger.info('Inference backend stopped')
@@ -0,0 +1,196 @@
+"""
+Latency Statistics
+
+Rolling per-stage latency windows with percentile summaries, shared by the
+gesture recognizer and the controller. Each process periodically writes its
+summary to a JSON snapshot file so the web server can report all of them
+from /health without talking to the other processes.
+"""
+
+import os
+import json
+import time
+import threading
+import logging
+from collections import deque
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Snapshot files live in <project root>/logs/latency regardless of the cwd
+DEFAULT_SNAPSHOT_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', 'logs', 'latency')
+)
+
+# Percentiles reported by get_statistics()
+REPORTED_PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values, pct):
+    """
+    Get a percentile of sorted values (nearest rank)
+
+    Args:
+        sorted_values: Non-empty list sorted in ascending order
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Value at the requested percentile
+    """
+    rank = int(round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[min(max(rank, 0), len(sorted_values) - 1)]
+
+
+class LatencyRecorder:
+    """Thread-safe rolling window of durations per named stage"""
+
+    def __init__(self, window_size: int = 1000):
+        """
+        Initialize recorder
+
+        Args:
+            window_size: Number of most recent samples kept per stage
+        """
+        self.window_size = window_size
+        self._samples = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage, duration_ms):
+        """
+        Add a sample
+
+        Args:
+            stage: Stage name (e.g. 'inference')
+            duration_ms: Duration in milliseconds
+        """
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window_size)
+                self._counts[stage] = 0
+
+            samples.append(float(duration_ms))
+            self._counts[stage] += 1
+
+    @contextmanager
+    def measure(self, stage):
+        """
+        Record the duration of a with-block
+
+        Args:
+            stage: Stage name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, (time.perf_counter() - start) * 1000)
+
+    def get_stage_statistics(self, stage):
+        """
+        Summarize one stage
+
+        Args:
+            stage: Stage name
+
+        Returns:
+            Dictionary with count, mean, max and p50/p95/p99 in milliseconds,
+            or None if the stage has no samples
+        """
+        with self._lock:
+            samples = self._samples.get(stage)
+            if not samples:
+                return None
+            values = sorted(samples)
+            count = self._counts[stage]
+
+        summary = {
+            'count': count,
+            'mean': round(sum(values) / len(values), 3),
+            'max': round(values[-1], 3)
+        }
+        for pct in REPORTED_PERCENTILES:
+            summary[f'p{pct}'] = round(percentile(values, pct), 3)
+
+        return summary
+
+    def get_statistics(self):
+        """
+        Summarize all stages
+
+        Returns:
+            Dictionary of stage name to stage summary
+        """
+        with self._lock:
+            stages = list(self._samples)
+
+        return {stage: self.get_stage_statistics(stage) for stage in stages}
+
+    def reset(self):
+        """Drop all samples"""
+        with self._lock:
+            self._samples = {}
+            self._counts = {}
+
+
+def write_latency_snapshot(name, statistics, directory=DEFAULT_SNAPSHOT_DIR):
+    """
+    Write a latency summary for other processes to read
+
+    The file is replaced atomically, so readers never see a partial write.
+
+    Args:
+        name: Snapshot name (e.g. 'goose_controller'), used as the file name
+        statistics: Summary from LatencyRecorder.get_statistics()
+        directory: Snapshot directory
+    """
+    try:
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f'{name}.json')
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'updated': time.time(), 'stages': statistics}, f)
+        os.replace(tmp_path, path)
+
+    except Exception as e:
+        logger.error(f'Failed to write latency snapshot {name}: {e}')
+
+
+def read_latency_snapshots(directory=DEFAULT_SNAPSHOT_DIR, max_age=60.0):
+    """
+    Read the latency summaries written by write_latency_snapshot()
+
+    Args:
+        directory: Snapshot directory
+        max_age: Skip snapshots not updated within this many seconds
+
+    Returns:
+        Dictionary of snapshot name to {'updated': unix time, 'stages': {...}}
+    """
+    snapshots = {}
+
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return snapshots
+
+    now = time.time()
+    for file_name in sorted(names):
+        if not file_name.endswith('.json'):
+            continue
+
+        try:
+            with open(os.path.join(directory, file_name), encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f'Skipping unreadable latency snapshot {file_name}: {e}')
+            continue
+
+        if now - snapshot.get('updated', 0) > max_age:
+            continue
+
+        snapshots[file_name[:-len('.json')]] = snapshot
+
+    return snapshots
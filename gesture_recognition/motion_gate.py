@@ -0,0 +1,111 @@
+"""
+Motion Gate
+
+Cheap pre-stage that decides whether a frame is worth running through the
+gesture recognizer, based on a downsampled grayscale frame difference.
+"""
+
+import time
+import logging
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class MotionGate:
+    """Skips recognition for frames where the scene has not changed"""
+
+    def __init__(self, threshold: float = 0.01, refresh_interval: float = 2.0,
+                 pixel_delta: int = 25, sample_size=(80, 60)):
+        """
+        Initialize motion gate
+
+        Args:
+            threshold: Fraction of sampled pixels (0.0-1.0) that must change
+                for a frame to count as motion (0 disables gating)
+            refresh_interval: Seconds after which a frame is processed even
+                without motion
+            pixel_delta: Minimum grayscale difference for a pixel to count as changed
+            sample_size: (width, height) of the downsampled comparison image
+        """
+        self.threshold = threshold
+        self.refresh_interval = refresh_interval
+        self.pixel_delta = pixel_delta
+        self.sample_size = sample_size
+
+        # Preallocated working buffers
+        width, height = sample_size
+        self._small = np.empty((height, width, 3), dtype=np.uint8)
+        self._gray = np.empty((height, width), dtype=np.uint8)
+        self._diff = np.empty((height, width), dtype=np.uint8)
+        self._reference = None
+
+        self.last_processed_time = 0.0
+
+        # Statistics
+        self.frames_checked = 0
+        self.frames_skipped = 0
+
+    def is_enabled(self) -> bool:
+        """Check if gating is enabled"""
+        return self.threshold > 0
+
+    def should_process(self, frame, hand_present: bool = False) -> bool:
+        """
+        Decide whether a frame should be sent to the recognizer
+
+        Frames are always processed while a hand is visible, since a held
+        gesture produces little motion but still needs tracking.
+
+        Args:
+            frame: OpenCV frame (BGR format)
+            hand_present: True if the last result contained a hand
+
+        Returns:
+            True if the frame should be processed
+        """
+        if not self.is_enabled():
+            return True
+
+        self.frames_checked += 1
+        now = time.monotonic()
+
+        cv2.resize(frame, self.sample_size, dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        if self._reference is None:
+            self._reference = self._gray.copy()
+            self.last_processed_time = now
+            return True
+
+        cv2.absdiff(self._gray, self._reference, dst=self._diff)
+        changed = np.count_nonzero(self._diff > self.pixel_delta) / self._diff.size
+
+        if (hand_present or changed >= self.threshold or
+                now - self.last_processed_time >= self.refresh_interval):
+            # Compare future frames against the last frame that was processed
+            np.copyto(self._reference, self._gray)
+            self.last_processed_time = now
+            return True
+
+        self.frames_skipped += 1
+        return False
+
+    def get_statistics(self):
+        """
+        Get gating statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'enabled': self.is_enabled(),
+            'frames_checked': self.frames_checked,
+            'frames_skipped': self.frames_skipped,
+            'skip_rate': (
+                self.frames_skipped / self.frames_checked * 100
+                if self.frames_checked > 0 else 0.0
+            )
+        }
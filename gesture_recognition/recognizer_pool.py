@@ -0,0 +1,94 @@
+"""
+Recognizer Pool
+
+Bounded pool of MediaPipe recognizer instances shared by several camera
+sources, so the model is loaded once per pool slot instead of once per camera.
+"""
+
+import queue
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class RecognizerPool:
+    """Fixed-size pool of recognizer instances with exclusive checkout"""
+
+    def __init__(self, factory, size: int):
+        """
+        Initialize pool
+
+        Args:
+            factory: Callable returning a new recognizer instance
+            size: Number of recognizer instances to create
+        """
+        if size < 1:
+            raise ValueError('Pool size must be at least 1')
+
+        self.size = size
+        self._available = queue.Queue()
+        self._instances = []
+
+        for _ in range(size):
+            recognizer = factory()
+            self._instances.append(recognizer)
+            self._available.put(recognizer)
+
+        # Statistics
+        self.acquisitions = 0
+        self.waits = 0
+
+        logger.info(f'Recognizer pool created with {size} instance(s)')
+
+    @contextmanager
+    def acquire(self, timeout=None):
+        """
+        Check out a recognizer for exclusive use
+
+        Args:
+            timeout: Maximum time to wait for a free recognizer (None waits forever)
+
+        Yields:
+            Recognizer instance
+
+        Raises:
+            queue.Empty: If no recognizer became free within the timeout
+        """
+        try:
+            recognizer = self._available.get_nowait()
+        except queue.Empty:
+            self.waits += 1
+            recognizer = self._available.get(timeout=timeout)
+
+        self.acquisitions += 1
+
+        try:
+            yield recognizer
+        finally:
+            self._available.put(recognizer)
+
+    def get_statistics(self):
+        """
+        Get pool statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'size': self.size,
+            'available': self._available.qsize(),
+            'acquisitions': self.acquisitions,
+            'waits': self.waits
+        }
+
+    def close(self):
+        """Close all recognizer instances"""
+        for recognizer in self._instances:
+            try:
+                recognizer.close()
+            except Exception as e:
+                logger.error(f'Error closing pooled recognizer: {e}')
+
+        self._instances = []
+        logger.info('Recognizer pool closed')
@@ -0,0 +1,129 @@
+"""
+Hand Region-of-Interest Tracker
+
+Crops recognition to an expanded bounding box around the hands found in the
+previous frame, with periodic full-frame detection to pick up new hands.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class HandRoiTracker:
+    """Tracks a crop region around the last detected hands"""
+
+    def __init__(self, expand_factor: float = 1.5, full_frame_interval: int = 15,
+                 min_size: int = 96):
+        """
+        Initialize ROI tracker
+
+        Args:
+            expand_factor: Scale applied to the landmark bounding box so the
+                hand stays inside the crop when it moves
+            full_frame_interval: Run full-frame detection at least every N frames
+            min_size: Minimum crop width/height in pixels
+        """
+        self.expand_factor = expand_factor
+        self.full_frame_interval = full_frame_interval
+        self.min_size = min_size
+
+        # Current ROI in pixels: (x0, y0, x1, y1) or None for full frame
+        self.roi = None
+        self.frames_since_full = 0
+
+        # Statistics
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.hands_lost = 0
+
+    def get_roi(self):
+        """
+        Get the region to run recognition on for the next frame
+
+        Returns:
+            (x0, y0, x1, y1) pixel box, or None to process the full frame
+        """
+        if self.roi is None or self.frames_since_full >= self.full_frame_interval:
+            self.full_frames += 1
+            self.frames_since_full = 0
+            return None
+
+        self.roi_frames += 1
+        self.frames_since_full += 1
+        return self.roi
+
+    def update(self, gesture_results, roi, frame_shape):
+        """
+        Map a result into full-frame coordinates and compute the next ROI
+
+        Landmarks of results computed on a crop are rewritten in place so they
+        are normalized to the full frame.
+
+        Args:
+            gesture_results: GestureRecognizerResult for the processed region
+            roi: Region the result was computed on (None for full frame)
+            frame_shape: Shape of the full frame (height, width, ...)
+        """
+        frame_height, frame_width = frame_shape[:2]
+
+        if roi is not None:
+            x0, y0, x1, y1 = roi
+            scale_x = (x1 - x0) / frame_width
+            scale_y = (y1 - y0) / frame_height
+            offset_x = x0 / frame_width
+            offset_y = y0 / frame_height
+
+            for hand_landmarks in gesture_results.hand_landmarks:
+                for landmark in hand_landmarks:
+                    landmark.x = offset_x + landmark.x * scale_x
+                    landmark.y = offset_y + landmark.y * scale_y
+
+        if not gesture_results.hand_landmarks:
+            if roi is not None:
+                self.hands_lost += 1
+                logger.debug('Hand lost in ROI, falling back to full frame')
+            self.roi = None
+            return
+
+        xs = [lm.x for hand in gesture_results.hand_landmarks for lm in hand]
+        ys = [lm.y for hand in gesture_results.hand_landmarks for lm in hand]
+
+        center_x = (min(xs) + max(xs)) / 2 * frame_width
+        center_y = (min(ys) + max(ys)) / 2 * frame_height
+
+        # Square box so the crop keeps the hand's aspect ratio
+        size = max((max(xs) - min(xs)) * frame_width,
+                   (max(ys) - min(ys)) * frame_height)
+        size = max(size * self.expand_factor, self.min_size)
+        half = size / 2
+
+        x0 = max(0, int(center_x - half))
+        y0 = max(0, int(center_y - half))
+        x1 = min(frame_width, int(center_x + half))
+        y1 = min(frame_height, int(center_y + half))
+
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            self.roi = None
+            return
+
+        self.roi = (x0, y0, x1, y1)
+
+    def reset(self):
+        """Forget the current ROI so the next frame is processed in full"""
+        self.roi = None
+        self.frames_since_full = 0
+
+    def get_statistics(self):
+        """
+        Get ROI statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'roi': self.roi,
+            'roi_frames': self.roi_frames,
+            'full_frames': self.full_frames,
+            'hands_lost': self.hands_lost
+        }
@@ -0,0 +1,175 @@
+"""
+Gesture Event Transport Helpers
+
+Address handling for the Unix domain socket transport between
+gesture_stream and the controller, and the shared socket_communication
+settings both sides read from gesture_config.yaml. A path starting with
+'@' names a Linux abstract-namespace socket: it has no file, needs no
+cleanup and vanishes with the listening process.
+"""
+
+import os
+import stat
+import errno
+import socket
+import logging
+
+logger = logging.getLogger(__name__)
+
+ABSTRACT_PREFIX = '@'
+
+
+def is_abstract(path):
+    """Check if a socket path names an abstract-namespace socket"""
+    return path.startswith(ABSTRACT_PREFIX)
+
+
+def load_socket_config(config_path):
+    """
+    Read the socket_communication section of gesture_config.yaml
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        Settings dictionary (empty if the file or section is missing)
+    """
+    try:
+        import yaml
+    except ImportError:
+        logger.warning(f'PyYAML not installed, ignoring socket settings in {config_path}')
+        return {}
+
+    try:
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        return {}
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning(f'Could not read socket settings from {config_path}: {e}')
+        return {}
+
+    section = config.get('socket_communication') if isinstance(config, dict) else None
+    return section if isinstance(section, dict) else {}
+
+
+def unix_socket_address(path):
+    """
+    Get the address to bind or connect a Unix socket to
+
+    Args:
+        path: Filesystem path, or '@name' for an abstract socket
+
+    Returns:
+        Address for socket.bind()/connect()
+    """
+    if is_abstract(path):
+        return '\0' + path[len(ABSTRACT_PREFIX):]
+    return path
+
+
+def prepare_unix_socket_path(path):
+    """
+    Make a filesystem socket path bindable
+
+    Creates the parent directory and removes a socket left behind by a
+    previous run. A socket is only removed once connecting to it is
+    refused, so a second instance cannot take over the endpoint of a
+    running server. Anything at the path that is not a socket is left
+    alone, so a misconfigured path cannot delete a regular file.
+
+    Args:
+        path: Socket path (abstract names need no preparation)
+
+    Raises:
+        FileExistsError: If a non-socket file exists at the path
+        OSError: EADDRINUSE if a server is listening on the socket
+    """
+    if is_abstract(path):
+        return
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f'{path} exists and is not a socket')
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    probe.settimeout(1.0)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        # Nobody is listening: left behind by a previous run
+        logger.info(f'Removing stale socket: {path}')
+        os.unlink(path)
+        return
+    except FileNotFoundError:
+        return
+    except socket.timeout:
+        # Listening, but its backlog is full
+        pass
+    finally:
+        probe.close()
+
+    raise OSError(errno.EADDRINUSE, f'{path} is in use by a running server')
+
+
+def restrict_unix_socket(path, mode):
+    """
+    Set the permissions of a bound socket file
+
+    Connecting requires write permission on the socket, so the mode decides
+    which users may send gesture events. Abstract sockets have no file and
+    are reachable by any process in the same network namespace.
+
+    Args:
+        path: Socket path
+        mode: Permission bits (e.g. 0o660)
+    """
+    if is_abstract(path):
+        logger.info(f'Abstract socket {path} has no file permissions to restrict')
+        return
+
+    os.chmod(path, mode)
+
+
+def remove_unix_socket(path):
+    """
+    Remove a socket file on shutdown
+
+    Args:
+        path: Socket path
+    """
+    if is_abstract(path):
+        return
+
+    try:
+        if stat.S_ISSOCK(os.lstat(path).st_mode):
+            os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.error(f'Error removing socket {path}: {e}')
+
+
+def parse_socket_mode(value, default=0o660):
+    """
+    Parse a permission mode from configuration
+
+    Args:
+        value: Octal string (e.g. "0660"), int, or None
+
+    Returns:
+        Permission bits
+    """
+    if value is None:
+        return default
+    if isinstance(value, int):
+        return value
+    return int(str(value), 8)
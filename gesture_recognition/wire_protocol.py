@@ -0,0 +1,280 @@
+"""
+Gesture Event Wire Protocol
+
+Gesture events are newline-delimited JSON by default. A producer can offer
+a compact binary framing instead by sending a JSON hello line right after
+connecting:
+
+    -> {"type": "hello", "protocols": ["binary/1", "json"], "sources": ["camera0"]}
+    <- {"type": "hello_ack", "protocol": "binary/1"}
+
+The producer sends nothing else until it has read the ack. If the ack
+names "binary/1", every following event is a binary frame; otherwise (or
+if no ack arrives, e.g. from an older controller) it keeps sending JSON.
+
+Binary frame (network byte order):
+
+    length      uint16   size of the payload that follows
+    version     uint8    BINARY_VERSION
+    kind        uint8    KIND_EVENT or KIND_JSON
+
+    KIND_EVENT payload continues with:
+    gesture     uint8    index into GESTURES
+    hand        uint8    index into HANDS
+    source      uint8    index into the hello's "sources" list
+    confidence  float32
+    timestamp   uint64   milliseconds
+    capture     float64  monotonic capture time in seconds (NaN if unknown)
+
+    KIND_JSON payload continues with the UTF-8 JSON event, used for events
+    whose names are not in the enum tables and for coalesced events (which
+    carry frame_count and the other summary fields).
+"""
+
+import json
+import math
+import struct
+import logging
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_JSON = 'json'
+PROTOCOL_BINARY = 'binary/1'
+SUPPORTED_PROTOCOLS = (PROTOCOL_BINARY, PROTOCOL_JSON)
+
+BINARY_VERSION = 1
+KIND_EVENT = 1
+KIND_JSON = 2
+
+# Interned names (ids are part of the protocol: append only)
+GESTURES = ('None', 'Closed_Fist', 'Open_Palm', 'Pointing_Up', 'Thumb_Down',
+            'Thumb_Up', 'Victory', 'ILoveYou')
+HANDS = ('Unknown', 'Left', 'Right')
+
+GESTURE_IDS = {name: i for i, name in enumerate(GESTURES)}
+HAND_IDS = {name: i for i, name in enumerate(HANDS)}
+
+LENGTH_STRUCT = struct.Struct('!H')
+HEADER_STRUCT = struct.Struct('!BB')
+EVENT_STRUCT = struct.Struct('!BBBBBfQd')
+
+MAX_PAYLOAD_SIZE = 0xFFFF
+
+
+class ProtocolError(ValueError):
+    """Malformed or unsupported binary frame"""
+
+
+def make_hello(sources, protocols=SUPPORTED_PROTOCOLS):
+    """
+    Build the hello line a producer sends after connecting
+
+    Args:
+        sources: Source ids the producer will send events for
+        protocols: Protocols offered, in order of preference
+
+    Returns:
+        Encoded JSON line
+    """
+    hello = {'type': 'hello', 'protocols': list(protocols), 'sources': list(sources)}
+    return (json.dumps(hello) + '\n').encode('utf-8')
+
+
+def is_hello(message):
+    """Check if a decoded JSON message is a protocol hello"""
+    return isinstance(message, dict) and message.get('type') == 'hello'
+
+
+def negotiate(hello, supported=SUPPORTED_PROTOCOLS):
+    """
+    Pick the protocol for a connection (consumer side)
+
+    Args:
+        hello: Decoded hello message
+        supported: Protocols the consumer accepts
+
+    Returns:
+        Tuple of (protocol, encoded hello_ack line)
+    """
+    offered = hello.get('protocols') or [PROTOCOL_JSON]
+    protocol = next((p for p in offered if p in supported), PROTOCOL_JSON)
+
+    ack = {'type': 'hello_ack', 'protocol': protocol}
+    return protocol, (json.dumps(ack) + '\n').encode('utf-8')
+
+
+def parse_hello_ack(line):
+    """
+    Get the protocol chosen by the consumer (producer side)
+
+    Args:
+        line: Ack line (bytes or str)
+
+    Returns:
+        Protocol name, or PROTOCOL_JSON if the line is not a valid ack
+    """
+    try:
+        ack = json.loads(line)
+    except (ValueError, TypeError):
+        return PROTOCOL_JSON
+
+    if not isinstance(ack, dict) or ack.get('type') != 'hello_ack':
+        return PROTOCOL_JSON
+    return ack.get('protocol', PROTOCOL_JSON)
+
+
+class BinaryEventEncoder:
+    """Encodes gesture event dictionaries as binary frames"""
+
+    def __init__(self, sources):
+        """
+        Initialize encoder
+
+        Args:
+            sources: Source ids announced in the hello (index = source id)
+        """
+        self.source_ids = {source: i for i, source in enumerate(sources)}
+
+        # Statistics
+        self.event_frames = 0
+        self.json_frames = 0
+
+    def encode(self, event):
+        """
+        Encode one event
+
+        Args:
+            event: Gesture event dictionary
+
+        Returns:
+            Length-prefixed frame
+        """
+        gesture_id = GESTURE_IDS.get(event.get('gesture'))
+        hand_id = HAND_IDS.get(event.get('hand'))
+        source_index = self.source_ids.get(event.get('source'))
+
+        if (gesture_id is None or hand_id is None or source_index is None or
+                'frame_count' in event):
+            # Not representable with the enum tables or the fixed event layout
+            payload = HEADER_STRUCT.pack(BINARY_VERSION, KIND_JSON) + json.dumps(event).encode('utf-8')
+            if len(payload) > MAX_PAYLOAD_SIZE:
+                raise ProtocolError(f'Event too large for a binary frame ({len(payload)} bytes)')
+            self.json_frames += 1
+            return LENGTH_STRUCT.pack(len(payload)) + payload
+
+        capture_time = event.get('capture_time')
+        payload = EVENT_STRUCT.pack(
+            BINARY_VERSION, KIND_EVENT, gesture_id, hand_id, source_index,
+            event['confidence'], int(event['timestamp']),
+            capture_time if capture_time is not None else math.nan
+        )
+        self.event_frames += 1
+        return LENGTH_STRUCT.pack(len(payload)) + payload
+
+
+def decode_payload(payload, sources):
+    """
+    Decode one frame payload (without the length prefix)
+
+    Args:
+        payload: Payload bytes
+        sources: Source ids announced in the hello
+
+    Returns:
+        Gesture event dictionary
+
+    Raises:
+        ProtocolError: If the payload is malformed or of an unknown version
+    """
+    if len(payload) < HEADER_STRUCT.size:
+        raise ProtocolError('Truncated frame')
+
+    version, kind = HEADER_STRUCT.unpack_from(payload)
+    if version != BINARY_VERSION:
+        raise ProtocolError(f'Unsupported frame version {version}')
+
+    if kind == KIND_JSON:
+        try:
+            return json.loads(bytes(payload[HEADER_STRUCT.size:]))
+        except ValueError as e:
+            raise ProtocolError(f'Invalid JSON frame: {e}')
+
+    if kind != KIND_EVENT or len(payload) != EVENT_STRUCT.size:
+        raise ProtocolError(f'Invalid frame (kind {kind}, {len(payload)} bytes)')
+
+    (_, _, gesture_id, hand_id, source_index,
+     confidence, timestamp, capture_time) = EVENT_STRUCT.unpack(payload)
+
+    try:
+        event = {
+            'timestamp': timestamp,
+            'source': sources[source_index] if source_index < len(sources) else None,
+            'hand': HANDS[hand_id],
+            'gesture': GESTURES[gesture_id],
+            'confidence': confidence
+        }
+    except IndexError:
+        raise ProtocolError(f'Unknown gesture/hand id {gesture_id}/{hand_id}')
+
+    if not math.isnan(capture_time):
+        event['capture_time'] = capture_time
+
+    return event
+
+
+class BinaryFrameDecoder:
+    """Incremental decoder for a stream of binary frames"""
+
+    def __init__(self, sources):
+        """
+        Initialize decoder
+
+        Args:
+            sources: Source ids announced in the hello
+        """
+        self.sources = list(sources)
+        self._buffer = bytearray()
+
+        # Statistics
+        self.frames = 0
+        self.invalid_frames = 0
+
+    def feed(self, data):
+        """
+        Add received bytes and decode the frames they complete
+
+        Malformed frames are skipped; the length prefix keeps the stream in
+        sync.
+
+        Args:
+            data: Bytes from recv()
+
+        Returns:
+            List of gesture event dictionaries
+        """
+        buffer = self._buffer
+        buffer += data
+
+        events = []
+        offset = 0
+
+        with memoryview(buffer) as view:
+            while len(buffer) - offset >= LENGTH_STRUCT.size:
+                (length,) = LENGTH_STRUCT.unpack_from(buffer, offset)
+                end = offset + LENGTH_STRUCT.size + length
+                if end > len(buffer):
+                    break
+
+                try:
+                    events.append(decode_payload(view[offset + LENGTH_STRUCT.size:end], self.sources))
+                    self.frames += 1
+                except ProtocolError as e:
+                    self.invalid_frames += 1
+                    logger.error(f'Invalid binary gesture frame: {e}')
+
+                offset = end
+
+        if offset:
+            del buffer[:offset]
+
+        return events
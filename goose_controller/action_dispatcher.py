@@ -0,0 +1,239 @@
+"""
+Action Dispatcher
+
+Executes Home Assistant actions off the gesture ingest path. Resolved
+actions go on a bounded asyncio queue served by async workers on a
+background event loop (the HA client's, or the dispatcher's own thread),
+so a slow Home Assistant never stalls the socket readers. When the queue
+is full, new actions are rejected rather than blocking the caller.
+"""
+
+import time
+import asyncio
+import logging
+import threading
+import concurrent.futures
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ActionDispatcher:
+    """Bounded queue of Home Assistant actions served by async workers"""
+
+    def __init__(self, execute: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+                 queue_size: int = 32, workers: int = 2,
+                 on_result: Optional[Callable[[Dict[str, Any], Any], None]] = None,
+                 loop: Optional[asyncio.AbstractEventLoop] = None,
+                 latency=None):
+        """
+        Initialize dispatcher
+
+        Args:
+            execute: Coroutine function executing one action and returning
+                its result dictionary
+            queue_size: Maximum number of actions waiting for a worker
+            workers: Actions executed concurrently
+            on_result: Called with (result, context) after each action (on
+                the event loop thread)
+            loop: Running event loop (on another thread) to serve the queue
+                on, e.g. the one owning the HA client; if None the
+                dispatcher runs its own loop thread
+            latency: LatencyRecorder for the 'action_wait' (queued until a
+                worker picks the action up) and 'ha_call' stages, optional
+        """
+        self.execute = execute
+        self.queue_size = queue_size
+        self.workers = workers
+        self.on_result = on_result
+        self.latency = latency
+
+        self.loop = None
+        self.thread = None
+        self._external_loop = loop
+        self._serve_future = None
+        self._queue = None
+        self._stop_event = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._depth = 0
+
+        # Statistics
+        self.actions_submitted = 0
+        self.actions_rejected = 0
+        self.actions_completed = 0
+        self.actions_failed = 0
+        self.max_queue_depth = 0
+        self.busy_workers = 0
+
+    def start(self, timeout: float = 5.0) -> bool:
+        """
+        Start the workers (on the given loop, or on a new loop thread)
+
+        Args:
+            timeout: Maximum time to wait for the loop to start
+
+        Returns:
+            True if the dispatcher is running
+        """
+        if self._external_loop is not None:
+            self._serve_future = asyncio.run_coroutine_threadsafe(self._serve(), self._external_loop)
+        else:
+            self.thread = threading.Thread(target=self._run, name='action-dispatcher', daemon=True)
+            self.thread.start()
+
+        self._ready.wait(timeout)
+        return self._queue is not None
+
+    def _run(self):
+        """Event loop thread entry point"""
+        try:
+            asyncio.run(self._serve())
+        except Exception as e:
+            logger.error(f'Action dispatcher error: {e}')
+        finally:
+            self._ready.set()
+            logger.info('Action dispatcher stopped')
+
+    async def _serve(self):
+        """Run the workers until stop() is called"""
+        self.loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._stop_event = asyncio.Event()
+
+        workers = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        logger.info(f'Action dispatcher started ({self.workers} workers, queue size {self.queue_size})')
+        self._ready.set()
+
+        await self._stop_event.wait()
+
+        # Let queued actions finish, then stop the workers
+        await self._queue.join()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def submit(self, action: Dict[str, Any], context: Any = None) -> bool:
+        """
+        Queue an action for execution (never waits for Home Assistant)
+
+        Args:
+            action: Action dictionary from the configuration
+            context: Passed to on_result with the action's result
+
+        Returns:
+            True if queued, False if the queue is full or not running
+        """
+        if self.loop is None or self._stop_event is None or self._stop_event.is_set():
+            logger.warning('Action dispatcher not running, action dropped')
+            self.actions_rejected += 1
+            return False
+
+        # Reserve a slot here: the asyncio queue may only be touched on its loop
+        with self._lock:
+            if self._depth >= self.queue_size:
+                self.actions_rejected += 1
+                logger.warning(f'Action queue full ({self.queue_size}), action rejected')
+                return False
+            self._depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._depth)
+            self.actions_submitted += 1
+
+        item = (action, context, time.monotonic())
+        try:
+            self.loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        except RuntimeError:
+            # Loop closed between the check and the call
+            with self._lock:
+                self._depth -= 1
+            self.actions_rejected += 1
+            return False
+
+        return True
+
+    async def _worker(self, index: int):
+        """Execute queued actions one at a time"""
+        while True:
+            action, context, queued_at = await self._queue.get()
+
+            started = time.monotonic()
+            with self._lock:
+                self._depth -= 1
+            self.busy_workers += 1
+
+            try:
+                result = await self.execute(action)
+            except Exception as e:
+                logger.error(f'Action worker {index} error: {e}')
+                result = {'success': False, 'error': f'Unexpected error: {e}'}
+            finally:
+                self.busy_workers -= 1
+                self._queue.task_done()
+
+            finished = time.monotonic()
+            if self.latency is not None:
+                self.latency.record('action_wait', (started - queued_at) * 1000)
+                self.latency.record('ha_call', (finished - started) * 1000)
+
+            self.actions_completed += 1
+            if not result.get('success'):
+                self.actions_failed += 1
+
+            if self.on_result is not None:
+                try:
+                    self.on_result(result, context)
+                except Exception as e:
+                    logger.error(f'Error in action result callback: {e}')
+
+    def queue_depth(self) -> int:
+        """Get the number of actions waiting for a worker"""
+        return self._depth
+
+    def stop(self, timeout: float = 10.0):
+        """
+        Stop accepting actions, finish the queued ones and stop the loop
+
+        Args:
+            timeout: Maximum time to wait for queued actions
+        """
+        if self.loop is not None and self._stop_event is not None:
+            try:
+                self.loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                # Loop already closed
+                pass
+
+        if self._serve_future is not None:
+            try:
+                self._serve_future.result(timeout)
+                logger.info('Action dispatcher stopped')
+            except concurrent.futures.TimeoutError:
+                logger.warning(f'Action dispatcher still busy after {timeout}s ({self._depth} queued)')
+            except Exception as e:
+                logger.error(f'Action dispatcher error: {e}')
+            self._serve_future = None
+
+        if self.thread:
+            self.thread.join(timeout=timeout)
+            if self.thread.is_alive():
+                logger.warning(f'Action dispatcher still busy after {timeout}s ({self._depth} queued)')
+            self.thread = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get queue and worker statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'queue_depth': self._depth,
+            'max_queue_depth': self.max_queue_depth,
+            'queue_size': self.queue_size,
+            'workers': self.workers,
+            'busy_workers': self.busy_workers,
+            'submitted': self.actions_submitted,
+            'rejected': self.actions_rejected,
+            'completed': self.actions_completed,
+            'failed': self.actions_failed
+        }
@@ -0,0 +1,210 @@
+"""
+Home Assistant Transport Check
+
+Runs SyncHomeAssistantClient against the local stand-in servers
+(fake_mcp_server.py and fake_ha_websocket_server.py) for every transport
+and checks the results: MCP tool calls for unambiguous entities, REST for
+ambiguous names, area names, service data and an unreachable MCP server,
+plain REST, and the WebSocket API including pipelined calls and a
+state_changed subscription. Exits non-zero on failure.
+
+Usage:
+    python check_ha_transports.py
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import threading
+
+from fake_mcp_server import FakeMCPServer
+from fake_ha_websocket_server import FakeHomeAssistantServer
+from ha_mcp_client import SyncHomeAssistantClient
+
+logger = logging.getLogger(__name__)
+
+CHECK_TOKEN = 'check-token-' + 'x' * 60
+
+MCP_ENTITIES = {
+    'light.living_room': 'Living Room Light',
+    'switch.fan': 'Fan',
+    'light.desk_left': 'Desk',
+    'light.desk_right': 'Desk',
+    'light.kitchen': 'Kitchen',
+    'switch.lamp': 'Lamp',
+    'light.lamp': 'Lamp'
+}
+MCP_AREAS = ['Kitchen']
+
+
+class Checker:
+    """Collects check failures"""
+
+    def __init__(self):
+        self.failures = []
+
+    def expect(self, condition, description):
+        """Record a failed check"""
+        if not condition:
+            self.failures.append(description)
+            print(f'FAIL {description}')
+        else:
+            print(f'ok   {description}')
+
+
+def check_mcp(check, server):
+    """MCP transport: tool calls, and REST where a tool call is not safe"""
+    client = SyncHomeAssistantClient(server.mcp_url, 'HA_TOKEN', transport='mcp')
+    try:
+        result = client.execute_action({'entity_id': 'light.living_room', 'service': 'turn_on'})
+        check.expect(result.get('transport') == 'mcp' and server.states['light.living_room']['state'] == 'on',
+                     'mcp: turn_on is a tool call')
+
+        result = client.execute_action({'entity_id': 'switch.fan', 'service': 'toggle'})
+        check.expect(result.get('transport') == 'mcp' and server.states['switch.fan']['state'] == 'on',
+                     'mcp: toggle is a tool call')
+
+        result = client.execute_action({'entity_id': 'light.lamp', 'service': 'turn_on'})
+        check.expect(result.get('transport') == 'mcp' and server.states['light.lamp']['state'] == 'on' and
+                     server.states['switch.lamp']['state'] == 'off',
+                     'mcp: name shared across domains is narrowed by domain')
+
+        rest_calls = len(server.rest_calls)
+        result = client.execute_action({'entity_id': 'light.desk_left', 'service': 'turn_on'})
+        check.expect(result.get('success') and 'transport' not in result and
+                     len(server.rest_calls) == rest_calls + 1 and
+                     server.states['light.desk_right']['state'] == 'off',
+                     'mcp: ambiguous name goes over REST')
+
+        result = client.execute_action({'entity_id': 'light.kitchen', 'service': 'turn_on'})
+        check.expect(result.get('success') and 'transport' not in result,
+                     'mcp: name matching an area goes over REST')
+
+        result = client.execute_action({'entity_id': 'light.living_room', 'service': 'turn_on',
+                                        'data': {'brightness': 128}})
+        check.expect(result.get('success') and 'transport' not in result,
+                     'mcp: service data goes over REST')
+
+        stats = client.client.get_statistics()
+        check.expect(stats['mcp_connected'] and server.sessions == 1,
+                     'mcp: one session for all calls')
+    finally:
+        client.close()
+
+
+def check_mcp_unreachable(check, server):
+    """MCP transport with no MCP endpoint: every action falls back to REST"""
+    url = f'http://{server.host}:{server.port}/no_mcp_server/sse'
+    client = SyncHomeAssistantClient(url, 'HA_TOKEN', transport='mcp')
+    try:
+        result = client.execute_action({'entity_id': 'switch.fan', 'service': 'turn_off'})
+        check.expect(result.get('success') and server.states['switch.fan']['state'] == 'off',
+                     'mcp: unreachable MCP server falls back to REST')
+    finally:
+        client.close()
+
+
+def check_rest(check, server):
+    """REST transport: no tool calls"""
+    tool_calls = len(server.tool_calls)
+    client = SyncHomeAssistantClient(server.mcp_url, 'HA_TOKEN', transport='rest')
+    try:
+        result = client.execute_action({'entity_id': 'light.living_room', 'service': 'turn_off'})
+        check.expect(result.get('success') and len(server.tool_calls) == tool_calls and
+                     server.states['light.living_room']['state'] == 'off',
+                     'rest: service call without MCP')
+    finally:
+        client.close()
+
+
+def check_websocket(check, server):
+    """WebSocket transport: service calls, pipelining and subscriptions"""
+    client = SyncHomeAssistantClient('http://localhost:8123/mcp_server/sse', 'HA_TOKEN',
+                                     transport='websocket', websocket_url=server.url)
+    try:
+        result = client.execute_action({'entity_id': 'light.living_room', 'service': 'turn_on'})
+        check.expect(result.get('success') and server.states['light.living_room']['state'] == 'on',
+                     'websocket: turn_on')
+
+        # The state_changed subscription keeps the cache fresh: no get_states
+        get_states_requests = server.get_states_requests
+        client.execute_action({'entity_id': 'light.living_room', 'service': 'turn_off'})
+        state = client.get_state('light.living_room')
+        check.expect(state and state['state'] == 'off' and
+                     server.get_states_requests == get_states_requests,
+                     'websocket: get_state served from the cache')
+
+        events = []
+        subscribed = client.run(client.client.subscribe_events(events.append))
+        client.execute_action({'entity_id': 'light.living_room', 'service': 'toggle'})
+        deadline = time.monotonic() + 2.0
+        while not events and time.monotonic() < deadline:
+            time.sleep(0.05)
+        check.expect(subscribed and events and
+                     events[0]['data']['new_state']['state'] == 'on',
+                     'websocket: state_changed event delivered')
+
+        # Calls from several threads share the connection and overlap
+        server.service_delay = 0.2
+        started = time.monotonic()
+        futures = [client.submit(client.client.execute_action(
+            {'entity_id': 'light.living_room', 'service': 'turn_on'})) for _ in range(5)]
+        results = [future.result(10) for future in futures]
+        elapsed = time.monotonic() - started
+        server.service_delay = 0.0
+        check.expect(all(result.get('success') for result in results) and elapsed < 0.2 * 5,
+                     f'websocket: 5 pipelined calls in {elapsed:.2f}s')
+    finally:
+        client.close()
+
+
+async def _cancel_pending_tasks():
+    """Cancel tasks the stopped servers left on the loop"""
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main():
+    """Main entry point"""
+    logging.basicConfig(level=logging.ERROR)
+    os.environ['HA_TOKEN'] = CHECK_TOKEN
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name='fake-servers', daemon=True)
+    thread.start()
+
+    def run(coro):
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(30)
+
+    mcp_server = FakeMCPServer(CHECK_TOKEN, MCP_ENTITIES, host='127.0.0.1', port=0, areas=MCP_AREAS)
+    ws_server = FakeHomeAssistantServer(CHECK_TOKEN, ['light.living_room'], host='127.0.0.1', port=0)
+    run(mcp_server.start())
+    run(ws_server.start())
+
+    check = Checker()
+    try:
+        check_mcp(check, mcp_server)
+        check_mcp_unreachable(check, mcp_server)
+        check_rest(check, mcp_server)
+        check_websocket(check, ws_server)
+    finally:
+        run(ws_server.stop())
+        run(mcp_server.stop())
+        # e.g. sse_starlette's shutdown watcher outlives the server
+        run(_cancel_pending_tasks())
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5.0)
+        loop.close()
+
+    if check.failures:
+        print(f'{len(check.failures)} check(s) failed')
+        sys.exit(1)
+    print('All transport checks passed')
+
+
+if __name__ == '__main__':
+    main()
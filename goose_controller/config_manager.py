@@ -95,6 +95,11 @@ class ConfigManager:
                 logger.error(f'Missing required Home Assistant config field: {field}')
                 return False
 
+        transport = self.ha_config.get('transport', 'rest')
+        if transport not in ('mcp', 'rest', 'websocket'):
+            logger.error(f'Invalid Home Assistant transport: {transport} (must be mcp, rest or websocket)')
+            return False
+
         # Validate gesture settings
         confidence_threshold = self.gesture_settings.get('confidence_threshold', 0.8)
         if not (0.0 <= confidence_threshold <= 1.0):
@@ -206,13 +206,15 @@ class HoldTimeValidator:
         # Value: timestamp when first detected
         self.gesture_start_times: Dict[str, float] = {}
 
-    def update_gesture(self, gesture: str, hand: str) -> Tuple[bool, float]:
+    def update_gesture(self, gesture: str, hand: str, held_for: float = 0.0) -> Tuple[bool, float]:
         """
         Update gesture state and check if held long enough
 
         Args:
             gesture: Gesture name
             hand: Hand name
+            held_for: Seconds the gesture was already held before this
+                update (from a coalesced event)
 
         Returns:
             Tuple of (is_valid, hold_duration)
@@ -221,12 +223,17 @@ class HoldTimeValidator:
         """
         key = f"{gesture}|{hand}"
         current_time = time.time()
+        start_time = current_time - held_for
 
         # Check if this is a new gesture
         if key not in self.gesture_start_times:
             # Record start time
-            self.gesture_start_times[key] = current_time
-            return False, 0.0
+            self.gesture_start_times[key] = start_time
+            if held_for <= 0:
+                return False, 0.0
+
+        elif start_time < self.gesture_start_times[key]:
+            self.gesture_start_times[key] = start_time
 
         # Calculate hold duration
         hold_duration = current_time - self.gesture_start_times[key]
@@ -0,0 +1,213 @@
+"""
+Entity State Cache
+
+In-memory Home Assistant entity states keyed by entity_id, so reads such as
+toggle decisions, relative brightness and entity names do not cost a round
+trip. Entries expire after a TTL and the least recently used entries are
+evicted beyond a size bound. The cache is filled in bulk from /api/states
+and kept fresh by applying state_changed events; the TTL bounds staleness
+whenever no event subscription is available. Fetched states never replace
+a cached state with a newer last_updated (e.g. an event that arrived while
+the fetch was in flight).
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _last_updated(state: Dict[str, Any]) -> Optional[datetime]:
+    """Parse a state's last_updated time (None if missing or invalid)"""
+    try:
+        return datetime.fromisoformat(state['last_updated'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class EntityStateCache:
+    """TTL- and LRU-bounded cache of entity states"""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300.0):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maximum number of entities kept
+            ttl: Seconds a cached state is served without being refreshed
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        # entity_id -> (state, stored_at); order is least recently used first
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+
+        # Written on the HA client's loop, read from any thread
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.events_applied = 0
+
+    def get(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached state
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            State dictionary (shared, do not modify), or None if not cached
+            or expired
+        """
+        with self._lock:
+            entry = self._entries.get(entity_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            state, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[entity_id]
+                self.expired += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(entity_id)
+            self.hits += 1
+            return state
+
+    def set(self, entity_id: str, state: Dict[str, Any]):
+        """
+        Store a fetched state, evicting the least recently used entity if full
+
+        Args:
+            entity_id: Entity ID
+            state: State dictionary as returned by Home Assistant
+        """
+        with self._lock:
+            if not self._is_stale(entity_id, state):
+                self._store(entity_id, state, time.monotonic())
+
+    def _is_stale(self, entity_id: str, state: Dict[str, Any]) -> bool:
+        """Check whether the cached state is newer than a fetched one (lock held)"""
+        entry = self._entries.get(entity_id)
+        if entry is None:
+            return False
+
+        cached_time = _last_updated(entry[0])
+        fetched_time = _last_updated(state)
+        if cached_time is None or fetched_time is None:
+            return False
+
+        try:
+            return fetched_time < cached_time
+        except TypeError:
+            # Naive and aware timestamps do not compare
+            return False
+
+    def _store(self, entity_id: str, state: Dict[str, Any], now: float):
+        """Store a state (lock held)"""
+        self._entries[entity_id] = (state, now)
+        self._entries.move_to_end(entity_id)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def update_many(self, states: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store states in bulk (e.g. the reply of /api/states)
+
+        Args:
+            states: State dictionaries with an 'entity_id'
+
+        Returns:
+            Number of states stored (older than the cached ones are skipped)
+        """
+        count = 0
+        now = time.monotonic()
+
+        with self._lock:
+            for state in states:
+                entity_id = state.get('entity_id') if isinstance(state, dict) else None
+                if entity_id and not self._is_stale(entity_id, state):
+                    self._store(entity_id, state, now)
+                    count += 1
+
+        return count
+
+    def apply_event(self, event: Dict[str, Any]) -> bool:
+        """
+        Apply a state_changed event
+
+        Args:
+            event: Event dictionary ('event_type', 'data' with 'entity_id'
+                and 'new_state')
+
+        Returns:
+            True if the event changed the cache
+        """
+        if event.get('event_type') != 'state_changed':
+            return False
+
+        data = event.get('data') or {}
+        entity_id = data.get('entity_id')
+        if not entity_id:
+            return False
+
+        new_state = data.get('new_state')
+        with self._lock:
+            if new_state is None:
+                # Entity removed
+                self._entries.pop(entity_id, None)
+            else:
+                self._store(entity_id, new_state, time.monotonic())
+            self.events_applied += 1
+
+        return True
+
+    def invalidate(self, entity_id: str):
+        """
+        Drop a cached state
+
+        Args:
+            entity_id: Entity ID
+        """
+        with self._lock:
+            self._entries.pop(entity_id, None)
+
+    def clear(self):
+        """Drop all cached states"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'expired': self.expired,
+            'evictions': self.evictions,
+            'events_applied': self.events_applied
+        }
@@ -0,0 +1,348 @@
+"""
+Asyncio Gesture Event Server
+
+Accepts newline-delimited JSON gesture events from any number of recognizers
+on a single event loop, instead of one thread per connection. The loop runs
+on its own thread so the synchronous controller can start and stop it;
+events are processed on a small thread pool so a slow Home Assistant call
+never stalls the sockets.
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gesture_recognition.transport import (
+    prepare_unix_socket_path, remove_unix_socket, restrict_unix_socket, unix_socket_address
+)
+from gesture_recognition.wire_protocol import (
+    LENGTH_STRUCT, PROTOCOL_BINARY, ProtocolError, decode_payload, is_hello, negotiate
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionStats:
+    """Message counters for one producer connection"""
+
+    def __init__(self, peer: str, rate_window: float):
+        """
+        Initialize connection statistics
+
+        Args:
+            peer: Peer address used in logs and statistics
+            rate_window: Seconds over which the recent message rate is computed
+        """
+        self.peer = peer
+        self.rate_window = rate_window
+        self.connected_at = time.monotonic()
+        self.messages = 0
+        self.invalid_messages = 0
+        self.protocol = 'json'
+        self._recent = deque()
+
+    def record_message(self):
+        """Count a received message"""
+        now = time.monotonic()
+        self.messages += 1
+        self._recent.append(now)
+        self._trim(now)
+
+    def _trim(self, now):
+        """Drop message times that left the rate window"""
+        while self._recent and now - self._recent[0] > self.rate_window:
+            self._recent.popleft()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get connection statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        now = time.monotonic()
+        self._trim(now)
+        duration = now - self.connected_at
+        window = min(duration, self.rate_window)
+
+        return {
+            'peer': self.peer,
+            'protocol': self.protocol,
+            'connected_seconds': round(duration, 1),
+            'messages': self.messages,
+            'invalid_messages': self.invalid_messages,
+            'messages_per_second': round(len(self._recent) / window, 2) if window > 0 else 0.0
+        }
+
+
+class AsyncGestureEventServer:
+    """NDJSON gesture event server built on asyncio.start_server"""
+
+    def __init__(self, message_handler: Callable[[Dict[str, Any]], Any],
+                 host: str, port: int, workers: int = 4, rate_window: float = 10.0,
+                 max_line_length: int = 65536, unix_socket_path: Optional[str] = None,
+                 unix_socket_mode: int = 0o660):
+        """
+        Initialize server
+
+        Args:
+            message_handler: Called with each decoded event (on a worker thread)
+            host: Server host
+            port: Server port
+            workers: Threads processing events
+            rate_window: Seconds over which message rates are computed
+            max_line_length: Longest accepted event line in bytes; a producer
+                exceeding it is disconnected
+            unix_socket_path: Listen on this Unix socket instead of TCP
+                ('@name' for an abstract-namespace socket)
+            unix_socket_mode: Permission bits of the socket file
+        """
+        self.message_handler = message_handler
+        self.host = host
+        self.port = port
+        self.rate_window = rate_window
+        self.max_line_length = max_line_length
+        self.unix_socket_path = unix_socket_path
+        self.unix_socket_mode = unix_socket_mode
+
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='gesture-event')
+        self.loop = None
+        self.thread = None
+        self._server = None
+        self._stop_event = None
+        self._ready = threading.Event()
+        self._client_tasks = set()
+
+        # Statistics
+        self.connections: Dict[int, ConnectionStats] = {}
+        self.connections_total = 0
+        self.messages_total = 0
+        self.invalid_total = 0
+
+    def start(self, timeout: float = 5.0) -> bool:
+        """
+        Start the event loop thread and begin listening
+
+        Args:
+            timeout: Maximum time to wait for the server to listen
+
+        Returns:
+            True if the server is listening
+        """
+        self.thread = threading.Thread(target=self._run, name='gesture-event-server', daemon=True)
+        self.thread.start()
+        self._ready.wait(timeout)
+        return self._server is not None
+
+    def _run(self):
+        """Event loop thread entry point"""
+        try:
+            asyncio.run(self._serve())
+        except Exception as e:
+            logger.error(f'Socket server error: {e}')
+        finally:
+            self._ready.set()
+            logger.info('Socket server stopped')
+
+    async def _serve(self):
+        """Listen until stop() is called, then close all connections"""
+        self.loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+
+        try:
+            if self.unix_socket_path:
+                prepare_unix_socket_path(self.unix_socket_path)
+                self._server = await asyncio.start_unix_server(
+                    self._handle_client, unix_socket_address(self.unix_socket_path),
+                    limit=self.max_line_length
+                )
+                restrict_unix_socket(self.unix_socket_path, self.unix_socket_mode)
+            else:
+                self._server = await asyncio.start_server(
+                    self._handle_client, self.host, self.port, limit=self.max_line_length
+                )
+        except OSError as e:
+            logger.error(f'Failed to start socket server on {self.address}: {e}')
+            return
+
+        logger.info(f'Socket server listening on {self.address} (asyncio)')
+        self._ready.set()
+
+        await self._stop_event.wait()
+
+        # Stop accepting, then end the open connections; events already
+        # handed to the worker threads still finish
+        self._server.close()
+        for task in list(self._client_tasks):
+            task.cancel()
+        await asyncio.gather(*self._client_tasks, return_exceptions=True)
+        await self._server.wait_closed()
+
+        if self.unix_socket_path:
+            remove_unix_socket(self.unix_socket_path)
+
+    @property
+    def address(self) -> str:
+        """Listening address for logs"""
+        if self.unix_socket_path:
+            return f'unix:{self.unix_socket_path}'
+        return f'{self.host}:{self.port}'
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Read newline-delimited JSON events from one producer"""
+        peername = writer.get_extra_info('peername')
+        if isinstance(peername, tuple):
+            peer = f'{peername[0]}:{peername[1]}'
+        else:
+            # Unix socket clients are usually unnamed
+            peer = f'unix#{self.connections_total + 1}'
+
+        task = asyncio.current_task()
+        self._client_tasks.add(task)
+
+        conn = ConnectionStats(peer, self.rate_window)
+        self.connections[id(task)] = conn
+        self.connections_total += 1
+        logger.info(f'Socket connection from {peer}')
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                if not line.strip():
+                    continue
+
+                try:
+                    gesture_data = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    conn.invalid_messages += 1
+                    self.invalid_total += 1
+                    logger.error(f'Invalid JSON from socket: {e}')
+                    continue
+
+                if is_hello(gesture_data):
+                    protocol, ack = negotiate(gesture_data)
+                    writer.write(ack)
+                    await writer.drain()
+
+                    conn.protocol = protocol
+                    logger.info(f'Socket connection {peer} uses {protocol} protocol')
+
+                    if protocol == PROTOCOL_BINARY:
+                        await self._read_binary_frames(reader, conn, gesture_data.get('sources') or [])
+                        break
+                    continue
+
+                await self._dispatch(conn, gesture_data)
+
+        except asyncio.CancelledError:
+            pass
+
+        except asyncio.IncompleteReadError:
+            # Producer disconnected in the middle of a binary frame
+            pass
+
+        except (ConnectionError, ValueError) as e:
+            # ValueError: line longer than the stream reader limit
+            logger.error(f'Error handling socket client {peer}: {e}')
+
+        finally:
+            self.connections.pop(id(task), None)
+            self._client_tasks.discard(task)
+
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+            logger.info(f'Socket connection closed: {peer}')
+
+    async def _read_binary_frames(self, reader: asyncio.StreamReader, conn: ConnectionStats,
+                                  sources: List[str]):
+        """Read length-prefixed binary event frames until the producer disconnects"""
+        while True:
+            try:
+                header = await reader.readexactly(LENGTH_STRUCT.size)
+            except asyncio.IncompleteReadError as e:
+                if e.partial:
+                    raise
+                return
+
+            (length,) = LENGTH_STRUCT.unpack(header)
+            payload = await reader.readexactly(length)
+
+            try:
+                gesture_data = decode_payload(payload, sources)
+            except ProtocolError as e:
+                conn.invalid_messages += 1
+                self.invalid_total += 1
+                logger.error(f'Invalid binary gesture frame: {e}')
+                continue
+
+            await self._dispatch(conn, gesture_data)
+
+    async def _dispatch(self, conn: ConnectionStats, gesture_data: Dict[str, Any]):
+        """Count an event and process it on the worker pool"""
+        conn.record_message()
+        self.messages_total += 1
+
+        # Await the result so events of one producer stay in order
+        await self.loop.run_in_executor(self.executor, self._process, gesture_data)
+
+    def _process(self, gesture_data: Dict[str, Any]):
+        """Run the message handler (on a worker thread)"""
+        try:
+            self.message_handler(gesture_data)
+        except Exception as e:
+            logger.error(f'Error processing gesture from socket: {e}')
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop listening, close connections and wait for queued events
+
+        Args:
+            timeout: Maximum time to wait for the event loop thread
+        """
+        if self.loop is not None and self._stop_event is not None:
+            try:
+                self.loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                # Loop already closed
+                pass
+
+        if self.thread:
+            self.thread.join(timeout=timeout)
+            self.thread = None
+
+        self.executor.shutdown(wait=True)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get connection counts and per-connection message rates
+
+        Returns:
+            Dictionary with statistics
+        """
+        connections = [conn.get_statistics() for conn in list(self.connections.values())]
+
+        return {
+            'mode': 'asyncio',
+            'active_connections': len(connections),
+            'total_connections': self.connections_total,
+            'messages_received': self.messages_total,
+            'invalid_messages': self.invalid_total,
+            'connections': connections
+        }
@@ -0,0 +1,282 @@
+"""
+Stand-in Home Assistant WebSocket API Server
+
+A small local server speaking the subset of Home Assistant's WebSocket API
+used by HomeAssistantWebSocketClient (auth, ping, call_service, get_states,
+subscribe_events), for exercising the controller without a real Home
+Assistant. Services update an in-memory state table and fire state_changed
+events to subscribers; an optional delay simulates a slow instance.
+
+Usage:
+    HA_TOKEN=... python fake_ha_websocket_server.py --port 8124 \\
+        --entity light.living_room --entity switch.fan
+"""
+
+import json
+import asyncio
+import logging
+import argparse
+import itertools
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+
+import websockets
+
+logger = logging.getLogger(__name__)
+
+FAKE_HA_VERSION = '2024.1.0'
+
+# Resulting state per service (toggle flips the current state)
+SERVICE_STATES = {'turn_on': 'on', 'turn_off': 'off'}
+
+
+def _now() -> str:
+    """Current time in Home Assistant's ISO format"""
+    return datetime.now(timezone.utc).isoformat()
+
+
+class FakeHomeAssistantServer:
+    """In-memory Home Assistant WebSocket API"""
+
+    def __init__(self, token: str, entities: Iterable[str] = (),
+                 host: str = 'localhost', port: int = 8124, service_delay: float = 0.0):
+        """
+        Initialize server
+
+        Args:
+            token: Access token clients must present
+            entities: Entity ids to create (initially 'off')
+            host: Listen host
+            port: Listen port (0 picks a free port)
+            service_delay: Seconds each service call takes
+        """
+        self.token = token
+        self.host = host
+        self.port = port
+        self.service_delay = service_delay
+
+        self.service_calls = []
+        self.get_states_requests = 0
+        self._subscribers = {}
+        self._server = None
+        self._context_ids = itertools.count(1)
+
+        self.states: Dict[str, Dict[str, Any]] = {}
+        for entity_id in entities:
+            self.set_state(entity_id, 'off', fire=False)
+
+    async def start(self):
+        """Start listening"""
+        self._server = await websockets.serve(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f'Fake Home Assistant listening on ws://{self.host}:{self.port}/api/websocket')
+
+    async def stop(self):
+        """Close all connections and stop listening"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    @property
+    def url(self) -> str:
+        """WebSocket API URL of the running server"""
+        return f'ws://{self.host}:{self.port}/api/websocket'
+
+    def set_state(self, entity_id: str, state: str, fire: bool = True,
+                  attributes: Optional[Dict[str, Any]] = None):
+        """
+        Set an entity's state and notify state_changed subscribers
+
+        Args:
+            entity_id: Entity ID
+            state: New state
+            fire: Send a state_changed event
+            attributes: Entity attributes (kept if None)
+        """
+        old_state = self.states.get(entity_id)
+        new_state = {
+            'entity_id': entity_id,
+            'state': state,
+            'attributes': attributes if attributes is not None else
+            (old_state or {}).get('attributes', {}),
+            'last_changed': _now(),
+            'last_updated': _now(),
+            'context': {'id': f'fake-{next(self._context_ids)}'}
+        }
+        self.states[entity_id] = new_state
+
+        if fire:
+            self.fire_event('state_changed', {
+                'entity_id': entity_id,
+                'old_state': old_state,
+                'new_state': new_state
+            })
+
+    def fire_event(self, event_type: str, data: Dict[str, Any]):
+        """Send an event to every matching subscription"""
+        event = {
+            'event_type': event_type,
+            'data': data,
+            'origin': 'LOCAL',
+            'time_fired': _now()
+        }
+
+        for (ws, message_id), subscribed_type in list(self._subscribers.items()):
+            if subscribed_type in (None, event_type):
+                asyncio.ensure_future(self._send(ws, {'id': message_id, 'type': 'event', 'event': event}))
+
+    async def _send(self, ws, message: Dict[str, Any]):
+        """Send one message, ignoring closed connections"""
+        try:
+            await ws.send(json.dumps(message))
+        except websockets.ConnectionClosed:
+            pass
+
+    async def _handle_client(self, ws):
+        """Authenticate a client, then serve its commands concurrently"""
+        await ws.send(json.dumps({'type': 'auth_required', 'ha_version': FAKE_HA_VERSION}))
+
+        try:
+            auth = json.loads(await ws.recv())
+        except (ValueError, websockets.ConnectionClosed):
+            return
+
+        if auth.get('type') != 'auth' or auth.get('access_token') != self.token:
+            await ws.send(json.dumps({'type': 'auth_invalid', 'message': 'Invalid access token'}))
+            await ws.close()
+            return
+
+        await ws.send(json.dumps({'type': 'auth_ok', 'ha_version': FAKE_HA_VERSION}))
+
+        tasks = set()
+        try:
+            async for raw in ws:
+                message = json.loads(raw)
+
+                # Commands run concurrently, so results may come back out of order
+                task = asyncio.ensure_future(self._handle_command(ws, message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+        except websockets.ConnectionClosed:
+            pass
+
+        finally:
+            for key in [key for key in self._subscribers if key[0] is ws]:
+                del self._subscribers[key]
+            for task in tasks:
+                task.cancel()
+
+    async def _handle_command(self, ws, message: Dict[str, Any]):
+        """Execute one command and send its result"""
+        message_id = message.get('id')
+        command = message.get('type')
+
+        if command == 'ping':
+            await self._send(ws, {'id': message_id, 'type': 'pong'})
+
+        elif command == 'get_states':
+            self.get_states_requests += 1
+            await self._send(ws, self._result(message_id, list(self.states.values())))
+
+        elif command == 'subscribe_events':
+            self._subscribers[(ws, message_id)] = message.get('event_type')
+            await self._send(ws, self._result(message_id, None))
+
+        elif command == 'call_service':
+            await self._send(ws, await self._call_service(message))
+
+        else:
+            await self._send(ws, self._error(message_id, 'unknown_command', f'Unknown command: {command}'))
+
+    async def _call_service(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply a service call to the state table"""
+        message_id = message.get('id')
+        service = message.get('service')
+        target = message.get('target') or {}
+        entity_ids = target.get('entity_id') or message.get('service_data', {}).get('entity_id')
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+
+        if self.service_delay:
+            await asyncio.sleep(self.service_delay)
+
+        self.service_calls.append(message)
+
+        for entity_id in entity_ids or []:
+            if entity_id not in self.states:
+                return self._error(message_id, 'not_found', f'Entity {entity_id} not found')
+
+            if service == 'toggle':
+                state = 'off' if self.states[entity_id]['state'] == 'on' else 'on'
+            else:
+                state = SERVICE_STATES.get(service)
+
+            if state is None:
+                return self._error(
+                    message_id, 'not_found',
+                    f'Service {message.get("domain")}.{service} not found'
+                )
+
+            self.set_state(entity_id, state)
+
+        # Like Home Assistant, send the state_changed events before the result
+        await asyncio.sleep(0)
+
+        return self._result(message_id, {'context': {'id': f'fake-{next(self._context_ids)}'}})
+
+    @staticmethod
+    def _result(message_id: int, result: Any) -> Dict[str, Any]:
+        """Build a success result message"""
+        return {'id': message_id, 'type': 'result', 'success': True, 'result': result}
+
+    @staticmethod
+    def _error(message_id: int, code: str, text: str) -> Dict[str, Any]:
+        """Build an error result message"""
+        return {
+            'id': message_id, 'type': 'result', 'success': False,
+            'error': {'code': code, 'message': text}
+        }
+
+
+async def _serve_forever(server: FakeHomeAssistantServer):
+    """Run the server until cancelled"""
+    await server.start()
+    await asyncio.Future()
+
+
+def main():
+    """Main entry point"""
+    import os
+
+    parser = argparse.ArgumentParser(description='Stand-in Home Assistant WebSocket API')
+    parser.add_argument('--host', type=str, default='localhost')
+    parser.add_argument('--port', type=int, default=8124)
+    parser.add_argument('--token-env-var', type=str, default='HA_TOKEN',
+                        help='Environment variable holding the token clients must present')
+    parser.add_argument('--entity', action='append', default=[],
+                        help='Entity id to create (repeatable)')
+    parser.add_argument('--service-delay', type=float, default=0.0,
+                        help='Seconds each service call takes')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    token = os.getenv(args.token_env_var)
+    if not token:
+        parser.error(f'{args.token_env_var} is not set')
+
+    server = FakeHomeAssistantServer(
+        token, args.entity or ['light.living_room'],
+        host=args.host, port=args.port, service_delay=args.service_delay
+    )
+
+    try:
+        asyncio.run(_serve_forever(server))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+"""
+Stand-in Home Assistant MCP Server
+
+A small local server for exercising HomeAssistantMCPClient without a real
+Home Assistant. It serves the MCP server over SSE at /mcp_server/sse with
+the Assist tools the client uses (HassTurnOn, HassTurnOff, HassToggle,
+matching entities by friendly name), plus the REST endpoints the client
+needs for state lookup and fallback (/api/, /api/states,
+/api/states/<entity_id>, /api/services/<domain>/<service>, and
+/api/template for area names). Both share one in-memory state table.
+
+Usage:
+    HA_TOKEN=... python fake_mcp_server.py --port 8125 \\
+        --entity light.living_room="Living Room Light"
+"""
+
+import json
+import asyncio
+import logging
+import argparse
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from mcp import types
+from mcp.server.lowlevel import Server
+from mcp.server.sse import SseServerTransport
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Mount, Route
+
+logger = logging.getLogger(__name__)
+
+# Resulting state per tool (HassToggle flips the current state)
+TOOL_STATES = {'HassTurnOn': 'on', 'HassTurnOff': 'off'}
+
+SERVICE_STATES = {'turn_on': 'on', 'turn_off': 'off'}
+
+TOOL_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'name': {'type': 'string', 'description': 'Name of the entity'},
+        'domain': {'type': 'array', 'items': {'type': 'string'}}
+    }
+}
+
+
+class FakeMCPServer:
+    """In-memory Home Assistant with an MCP (SSE) server and REST API"""
+
+    def __init__(self, token: str, entities: Optional[Dict[str, str]] = None,
+                 host: str = 'localhost', port: int = 8125, areas: List[str] = ()):
+        """
+        Initialize server
+
+        Args:
+            token: Access token clients must present
+            entities: Entity id -> friendly name (initially 'off')
+            host: Listen host
+            port: Listen port (0 picks a free port)
+            areas: Area names (returned by any /api/template request)
+        """
+        self.token = token
+        self.host = host
+        self.port = port
+        self.areas = list(areas)
+
+        self.states: Dict[str, Dict[str, Any]] = {
+            entity_id: {
+                'entity_id': entity_id,
+                'state': 'off',
+                'attributes': {'friendly_name': name}
+            }
+            for entity_id, name in (entities or {}).items()
+        }
+
+        self.tool_calls: List[Dict[str, Any]] = []
+        self.rest_calls: List[Dict[str, Any]] = []
+        self.sessions = 0
+
+        self.mcp_server = self._create_mcp_server()
+        self.sse = SseServerTransport('/mcp_server/messages/')
+        self.app = Starlette(routes=[
+            Route('/mcp_server/sse', endpoint=self._handle_sse),
+            Mount('/mcp_server/messages/', app=self._authorized_app(self.sse.handle_post_message)),
+            Route('/api/', endpoint=self._api_root),
+            Route('/api/states', endpoint=self._api_states),
+            Route('/api/states/{entity_id}', endpoint=self._api_state),
+            Route('/api/services/{domain}/{service}', endpoint=self._api_service, methods=['POST']),
+            Route('/api/template', endpoint=self._api_template, methods=['POST'])
+        ])
+
+        self._uvicorn = None
+        self._serve_task = None
+
+    def _create_mcp_server(self) -> Server:
+        """Build the MCP server with the Assist on/off/toggle tools"""
+        server = Server('fake-home-assistant')
+
+        @server.list_tools()
+        async def list_tools() -> List[types.Tool]:
+            return [
+                types.Tool(name=name, description=f'{name} (stand-in)', inputSchema=TOOL_SCHEMA)
+                for name in ('HassTurnOn', 'HassTurnOff', 'HassToggle')
+            ]
+
+        @server.call_tool()
+        async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
+            self.tool_calls.append({'name': name, 'arguments': arguments})
+
+            entity_id = self._find_entity(arguments.get('name'), arguments.get('domain'))
+            if entity_id is None:
+                # Raised errors reach the client as isError results
+                raise ValueError(f'No entity named {arguments.get("name")!r}')
+
+            self._apply(entity_id, TOOL_STATES.get(name))
+            return [types.TextContent(type='text', text=f'{entity_id} is {self.states[entity_id]["state"]}')]
+
+        return server
+
+    def _find_entity(self, name: Optional[str], domains: Optional[List[str]]) -> Optional[str]:
+        """Match an entity by friendly name (and domain)"""
+        for entity_id, state in self.states.items():
+            if domains and entity_id.split('.')[0] not in domains:
+                continue
+            if state['attributes'].get('friendly_name') == name:
+                return entity_id
+        return None
+
+    def _apply(self, entity_id: str, state: Optional[str]):
+        """Set an entity on or off (None toggles it)"""
+        if state is None:
+            state = 'off' if self.states[entity_id]['state'] == 'on' else 'on'
+        self.states[entity_id]['state'] = state
+
+    def _authorized(self, headers) -> bool:
+        """Check the bearer token of a request"""
+        return headers.get('authorization') == f'Bearer {self.token}'
+
+    def _authorized_app(self, app):
+        """Wrap an ASGI app with the bearer token check"""
+        async def wrapped(scope, receive, send):
+            headers = {key.decode().lower(): value.decode() for key, value in scope.get('headers', [])}
+            if not self._authorized(headers):
+                await JSONResponse({'message': 'Unauthorized'}, status_code=401)(scope, receive, send)
+                return
+            await app(scope, receive, send)
+        return wrapped
+
+    async def _handle_sse(self, request: Request):
+        """Run one MCP session over an SSE stream"""
+        if not self._authorized(request.headers):
+            return JSONResponse({'message': 'Unauthorized'}, status_code=401)
+
+        self.sessions += 1
+        async with self.sse.connect_sse(request.scope, request.receive, request._send) as streams:
+            await self.mcp_server.run(
+                streams[0], streams[1], self.mcp_server.create_initialization_options()
+            )
+        return Response()
+
+    async def _api_root(self, request: Request):
+        """REST API status"""
+        if not self._authorized(request.headers):
+            return JSONResponse({'message': 'Unauthorized'}, status_code=401)
+        return JSONResponse({'message': 'API running.'})
+
+    async def _api_states(self, request: Request):
+        """REST states of all entities"""
+        if not self._authorized(request.headers):
+            return JSONResponse({'message': 'Unauthorized'}, status_code=401)
+        return JSONResponse(list(self.states.values()))
+
+    async def _api_state(self, request: Request):
+        """REST entity state"""
+        if not self._authorized(request.headers):
+            return JSONResponse({'message': 'Unauthorized'}, status_code=401)
+
+        state = self.states.get(request.path_params['entity_id'])
+        if state is None:
+            return JSONResponse({'message': 'Entity not found.'}, status_code=404)
+        return JSONResponse(state)
+
+    async def _api_template(self, request: Request):
+        """REST template rendering (only the area names template is supported)"""
+        if not self._authorized(request.headers):
+            return JSONResponse({'message': 'Unauthorized'}, status_code=401)
+        return PlainTextResponse(json.dumps(self.areas))
+
+    async def _api_service(self, request: Request):
+        """REST service call"""
+        if not self._authorized(request.headers):
+            return JSONResponse({'message': 'Unauthorized'}, status_code=401)
+
+        domain = request.path_params['domain']
+        service = request.path_params['service']
+        payload = await request.json()
+        self.rest_calls.append({'service': f'{domain}.{service}', 'data': payload})
+
+        entity_id = payload.get('entity_id')
+        if entity_id not in self.states or (service not in SERVICE_STATES and service != 'toggle'):
+            return JSONResponse({'message': 'Service not found.'}, status_code=400)
+
+        self._apply(entity_id, SERVICE_STATES.get(service))
+        return JSONResponse([self.states[entity_id]])
+
+    async def start(self):
+        """Start serving (returns once the server is listening)"""
+        config = uvicorn.Config(self.app, host=self.host, port=self.port, log_level='warning')
+        self._uvicorn = uvicorn.Server(config)
+        self._serve_task = asyncio.create_task(self._uvicorn.serve())
+
+        while not self._uvicorn.started:
+            if self._serve_task.done():
+                self._serve_task.result()
+            await asyncio.sleep(0.05)
+
+        self.port = self._uvicorn.servers[0].sockets[0].getsockname()[1]
+        logger.info(f'Fake MCP server listening on {self.mcp_url}')
+
+    async def stop(self):
+        """Stop serving"""
+        if self._uvicorn is not None:
+            self._uvicorn.should_exit = True
+            await self._serve_task
+            self._uvicorn = None
+
+    @property
+    def mcp_url(self) -> str:
+        """MCP SSE endpoint of the running server"""
+        return f'http://{self.host}:{self.port}/mcp_server/sse'
+
+
+def _parse_entity(value: str):
+    """Parse 'entity_id=Friendly Name' (name defaults to the entity id)"""
+    entity_id, _, name = value.partition('=')
+    return entity_id, name or entity_id
+
+
+def main():
+    """Main entry point"""
+    import os
+
+    parser = argparse.ArgumentParser(description='Stand-in Home Assistant MCP server')
+    parser.add_argument('--host', type=str, default='localhost')
+    parser.add_argument('--port', type=int, default=8125)
+    parser.add_argument('--token-env-var', type=str, default='HA_TOKEN',
+                        help='Environment variable holding the token clients must present')
+    parser.add_argument('--entity', type=_parse_entity, action='append', default=[],
+                        help='entity_id=Friendly Name (repeatable)')
+    parser.add_argument('--area', action='append', default=[],
+                        help='Area name (repeatable)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    token = os.getenv(args.token_env_var)
+    if not token:
+        parser.error(f'{args.token_env_var} is not set')
+
+    entities = dict(args.entity) or {'light.living_room': 'Living Room Light'}
+    server = FakeMCPServer(token, entities, host=args.host, port=args.port, areas=args.area)
+
+    logger.info(f'Serving MCP at {server.mcp_url}')
+    uvicorn.run(server.app, host=args.host, port=args.port, log_level='info')
+
+
+if __name__ == '__main__':
+    main()
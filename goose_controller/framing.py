@@ -0,0 +1,125 @@
+"""
+NDJSON Framing
+
+Splits a byte stream into newline-delimited lines in linear time. Received
+bytes are appended to one bytearray, delimiters are searched only in bytes
+not scanned before, and each complete line is decoded exactly once, so a
+multi-byte UTF-8 character split across recv() calls is never broken.
+"""
+
+import logging
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+
+class NDJSONFramer:
+    """Incremental newline framer with a maximum line length"""
+
+    def __init__(self, max_line_length: int = 65536):
+        """
+        Initialize framer
+
+        Args:
+            max_line_length: Longest accepted line in bytes (without the
+                newline); longer lines are dropped up to their next newline
+        """
+        self.max_line_length = max_line_length
+
+        self._buffer = bytearray()
+        self._scan_pos = 0
+        self._discarding = False
+
+        # Statistics
+        self.lines = 0
+        self.oversized_lines = 0
+        self.invalid_lines = 0
+
+    def feed(self, data: bytes) -> List[str]:
+        """
+        Add received bytes and get the lines they complete
+
+        Args:
+            data: Bytes from recv()
+
+        Returns:
+            List of decoded lines (without the newline)
+        """
+        buffer = self._buffer
+        buffer += data
+
+        lines = []
+        start = 0
+
+        with memoryview(buffer) as view:
+            while True:
+                end = buffer.find(b'\n', self._scan_pos)
+                if end < 0:
+                    break
+
+                self._scan_pos = end + 1
+
+                if self._discarding:
+                    # Tail of an oversized line
+                    self._discarding = False
+                elif end - start > self.max_line_length:
+                    self._drop_oversized(end - start)
+                else:
+                    line = self._decode(view[start:end])
+                    if line is not None:
+                        lines.append(line)
+
+                start = end + 1
+
+        # Compact once per feed instead of once per line
+        if start:
+            del buffer[:start]
+        self._scan_pos = len(buffer)
+
+        # Partial line already too long: drop it and skip to the next newline
+        if len(buffer) > self.max_line_length:
+            if not self._discarding:
+                self._drop_oversized(len(buffer))
+                self._discarding = True
+            buffer.clear()
+            self._scan_pos = 0
+
+        return lines
+
+    def _decode(self, raw) -> str:
+        """Decode one complete line (None if it is not valid UTF-8)"""
+        try:
+            line = str(raw, 'utf-8')
+        except UnicodeDecodeError as e:
+            self.invalid_lines += 1
+            logger.error(f'Invalid UTF-8 in socket message: {e}')
+            return None
+
+        self.lines += 1
+        return line
+
+    def _drop_oversized(self, length: int):
+        """Count and log a line that exceeds max_line_length"""
+        self.oversized_lines += 1
+        logger.warning(
+            f'Dropping socket message longer than {self.max_line_length} bytes '
+            f'({length}+ bytes)'
+        )
+
+    def pending_bytes(self) -> int:
+        """Get the number of buffered bytes of an incomplete line"""
+        return len(self._buffer)
+
+    def get_statistics(self):
+        """
+        Get framing statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'lines': self.lines,
+            'oversized_lines': self.oversized_lines,
+            'invalid_lines': self.invalid_lines,
+            'pending_bytes': len(self._buffer)
+        }
@@ -21,18 +21,44 @@ try:
     from config.constants import (
         DEFAULT_SOCKET_HOST,
         DEFAULT_SOCKET_PORT,
+        UNIX_SOCKET_MODE,
         SOCKET_RECV_SIZE,
-        SOCKET_ACCEPT_TIMEOUT
+        SOCKET_MAX_LINE_LENGTH,
+        SOCKET_ACCEPT_TIMEOUT,
+        SOCKET_SERVER_MODE,
+        SOCKET_EVENT_WORKERS,
+        SOCKET_RATE_WINDOW,
+        ACTION_QUEUE_SIZE,
+        ACTION_WORKERS,
+        LATENCY_WINDOW_SIZE
     )
 except ImportError:
     # Fallback to hardcoded values if constants not available
     DEFAULT_SOCKET_HOST = 'localhost'
     DEFAULT_SOCKET_PORT = 5555
+    UNIX_SOCKET_MODE = 0o660
     SOCKET_RECV_SIZE = 1024
+    SOCKET_MAX_LINE_LENGTH = 65536
     SOCKET_ACCEPT_TIMEOUT = 1.0
-
+    SOCKET_SERVER_MODE = 'asyncio'
+    SOCKET_EVENT_WORKERS = 4
+    SOCKET_RATE_WINDOW = 10.0
+    ACTION_QUEUE_SIZE = 32
+    ACTION_WORKERS = 2
+    LATENCY_WINDOW_SIZE = 1000
+
+from gesture_recognition.latency_stats import LatencyRecorder
+from action_dispatcher import ActionDispatcher
 from config_manager import ConfigManager
 from debouncer import GestureDebouncer, HoldTimeValidator
+from event_server import AsyncGestureEventServer
+from framing import NDJSONFramer
+from gesture_recognition.transport import (
+    prepare_unix_socket_path, remove_unix_socket, restrict_unix_socket, unix_socket_address
+)
+from gesture_recognition.wire_protocol import (
+    PROTOCOL_BINARY, BinaryFrameDecoder, is_hello, negotiate
+)
 from ha_mcp_client import SyncHomeAssistantClient
 
 logger = logging.getLogger(__name__)
@@ -45,6 +71,16 @@ class GestureData:
     hand: str
     confidence: float
     timestamp: float
+    source: Optional[str] = None
+    frame_count: int = 1
+    first_timestamp: Optional[float] = None
+
+    @property
+    def held_for(self) -> float:
+        """Seconds covered by a coalesced event (timestamps are in ms)"""
+        if self.first_timestamp is None:
+            return 0.0
+        return max(0.0, (self.timestamp - self.first_timestamp) / 1000)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Optional['GestureData']:
@@ -62,7 +98,11 @@ class GestureData:
                 gesture=str(data['gesture']),
                 hand=str(data['hand']),
                 confidence=float(data['confidence']),
-                timestamp=float(data.get('timestamp', time.time()))
+                timestamp=float(data.get('timestamp', time.time())),
+                source=data.get('source'),
+                frame_count=int(data.get('frame_count', 1)),
+                first_timestamp=(float(data['first_timestamp'])
+                                 if data.get('first_timestamp') is not None else None)
             )
         except (KeyError, ValueError, TypeError) as e:
             logger.error(f'Invalid gesture data: {e}')
@@ -89,7 +129,9 @@ class GestureHandler:
         ha_config = self.config_manager.get_ha_config()
         self.ha_client = SyncHomeAssistantClient(
             mcp_url=ha_config['mcp_url'],
-            token_env_var=ha_config['token_env_var']
+            token_env_var=ha_config['token_env_var'],
+            transport=ha_config.get('transport', 'rest'),
+            websocket_url=ha_config.get('websocket_url')
         )
 
         # Initialize debouncer
@@ -103,7 +145,8 @@ class GestureHandler:
         # Confidence threshold
         self.confidence_threshold = self.config_manager.get_confidence_threshold()
 
-        # Socket server
+        # Socket server (asyncio event server, or the threaded fallback)
+        self.event_server = None
         self.socket_server = None
         self.socket_running = False
         self.socket_thread = None
@@ -122,6 +165,22 @@ class GestureHandler:
             'actions_failed': 0
         }
 
+        # Latency from frame capture (stamped by gesture_stream) to HA response
+        self.latency = LatencyRecorder(window_size=LATENCY_WINDOW_SIZE)
+
+        # Actions are queued and run on the HA client's event loop (sharing
+        # its pooled connections), so ingestion never waits on Home Assistant
+        self.dispatcher = ActionDispatcher(
+            self.ha_client.client.execute_action,
+            queue_size=ACTION_QUEUE_SIZE,
+            workers=ACTION_WORKERS,
+            on_result=self._on_action_result,
+            loop=self.ha_client.loop,
+            latency=self.latency
+        )
+        if not self.dispatcher.start():
+            raise RuntimeError('Failed to start action dispatcher')
+
         logger.info('Gesture handler initialized')
 
     def set_gesture_callback(self, callback: Callable):
@@ -154,9 +213,36 @@ class GestureHandler:
                 - hand: Hand name ('Left' or 'Right')
                 - confidence: Confidence score (0.0-1.0)
                 - timestamp: Unix timestamp
+                - source: Camera source id (optional)
+                - frame_count, first_timestamp: Set on coalesced events
+                  (optional)
+                - capture_time: Monotonic frame capture time (optional)
 
         Returns:
-            Action result dictionary or None if no action taken
+            Dispatch dictionary ('queued', 'mapping') or None if no action
+            taken; the action result is delivered to the action callback
+        """
+        received = time.monotonic()
+
+        try:
+            return self._process_gesture(gesture_data)
+
+        finally:
+            self.latency.record('handler', (time.monotonic() - received) * 1000)
+
+            capture_time = gesture_data.get('capture_time')
+            if isinstance(capture_time, (int, float)):
+                self.latency.record('capture_to_handler', (received - capture_time) * 1000)
+
+    def _process_gesture(self, gesture_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Validate a gesture event and queue its mapped action
+
+        Args:
+            gesture_data: Dictionary containing gesture information
+
+        Returns:
+            Dispatch dictionary or None if no action taken
         """
         self.stats['gestures_received'] += 1
 
@@ -187,9 +273,9 @@ class GestureHandler:
             )
             return None
 
-        # Check hold time
+        # Check hold time (a coalesced event already covers part of the hold)
         is_held_long_enough, hold_duration = self.hold_validator.update_gesture(
-            gesture_obj.gesture, gesture_obj.hand
+            gesture_obj.gesture, gesture_obj.hand, held_for=gesture_obj.held_for
         )
 
         if not is_held_long_enough:
@@ -213,21 +299,38 @@ class GestureHandler:
             logger.debug(f'No mapping found for: {gesture_obj.gesture} ({gesture_obj.hand})')
             return None
 
-        # Execute action
-        logger.info(f'Executing action for gesture: {gesture_obj.gesture} ({gesture_obj.hand})')
+        # Queue action (executed by the dispatcher's workers)
+        logger.info(f'Dispatching action for gesture: {gesture_obj.gesture} ({gesture_obj.hand})')
         logger.info(f'Mapping: {mapping["name"]}')
 
         self.stats['actions_triggered'] += 1
 
-        action = mapping['action']
-        result = self.ha_client.execute_action(action)
+        queued = self.dispatcher.submit(
+            mapping['action'],
+            context={'capture_time': gesture_data.get('capture_time')}
+        )
+        if not queued:
+            self.stats['actions_failed'] += 1
+
+        return {'queued': queued, 'mapping': mapping['name']}
 
-        # Update statistics
+    def _on_action_result(self, result: Dict[str, Any], context: Dict[str, Any]):
+        """
+        Record and broadcast the result of a dispatched action
+
+        Args:
+            result: Action result dictionary
+            context: Context passed at submission (frame capture time)
+        """
         if result.get('success'):
             self.stats['actions_succeeded'] += 1
         else:
             self.stats['actions_failed'] += 1
 
+        capture_time = context.get('capture_time')
+        if isinstance(capture_time, (int, float)):
+            self.latency.record('end_to_end', (time.monotonic() - capture_time) * 1000)
+
         # Broadcast action result
         if self.action_callback:
             try:
@@ -235,39 +338,73 @@ class GestureHandler:
             except Exception as e:
                 logger.error(f'Error in action callback: {e}')
 
-        return result
-
-    def start_socket_server(self, host: str = DEFAULT_SOCKET_HOST, port: int = DEFAULT_SOCKET_PORT):
+    def start_socket_server(self, host: str = DEFAULT_SOCKET_HOST, port: int = DEFAULT_SOCKET_PORT,
+                            mode: str = SOCKET_SERVER_MODE,
+                            unix_socket_path: Optional[str] = None,
+                            unix_socket_mode: int = UNIX_SOCKET_MODE):
         """
-        Start TCP socket server to receive gesture events
+        Start socket server (TCP or Unix domain) to receive gesture events
 
         Args:
-            host: Server host
-            port: Server port
+            host: Server host (TCP)
+            port: Server port (TCP)
+            mode: 'asyncio' serves all connections on one event loop,
+                'threaded' uses a thread per connection
+            unix_socket_path: Listen on this Unix socket instead of TCP
+                ('@name' for an abstract-namespace socket)
+            unix_socket_mode: Permission bits of the socket file
         """
-        logger.info(f'Starting socket server on {host}:{port}')
+        address = f'unix:{unix_socket_path}' if unix_socket_path else f'{host}:{port}'
+        logger.info(f'Starting socket server on {address} ({mode})')
+
+        if mode == 'asyncio':
+            self.event_server = AsyncGestureEventServer(
+                self.process_gesture, host, port,
+                workers=SOCKET_EVENT_WORKERS,
+                rate_window=SOCKET_RATE_WINDOW,
+                max_line_length=SOCKET_MAX_LINE_LENGTH,
+                unix_socket_path=unix_socket_path,
+                unix_socket_mode=unix_socket_mode
+            )
+            if self.event_server.start():
+                logger.info('Socket server started')
+            return
+
+        if mode != 'threaded':
+            logger.warning(f'Unknown socket server mode {mode!r}, using threaded server')
 
         self.socket_running = True
         self.socket_thread = threading.Thread(
             target=self._socket_server_loop,
-            args=(host, port),
+            args=(host, port, unix_socket_path, unix_socket_mode),
             daemon=True
         )
         self.socket_thread.start()
 
         logger.info('Socket server started')
 
-    def _socket_server_loop(self, host: str, port: int):
+    def _socket_server_loop(self, host: str, port: int,
+                            unix_socket_path: Optional[str] = None,
+                            unix_socket_mode: int = UNIX_SOCKET_MODE):
         """Socket server main loop"""
         try:
             # Create socket
-            self.socket_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket_server.bind((host, port))
+            if unix_socket_path:
+                prepare_unix_socket_path(unix_socket_path)
+                self.socket_server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.socket_server.bind(unix_socket_address(unix_socket_path))
+                restrict_unix_socket(unix_socket_path, unix_socket_mode)
+                address = f'unix:{unix_socket_path}'
+            else:
+                self.socket_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.socket_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                self.socket_server.bind((host, port))
+                address = f'{host}:{port}'
+
             self.socket_server.listen(5)
             self.socket_server.settimeout(SOCKET_ACCEPT_TIMEOUT)  # Timeout for clean shutdown
 
-            logger.info(f'Socket server listening on {host}:{port}')
+            logger.info(f'Socket server listening on {address}')
 
             while self.socket_running:
                 try:
@@ -296,11 +433,16 @@ class GestureHandler:
         finally:
             if self.socket_server:
                 self.socket_server.close()
+            if unix_socket_path:
+                remove_unix_socket(unix_socket_path)
             logger.info('Socket server stopped')
 
     def _handle_socket_client(self, conn: socket.socket, addr):
         """Handle socket client connection"""
-        buffer = ''
+        framer = NDJSONFramer(max_line_length=SOCKET_MAX_LINE_LENGTH)
+
+        # Set once the producer negotiated binary framing
+        decoder = None
 
         try:
             while self.socket_running:
@@ -310,26 +452,33 @@ class GestureHandler:
                 if not data:
                     break
 
-                # Decode and add to buffer
-                buffer += data.decode('utf-8')
+                if decoder is not None:
+                    for gesture_data in decoder.feed(data):
+                        self._process_socket_message(gesture_data)
+                    continue
 
                 # Process complete messages (newline-delimited JSON)
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-
+                for line in framer.feed(data):
                     if line.strip():
                         try:
                             # Parse JSON
                             gesture_data = json.loads(line)
 
-                            # Process gesture
-                            self.process_gesture(gesture_data)
-
                         except json.JSONDecodeError as e:
                             logger.error(f'Invalid JSON from socket: {e}')
+                            continue
+
+                        if is_hello(gesture_data):
+                            # The producer waits for the ack before switching
+                            protocol, ack = negotiate(gesture_data)
+                            conn.sendall(ack)
+                            logger.info(f'Socket connection {addr} uses {protocol} protocol')
+
+                            if protocol == PROTOCOL_BINARY:
+                                decoder = BinaryFrameDecoder(gesture_data.get('sources') or [])
+                            continue
 
-                        except Exception as e:
-                            logger.error(f'Error processing gesture from socket: {e}')
+                        self._process_socket_message(gesture_data)
 
         except Exception as e:
             logger.error(f'Error handling socket client {addr}: {e}')
@@ -338,9 +487,21 @@ class GestureHandler:
             conn.close()
             logger.info(f'Socket connection closed: {addr}')
 
+    def _process_socket_message(self, gesture_data: Dict[str, Any]):
+        """Process one decoded gesture event from a socket client"""
+        try:
+            self.process_gesture(gesture_data)
+        except Exception as e:
+            logger.error(f'Error processing gesture from socket: {e}')
+
     def stop_socket_server(self):
         """Stop socket server"""
         logger.info('Stopping socket server...')
+
+        if self.event_server:
+            self.event_server.stop()
+            self.event_server = None
+
         self.socket_running = False
 
         if self.socket_thread:
@@ -394,6 +555,10 @@ class GestureHandler:
         """
         stats = self.stats.copy()
         stats['debouncer'] = self.debouncer.get_statistics()
+        stats['latency'] = self.latency.get_statistics()
+        stats['dispatcher'] = self.dispatcher.get_statistics()
+        if self.event_server:
+            stats['socket_server'] = self.event_server.get_statistics()
         return stats
 
     def reset_statistics(self):
@@ -407,6 +572,7 @@ class GestureHandler:
             'actions_failed': 0
         }
         self.debouncer.reset_statistics()
+        self.latency.reset()
         logger.info('Statistics reset')
 
     def cleanup(self):
@@ -414,6 +580,7 @@ class GestureHandler:
         logger.info('Cleaning up gesture handler...')
 
         self.stop_socket_server()
+        self.dispatcher.stop()
         self.ha_client.close()
 
         logger.info('Gesture handler cleanup complete')
@@ -2,28 +2,79 @@
 Home Assistant MCP Client
 
 Integrates with Home Assistant using the Model Context Protocol (MCP)
-for executing device actions
+for executing device actions. One MCP session over SSE stays open for the
+lifetime of the client; its tools are discovered once, and on/off/toggle
+actions are invoked as tool calls. Anything the tools cannot express (or
+any MCP failure) falls back to the REST API.
+
+Entity states are served from an in-memory cache, warmed from /api/states
+and kept fresh by a state_changed subscription over the WebSocket API.
 """
 
 import os
 import sys
+import json
+import time
 import logging
 import asyncio
+import threading
+import concurrent.futures
+from collections import Counter
+from contextlib import AsyncExitStack
+from datetime import timedelta
 import httpx
-from typing import Dict, Any, Optional
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from typing import Dict, Any, List, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 try:
-    from config.constants import HA_MIN_TOKEN_LENGTH, HA_REQUEST_TIMEOUT
+    from config.constants import (
+        HA_MIN_TOKEN_LENGTH,
+        HA_REQUEST_TIMEOUT,
+        HA_INIT_TIMEOUT,
+        HA_MAX_CONNECTIONS,
+        HA_MAX_KEEPALIVE_CONNECTIONS,
+        HA_KEEPALIVE_EXPIRY,
+        HA_MCP_RETRY_INTERVAL,
+        HA_STATE_CACHE_SIZE,
+        HA_STATE_CACHE_TTL,
+        HA_STATE_SUBSCRIBE,
+        HA_STATE_RESUBSCRIBE_INTERVAL
+    )
 except ImportError:
     # Fallback to hardcoded values if constants not available
     HA_MIN_TOKEN_LENGTH = 50
     HA_REQUEST_TIMEOUT = 30.0
+    HA_INIT_TIMEOUT = 5.0
+    HA_MAX_CONNECTIONS = 10
+    HA_MAX_KEEPALIVE_CONNECTIONS = 5
+    HA_KEEPALIVE_EXPIRY = 30.0
+    HA_MCP_RETRY_INTERVAL = 60.0
+    HA_STATE_CACHE_SIZE = 1024
+    HA_STATE_CACHE_TTL = 300.0
+    HA_STATE_SUBSCRIBE = True
+    HA_STATE_RESUBSCRIBE_INTERVAL = 60.0
+
+from entity_state_cache import EntityStateCache
 
 logger = logging.getLogger(__name__)
 
+# Home Assistant Assist API tools (exposed by the MCP server) per service
+SERVICE_TOOLS = {
+    'turn_on': 'HassTurnOn',
+    'turn_off': 'HassTurnOff',
+    'toggle': 'HassToggle'
+}
+
+# Services safe to repeat over REST when the outcome of a tool call is unknown
+IDEMPOTENT_SERVICES = ('turn_on', 'turn_off')
+
+# Renders the names of all areas (Assist tools also match names against areas)
+AREA_NAMES_TEMPLATE = "{{ areas() | map('area_name') | list | tojson }}"
+
 
 def load_token_securely(token_env_var: str) -> str:
     """
@@ -58,18 +109,23 @@ def load_token_securely(token_env_var: str) -> str:
 class HomeAssistantMCPClient:
     """MCP client for Home Assistant integration"""
 
-    def __init__(self, mcp_url: str, token_env_var: str = 'HA_TOKEN'):
+    def __init__(self, mcp_url: str, token_env_var: str = 'HA_TOKEN', use_mcp: bool = False,
+                 subscribe_states: bool = HA_STATE_SUBSCRIBE):
         """
         Initialize Home Assistant MCP client
 
         Args:
             mcp_url: Home Assistant MCP server URL (SSE endpoint)
             token_env_var: Environment variable name containing access token
+            use_mcp: Invoke actions as MCP tool calls (False uses REST only)
+            subscribe_states: Keep cached states fresh from state_changed
+                events (otherwise they are refreshed after HA_STATE_CACHE_TTL)
 
         Raises:
             ValueError: If token is not set or appears invalid
         """
         self.mcp_url = mcp_url
+        self.token_env_var = token_env_var
         self.token = load_token_securely(token_env_var)
 
         # Extract base URL from MCP URL
@@ -82,19 +138,362 @@ class HomeAssistantMCPClient:
         # HTTP client
         self.http_client = None
 
+        # MCP session (owned by _run_mcp_session, which enters and leaves
+        # the SSE stream in one task)
+        self.use_mcp = use_mcp
+        self.mcp_session = None
+        self.tools = {}
+        self._mcp_task = None
+        self._mcp_closing = None
+        self._mcp_connect_lock = None
+        self._mcp_last_attempt = 0.0
+        self._entity_names: Dict[str, str] = {}
+
+        # Friendly name occurrences from the last /api/states snapshot, by
+        # (domain, name) and by name, and area names: a tool call by name is
+        # only made when the name identifies exactly one entity
+        self._names_by_domain: Optional[Counter] = None
+        self._names: Optional[Counter] = None
+        self._area_names: Optional[set] = None
+
+        # Entity states (written on the client's loop, readable from any thread)
+        self.state_cache = EntityStateCache(HA_STATE_CACHE_SIZE, HA_STATE_CACHE_TTL)
+        self.subscribe_states = subscribe_states
+        self._state_events = None
+        self._state_events_subscribed = False
+        self._state_events_last_attempt = 0.0
+
+        # Statistics
+        self.mcp_calls = 0
+        self.rest_calls = 0
+        self.mcp_errors = 0
+
     async def initialize(self):
-        """Initialize async HTTP client"""
+        """Initialize async HTTP client, warm the state cache and open the MCP session"""
+        self._init_http_client()
+
+        # Subscribe before the bulk fetch so no change falls in between
+        if self.subscribe_states:
+            await self._subscribe_state_changes()
+        await self.get_states()
+
+        if self.use_mcp:
+            await self._get_mcp_session()
+
+    async def _subscribe_state_changes(self) -> bool:
+        """
+        Apply state_changed events from the WebSocket API to the state cache
+
+        Returns:
+            True if the subscription is active
+        """
+        self._state_events_last_attempt = time.monotonic()
+
+        if self._state_events is None:
+            try:
+                from ha_websocket_client import HomeAssistantWebSocketClient, websocket_url_from_base
+            except ImportError as e:
+                logger.warning(f'State subscription unavailable ({e}), cached states expire after '
+                               f'{HA_STATE_CACHE_TTL}s')
+                self.subscribe_states = False
+                return False
+
+            # Only used for events: this client's state cache is the one kept fresh
+            self._state_events = HomeAssistantWebSocketClient(
+                websocket_url_from_base(self.base_url), self.token_env_var,
+                subscribe_states=False
+            )
+
+        try:
+            self._state_events_subscribed = await self._state_events.subscribe_events(
+                self.state_cache.apply_event
+            )
+        except Exception as e:
+            logger.warning(f'State subscription failed, cached states expire after '
+                           f'{HA_STATE_CACHE_TTL}s: {e}')
+
+        return self._state_events_subscribed
+
+    async def _check_state_subscription(self):
+        """Restore a lost (or never established) state subscription"""
+        if not self.subscribe_states or self._state_subscribed():
+            return
+
+        if time.monotonic() - self._state_events_last_attempt < HA_STATE_RESUBSCRIBE_INTERVAL:
+            return
+
+        if not self._state_events_subscribed:
+            restored = await self._subscribe_state_changes()
+        else:
+            # Reconnecting renews the subscription made on the dropped connection
+            self._state_events_last_attempt = time.monotonic()
+            restored = await self._state_events.test_connection()
+
+        if restored:
+            # Changes were missed meanwhile: start over from a fresh snapshot
+            self.state_cache.clear()
+            await self.get_states()
+
+    def state_cache_current(self) -> bool:
+        """
+        Check whether cached states may be served
+
+        False while an established state subscription is down: changes are
+        being missed, so reads go to Home Assistant until it is restored.
+        Without any subscription, HA_STATE_CACHE_TTL bounds staleness.
+        """
+        return not self._state_events_subscribed or self._state_subscribed()
+
+    def _init_http_client(self):
+        """Create the REST client (pooled keep-alive connections)"""
         self.http_client = httpx.AsyncClient(
             headers={
                 'Authorization': f'Bearer {self.token}',
                 'Content-Type': 'application/json'
             },
-            timeout=HA_REQUEST_TIMEOUT
+            timeout=HA_REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=HA_MAX_CONNECTIONS,
+                max_keepalive_connections=HA_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HA_KEEPALIVE_EXPIRY
+            )
         )
         logger.info('HTTP client initialized')
 
+    async def _get_mcp_session(self) -> Optional[ClientSession]:
+        """
+        Get the open MCP session, opening it if needed
+
+        After a failed attempt, REST is used until HA_MCP_RETRY_INTERVAL has
+        passed.
+
+        Returns:
+            ClientSession, or None if MCP is unavailable
+        """
+        if self.mcp_session is not None or not self.use_mcp:
+            return self.mcp_session
+
+        if self._mcp_connect_lock is None:
+            self._mcp_connect_lock = asyncio.Lock()
+
+        # Do not wait for an attempt in progress (e.g. during startup)
+        if self._mcp_connect_lock.locked():
+            return None
+
+        async with self._mcp_connect_lock:
+            if self.mcp_session is not None:
+                return self.mcp_session
+
+            if (self._mcp_last_attempt and
+                    time.monotonic() - self._mcp_last_attempt < HA_MCP_RETRY_INTERVAL):
+                return None
+            self._mcp_last_attempt = time.monotonic()
+
+            ready = asyncio.get_running_loop().create_future()
+            self._mcp_closing = asyncio.Event()
+            self._mcp_task = asyncio.create_task(self._run_mcp_session(ready))
+
+            try:
+                await asyncio.wait_for(ready, HA_REQUEST_TIMEOUT)
+            except Exception as e:
+                logger.warning(f'MCP session unavailable, using REST: {e}')
+                self._mcp_task.cancel()
+                return None
+
+        return self.mcp_session
+
+    async def _run_mcp_session(self, ready: asyncio.Future):
+        """Hold the SSE stream and MCP session open until close() or a failure"""
+        session = None
+        closing = self._mcp_closing
+
+        try:
+            async with AsyncExitStack() as stack:
+                read_stream, write_stream = await stack.enter_async_context(
+                    sse_client(
+                        self.mcp_url,
+                        headers={'Authorization': f'Bearer {self.token}'},
+                        timeout=HA_REQUEST_TIMEOUT
+                    )
+                )
+                session = await stack.enter_async_context(ClientSession(read_stream, write_stream))
+                await session.initialize()
+
+                # Discover tools once; their schemas decide the call arguments
+                listing = await session.list_tools()
+                self.tools = {tool.name: tool for tool in listing.tools}
+                self.mcp_session = session
+                logger.info(f'MCP session open ({len(self.tools)} tools)')
+
+                if not ready.done():
+                    ready.set_result(True)
+
+                await closing.wait()
+
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f'MCP session closed: {e}')
+
+        finally:
+            if session is not None and self.mcp_session is session:
+                self.mcp_session = None
+                logger.info('MCP session closed')
+
+    async def _entity_name(self, entity_id: str) -> Optional[str]:
+        """Get the name Assist tools match entities by (friendly name)"""
+        name = self._entity_names.get(entity_id)
+        if name is None:
+            state = await self.get_state(entity_id)
+            if state is None:
+                return None
+            name = state.get('attributes', {}).get('friendly_name') or entity_id
+            self._entity_names[entity_id] = name
+        return name
+
+    async def _load_area_names(self) -> set:
+        """Get the (casefolded) area names, rendered once through /api/template"""
+        if self._area_names is None:
+            try:
+                response = await self.http_client.post(
+                    f'{self.base_url}/api/template', json={'template': AREA_NAMES_TEMPLATE}
+                )
+                response.raise_for_status()
+                self._area_names = {name.casefold() for name in json.loads(response.text)}
+            except Exception as e:
+                logger.warning(f'Could not load area names, tool calls by name may hit an area: {e}')
+                self._area_names = set()
+        return self._area_names
+
+    async def _tool_arguments(self, tool_name: str, domain: str,
+                              entity_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Build the arguments targeting exactly one entity with a tool
+
+        Tools accepting an entity_id get it directly. Assist tools only
+        match by name, so the friendly name is used only if no other entity
+        (of the domain, when the tool filters by domain) or area shares it.
+
+        Args:
+            tool_name: Tool to call
+            domain: Service domain
+            entity_id: Entity ID
+
+        Returns:
+            Arguments, or None if the entity cannot be targeted unambiguously
+        """
+        properties = self.tools[tool_name].inputSchema.get('properties', {})
+        if 'entity_id' in properties:
+            return {'entity_id': entity_id}
+
+        name = await self._entity_name(entity_id)
+        if name is None:
+            return None
+
+        if self._names is None:
+            await self.get_states()
+            if self._names is None:
+                return None
+
+        key = name.casefold()
+        by_domain = 'domain' in properties
+        count = self._names_by_domain[(domain, key)] if by_domain else self._names[key]
+
+        if count != 1 or key in await self._load_area_names():
+            logger.warning(f'Name {name!r} of {entity_id} is ambiguous for {tool_name}, using REST')
+            return None
+
+        arguments = {'name': name}
+        if by_domain:
+            arguments['domain'] = [domain]
+        return arguments
+
+    async def call_tool_for_service(self, domain: str, service: str,
+                                    entity_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Execute a service as an MCP tool call
+
+        Args:
+            domain: Service domain
+            service: Service name
+            entity_id: Entity ID
+
+        Returns:
+            Result dictionary, or None if the action should go over REST
+        """
+        tool_name = SERVICE_TOOLS.get(service)
+        if tool_name is None:
+            return None
+
+        session = await self._get_mcp_session()
+        if session is None or tool_name not in self.tools:
+            return None
+
+        arguments = await self._tool_arguments(tool_name, domain, entity_id)
+        if arguments is None:
+            return None
+
+        logger.info(f'Calling MCP tool: {tool_name} on {entity_id} ({arguments})')
+
+        try:
+            result = await session.call_tool(
+                tool_name, arguments, read_timeout_seconds=timedelta(seconds=HA_REQUEST_TIMEOUT)
+            )
+
+        except Exception as e:
+            self.mcp_errors += 1
+
+            # Reopen the session on the next call
+            self._mcp_closing.set()
+            self._mcp_last_attempt = 0.0
+
+            if service in IDEMPOTENT_SERVICES:
+                logger.warning(f'MCP tool call {tool_name} failed, using REST: {e}')
+                return None
+
+            # The toggle may have happened; repeating it could undo it
+            error_msg = f'MCP tool call failed: {e}'
+            logger.error(f'{error_msg}: {domain}.{service}')
+            return {'success': False, 'entity_id': entity_id, 'service': f'{domain}.{service}',
+                    'error': error_msg}
+
+        text = ' '.join(item.text for item in result.content if getattr(item, 'text', None))
+
+        if result.isError:
+            # The tool did not act (e.g. name not matched), so REST is safe
+            self.mcp_errors += 1
+            logger.warning(f'MCP tool {tool_name} returned an error, using REST: {text}')
+            return None
+
+        self.mcp_calls += 1
+        if not self._state_subscribed():
+            # No state_changed event will refresh the entry
+            self.state_cache.invalidate(entity_id)
+        logger.info(f'MCP tool call successful: {tool_name}')
+        return {
+            'success': True,
+            'entity_id': entity_id,
+            'service': f'{domain}.{service}',
+            'message': f'{entity_id} - {service} executed successfully',
+            'response': text,
+            'transport': 'mcp'
+        }
+
     async def close(self):
-        """Close HTTP client"""
+        """Close the MCP session and HTTP client"""
+        if self._mcp_task is not None:
+            self._mcp_closing.set()
+            try:
+                await asyncio.wait_for(self._mcp_task, 5.0)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+            self._mcp_task = None
+
+        if self._state_events is not None:
+            await self._state_events.close()
+            self._state_events = None
+
         if self.http_client:
             await self.http_client.aclose()
             logger.info('HTTP client closed')
@@ -114,7 +513,9 @@ class HomeAssistantMCPClient:
             Result dictionary with success status and message
         """
         if not self.http_client:
-            await self.initialize()
+            self._init_http_client()
+
+        self.rest_calls += 1
 
         try:
             # Build service call URL
@@ -137,12 +538,19 @@ class HomeAssistantMCPClient:
             # Check response
             if response.status_code == 200:
                 logger.info(f'Service call successful: {domain}.{service}')
+
+                # The reply lists the states the call changed
+                changed = response.json()
+                self.state_cache.invalidate(entity_id)
+                if isinstance(changed, list):
+                    self.state_cache.update_many(changed)
+
                 return {
                     'success': True,
                     'entity_id': entity_id,
                     'service': f'{domain}.{service}',
                     'message': f'{entity_id} - {service} executed successfully',
-                    'response': response.json()
+                    'response': changed
                 }
             else:
                 error_msg = f'Service call failed: HTTP {response.status_code}'
@@ -253,27 +661,82 @@ class HomeAssistantMCPClient:
         # Extract domain from entity_id
         domain = entity_id.split('.')[0]
 
+        # Tool calls carry no service data (brightness etc. needs REST)
+        if self.use_mcp and not data:
+            result = await self.call_tool_for_service(domain, service, entity_id)
+            if result is not None:
+                return result
+
         return await self.call_service(domain, service, entity_id, data)
 
-    async def get_state(self, entity_id: str) -> Optional[Dict[str, Any]]:
+    def _state_subscribed(self) -> bool:
+        """Check whether state_changed events are keeping the cache fresh"""
+        return (self._state_events_subscribed and self._state_events is not None and
+                self._state_events.is_connected())
+
+    async def get_states(self) -> List[Dict[str, Any]]:
         """
-        Get state of an entity
+        Get the states of all entities in one request and cache them
+
+        Returns:
+            List of state dictionaries (empty on error)
+        """
+        if not self.http_client:
+            self._init_http_client()
+
+        try:
+            response = await self.http_client.get(f'{self.base_url}/api/states')
+
+            if response.status_code == 200:
+                states = response.json()
+                count = self.state_cache.update_many(states)
+                logger.info(f'Cached {count} entity states')
+
+                names = [
+                    (state['entity_id'].split('.')[0],
+                     (state.get('attributes', {}).get('friendly_name') or state['entity_id']).casefold())
+                    for state in states if isinstance(state, dict) and state.get('entity_id')
+                ]
+                self._names_by_domain = Counter(names)
+                self._names = Counter(name for _, name in names)
+                return states
+            else:
+                logger.error(f'Failed to get states: HTTP {response.status_code}')
+                return []
+
+        except Exception as e:
+            logger.error(f'Error getting states: {e}')
+            return []
+
+    async def get_state(self, entity_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get state of an entity (from the cache when fresh)
 
         Args:
             entity_id: Entity ID
+            use_cache: Serve a cached state if available
 
         Returns:
             State dictionary or None
         """
+        await self._check_state_subscription()
+
+        if use_cache and self.state_cache_current():
+            state = self.state_cache.get(entity_id)
+            if state is not None:
+                return state
+
         if not self.http_client:
-            await self.initialize()
+            self._init_http_client()
 
         try:
             url = f'{self.base_url}/api/states/{entity_id}'
             response = await self.http_client.get(url)
 
             if response.status_code == 200:
-                return response.json()
+                state = response.json()
+                self.state_cache.set(entity_id, state)
+                return state
             else:
                 logger.error(f'Failed to get state for {entity_id}: HTTP {response.status_code}')
                 return None
@@ -290,7 +753,7 @@ class HomeAssistantMCPClient:
             True if connection successful, False otherwise
         """
         if not self.http_client:
-            await self.initialize()
+            self._init_http_client()
 
         try:
             url = f'{self.base_url}/api/'
@@ -308,29 +771,100 @@ class HomeAssistantMCPClient:
             logger.error(f'Connection test failed: {e}')
             return False
 
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get transport statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'transport': 'mcp' if self.use_mcp else 'rest',
+            'mcp_connected': self.mcp_session is not None,
+            'tools': sorted(self.tools),
+            'mcp_calls': self.mcp_calls,
+            'mcp_errors': self.mcp_errors,
+            'rest_calls': self.rest_calls,
+            'state_subscribed': self._state_subscribed(),
+            'state_cache': self.state_cache.get_statistics()
+        }
+
 
 class SyncHomeAssistantClient:
     """Synchronous wrapper for Home Assistant MCP client"""
 
-    def __init__(self, mcp_url: str, token_env_var: str = 'HA_TOKEN'):
+    def __init__(self, mcp_url: str, token_env_var: str = 'HA_TOKEN',
+                 transport: str = 'rest', websocket_url: Optional[str] = None):
         """
-        Initialize synchronous client
+        Initialize synchronous client and start its event loop thread
+
+        The async client lives on this one loop for the lifetime of the
+        wrapper, so its pooled keep-alive connections are reused by every
+        caller, and calls from different threads run concurrently.
 
         Args:
             mcp_url: Home Assistant MCP server URL
             token_env_var: Environment variable name containing access token
+            transport: 'mcp' (MCP tool calls over one SSE session, REST
+                fallback), 'rest' (one HTTP request per call) or 'websocket'
+                (one authenticated WebSocket API connection)
+            websocket_url: WebSocket API URL (derived from mcp_url if None)
         """
-        self.client = HomeAssistantMCPClient(mcp_url, token_env_var)
-        self.loop = None
-
-    def _get_or_create_loop(self):
-        """Get or create event loop"""
+        if transport == 'websocket':
+            from ha_websocket_client import HomeAssistantWebSocketClient, websocket_url_from_base
+
+            base_url = '/'.join(mcp_url.split('/')[:3])
+            self.client = HomeAssistantWebSocketClient(
+                websocket_url or websocket_url_from_base(base_url), token_env_var
+            )
+        else:
+            self.client = HomeAssistantMCPClient(mcp_url, token_env_var, use_mcp=(transport == 'mcp'))
+        self.transport = transport
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, name='ha-client-loop', daemon=True)
+        self.thread.start()
+
+        # Create the HTTP client on the loop that will use it. Opening
+        # connections to an unreachable Home Assistant may take much longer;
+        # that continues in the background while actions use what is ready.
+        self._init_future = self.submit(self.client.initialize())
         try:
-            self.loop = asyncio.get_running_loop()
-        except RuntimeError:
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-        return self.loop
+            self._init_future.result(HA_INIT_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            logger.warning(f'Home Assistant not ready after {HA_INIT_TIMEOUT}s, '
+                           f'continuing to connect in the background')
+
+    def _run_loop(self):
+        """Event loop thread entry point"""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the client's event loop
+
+        Args:
+            coro: Coroutine using self.client
+
+        Returns:
+            concurrent.futures.Future with the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """
+        Run a coroutine on the client's event loop and wait for its result
+
+        Args:
+            coro: Coroutine using self.client
+            timeout: Maximum time to wait (requests are bounded by
+                HA_REQUEST_TIMEOUT already)
+
+        Returns:
+            The coroutine's result
+        """
+        return self.submit(coro).result(timeout)
 
     def execute_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -342,16 +876,56 @@ class SyncHomeAssistantClient:
         Returns:
             Result dictionary
         """
-        loop = self._get_or_create_loop()
-        return loop.run_until_complete(self.client.execute_action(action))
+        return self.run(self.client.execute_action(action))
+
+    def get_state(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get state of an entity synchronously
+
+        A fresh cached state is returned directly on the calling thread;
+        a cache miss, or a lost state subscription, waits for the event
+        loop.
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            State dictionary or None
+        """
+        if self.client.state_cache_current():
+            state = self.client.state_cache.get(entity_id)
+            if state is not None:
+                return state
+
+        return self.run(self.client.get_state(entity_id))
 
     def test_connection(self) -> bool:
         """Test connection synchronously"""
-        loop = self._get_or_create_loop()
-        return loop.run_until_complete(self.client.test_connection())
+        return self.run(self.client.test_connection())
+
+    async def _cancel_pending_tasks(self):
+        """Cancel tasks still running on the loop (e.g. a stalled background connect)"""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     def close(self):
-        """Close client"""
-        if self.loop:
-            self.loop.run_until_complete(self.client.close())
-            self.loop.close()
+        """Close client and stop the event loop thread"""
+        if not self.thread.is_alive():
+            return
+
+        self._init_future.cancel()
+        try:
+            self.run(self.client.close(), timeout=5.0)
+        except Exception as e:
+            logger.error(f'Error closing HTTP client: {e}')
+
+        try:
+            self.run(self._cancel_pending_tasks(), timeout=5.0)
+        except Exception as e:
+            logger.error(f'Error cancelling pending Home Assistant tasks: {e}')
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5.0)
+        self.loop.close()
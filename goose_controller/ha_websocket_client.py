@@ -0,0 +1,511 @@
+"""
+Home Assistant WebSocket Client
+
+Alternative to the REST transport of HomeAssistantMCPClient that keeps one
+authenticated connection to Home Assistant's WebSocket API
+(/api/websocket). Every request carries an id; a reader task matches
+results to their requests, so any number of service calls can be in
+flight on the connection at once. Event subscriptions (e.g. state_changed)
+share the same connection and are renewed after a reconnect. Entity states
+are cached and kept fresh by a state_changed subscription, so single-entity
+lookups only fetch all states on a cache miss.
+"""
+
+import os
+import sys
+import json
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+import websockets
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    from config.constants import (
+        HA_REQUEST_TIMEOUT,
+        HA_WEBSOCKET_MAX_MESSAGE_SIZE,
+        HA_STATE_CACHE_SIZE,
+        HA_STATE_CACHE_TTL,
+        HA_STATE_SUBSCRIBE
+    )
+except ImportError:
+    # Fallback to hardcoded values if constants not available
+    HA_REQUEST_TIMEOUT = 30.0
+    HA_WEBSOCKET_MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+    HA_STATE_CACHE_SIZE = 1024
+    HA_STATE_CACHE_TTL = 300.0
+    HA_STATE_SUBSCRIBE = True
+
+from entity_state_cache import EntityStateCache
+from ha_mcp_client import load_token_securely
+
+logger = logging.getLogger(__name__)
+
+
+class HomeAssistantAuthError(Exception):
+    """Home Assistant rejected the access token"""
+
+
+def websocket_url_from_base(base_url: str) -> str:
+    """
+    Derive the WebSocket API URL from the HTTP base URL
+
+    Args:
+        base_url: e.g. http://localhost:8123
+
+    Returns:
+        e.g. ws://localhost:8123/api/websocket
+    """
+    if base_url.startswith('https://'):
+        return 'wss://' + base_url[len('https://'):].rstrip('/') + '/api/websocket'
+    return 'ws://' + base_url.split('://', 1)[-1].rstrip('/') + '/api/websocket'
+
+
+class HomeAssistantWebSocketClient:
+    """Home Assistant client over one persistent WebSocket connection"""
+
+    def __init__(self, websocket_url: str, token_env_var: str = 'HA_TOKEN',
+                 request_timeout: float = HA_REQUEST_TIMEOUT,
+                 subscribe_states: bool = HA_STATE_SUBSCRIBE):
+        """
+        Initialize WebSocket client
+
+        Args:
+            websocket_url: WebSocket API URL (ws://host:8123/api/websocket)
+            token_env_var: Environment variable name containing access token
+            request_timeout: Seconds to wait for each result
+            subscribe_states: Keep cached entity states fresh with state_changed
+                events (otherwise they are refreshed after HA_STATE_CACHE_TTL)
+
+        Raises:
+            ValueError: If token is not set or appears invalid
+        """
+        self.websocket_url = websocket_url
+        self.token = load_token_securely(token_env_var)
+        self.request_timeout = request_timeout
+
+        self.ha_version = None
+
+        self._ws = None
+        self._reader_task = None
+        self._connect_lock = None
+        self._next_id = 1
+        self._pending: Dict[int, asyncio.Future] = {}
+
+        # Subscriptions: current message id -> (event_type, callback)
+        self._subscriptions: Dict[int, tuple] = {}
+
+        # Entity states (written on the client's loop, readable from any thread)
+        self.state_cache = EntityStateCache(HA_STATE_CACHE_SIZE, HA_STATE_CACHE_TTL)
+        self.subscribe_states = subscribe_states
+        self._state_events_subscribed = False
+
+        # Statistics
+        self.connects = 0
+        self.requests = 0
+        self.max_in_flight = 0
+
+        logger.info(f'Home Assistant WebSocket client initialized ({websocket_url})')
+
+    async def initialize(self):
+        """
+        Connect, authenticate and warm the state cache (failures are retried
+        on the next request)
+        """
+        try:
+            await self._ensure_connected()
+        except HomeAssistantAuthError as e:
+            logger.error(f'Home Assistant authentication failed: {e}')
+            return
+        except (OSError, asyncio.TimeoutError, websockets.WebSocketException) as e:
+            logger.warning(f'Could not connect to {self.websocket_url}: {e}')
+            return
+
+        # Subscribe before the bulk fetch so no change falls in between
+        if self.subscribe_states:
+            self._state_events_subscribed = await self.subscribe_events(self.state_cache.apply_event)
+            if not self._state_events_subscribed:
+                logger.warning(f'State subscription failed, cached states expire after '
+                               f'{HA_STATE_CACHE_TTL}s')
+        await self.get_states()
+
+    async def _ensure_connected(self):
+        """Open and authenticate the connection if it is not up"""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if self._ws is not None:
+                return
+
+            ws = await websockets.connect(
+                self.websocket_url, max_size=HA_WEBSOCKET_MAX_MESSAGE_SIZE
+            )
+
+            try:
+                await self._authenticate(ws)
+            except Exception:
+                await ws.close()
+                raise
+
+            self._ws = ws
+            self.connects += 1
+            self._reader_task = asyncio.create_task(self._read_messages(ws))
+            logger.info(f'Connected to Home Assistant WebSocket API (version {self.ha_version})')
+
+            subscriptions = list(self._subscriptions.values())
+            self._subscriptions.clear()
+
+        # Renew subscriptions of a previous connection (outside the lock,
+        # subscribing goes through _ensure_connected again)
+        for event_type, callback in subscriptions:
+            await self.subscribe_events(callback, event_type)
+
+        if self._state_events_subscribed:
+            # Changes were missed while disconnected: start over from a fresh
+            # snapshot (if the renewal failed, the TTL bounds staleness again)
+            self._state_events_subscribed = any(
+                callback == self.state_cache.apply_event
+                for _, callback in self._subscriptions.values()
+            )
+            await self.get_states()
+
+    async def _authenticate(self, ws):
+        """
+        Run the auth handshake
+
+        Raises:
+            HomeAssistantAuthError: If the token is rejected
+        """
+        message = json.loads(await asyncio.wait_for(ws.recv(), self.request_timeout))
+        if message.get('type') != 'auth_required':
+            raise ConnectionError(f'Unexpected message before auth: {message.get("type")}')
+
+        await ws.send(json.dumps({'type': 'auth', 'access_token': self.token}))
+
+        message = json.loads(await asyncio.wait_for(ws.recv(), self.request_timeout))
+        if message.get('type') != 'auth_ok':
+            raise HomeAssistantAuthError(message.get('message', 'Authentication failed'))
+
+        self.ha_version = message.get('ha_version')
+
+    async def _read_messages(self, ws):
+        """Route results to their requests and events to their subscribers"""
+        try:
+            async for raw in ws:
+                try:
+                    message = json.loads(raw)
+                except ValueError as e:
+                    logger.error(f'Invalid message from Home Assistant: {e}')
+                    continue
+
+                # Home Assistant may coalesce several messages into one array
+                for item in message if isinstance(message, list) else [message]:
+                    self._route_message(item)
+
+        except websockets.ConnectionClosed as e:
+            logger.warning(f'Home Assistant WebSocket closed: {e}')
+
+        finally:
+            if self._ws is ws:
+                self._ws = None
+
+            # Cached states miss every change until the subscription is renewed
+            if self._state_events_subscribed:
+                self.state_cache.clear()
+
+            # Fail requests that can no longer get a result
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError('WebSocket connection lost'))
+            self._pending.clear()
+
+    def _route_message(self, message: Dict[str, Any]):
+        """Deliver one decoded message"""
+        message_id = message.get('id')
+
+        if message.get('type') == 'event':
+            subscription = self._subscriptions.get(message_id)
+            if subscription is not None:
+                try:
+                    subscription[1](message.get('event', {}))
+                except Exception as e:
+                    logger.error(f'Error in event subscriber: {e}')
+            return
+
+        future = self._pending.pop(message_id, None)
+        if future is not None and not future.done():
+            future.set_result(message)
+
+    def _allocate_id(self) -> int:
+        """Get the next message id"""
+        message_id = self._next_id
+        self._next_id += 1
+        return message_id
+
+    async def send_command(self, message: Dict[str, Any],
+                           message_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Send a command and wait for its result (other commands may be in
+        flight at the same time)
+
+        Args:
+            message: Command without 'id'
+            message_id: Id reserved with _allocate_id (allocated if None)
+
+        Returns:
+            Result message
+
+        Raises:
+            asyncio.TimeoutError: If no result arrives within request_timeout
+            ConnectionError: If the connection is lost
+        """
+        await self._ensure_connected()
+
+        if message_id is None:
+            message_id = self._allocate_id()
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        self.requests += 1
+        self.max_in_flight = max(self.max_in_flight, len(self._pending))
+
+        try:
+            await self._ws.send(json.dumps({'id': message_id, **message}))
+            return await asyncio.wait_for(future, self.request_timeout)
+        finally:
+            self._pending.pop(message_id, None)
+
+    async def call_service(self, domain: str, service: str, entity_id: str,
+                           data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Call a Home Assistant service
+
+        Args:
+            domain: Service domain (e.g., 'light', 'switch')
+            service: Service name (e.g., 'turn_on', 'turn_off')
+            entity_id: Entity ID (e.g., 'light.living_room')
+            data: Additional service data (optional)
+
+        Returns:
+            Result dictionary with success status and message
+        """
+        service_name = f'{domain}.{service}'
+        logger.info(f'Calling service: {service_name} on {entity_id}')
+
+        try:
+            response = await self.send_command({
+                'type': 'call_service',
+                'domain': domain,
+                'service': service,
+                'service_data': data or {},
+                'target': {'entity_id': entity_id}
+            })
+
+        except asyncio.TimeoutError:
+            error_msg = 'Service call timed out'
+            logger.error(f'{error_msg}: {service_name}')
+            return {'success': False, 'entity_id': entity_id, 'service': service_name, 'error': error_msg}
+
+        except (OSError, websockets.WebSocketException, HomeAssistantAuthError) as e:
+            error_msg = f'WebSocket error: {e}'
+            logger.error(f'{error_msg}: {service_name}')
+            return {'success': False, 'entity_id': entity_id, 'service': service_name, 'error': error_msg}
+
+        if response.get('success'):
+            logger.info(f'Service call successful: {service_name}')
+
+            # With the subscription, the state_changed event precedes the result
+            if not (self._state_events_subscribed and self.is_connected()):
+                self.state_cache.invalidate(entity_id)
+            return {
+                'success': True,
+                'entity_id': entity_id,
+                'service': service_name,
+                'message': f'{entity_id} - {service} executed successfully',
+                'response': response.get('result')
+            }
+
+        error = response.get('error', {})
+        error_msg = f'Service call failed: {error.get("code", "unknown")}: {error.get("message", "")}'
+        logger.error(error_msg)
+        return {'success': False, 'entity_id': entity_id, 'service': service_name, 'error': error_msg}
+
+    async def turn_on(self, entity_id: str, **kwargs) -> Dict[str, Any]:
+        """Turn on a device (kwargs: additional service data)"""
+        return await self.call_service(entity_id.split('.')[0], 'turn_on', entity_id, kwargs or None)
+
+    async def turn_off(self, entity_id: str) -> Dict[str, Any]:
+        """Turn off a device"""
+        return await self.call_service(entity_id.split('.')[0], 'turn_off', entity_id)
+
+    async def toggle(self, entity_id: str) -> Dict[str, Any]:
+        """Toggle a device"""
+        return await self.call_service(entity_id.split('.')[0], 'toggle', entity_id)
+
+    async def execute_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute an action from configuration
+
+        Args:
+            action: Action dictionary with entity_id, service and optional data
+
+        Returns:
+            Result dictionary
+        """
+        entity_id = action.get('entity_id')
+        service = action.get('service')
+
+        if not entity_id or not service:
+            return {
+                'success': False,
+                'error': 'Missing entity_id or service in action'
+            }
+
+        return await self.call_service(entity_id.split('.')[0], service, entity_id, action.get('data', {}))
+
+    async def get_states(self) -> List[Dict[str, Any]]:
+        """
+        Get the states of all entities and cache them
+
+        Returns:
+            List of state dictionaries (empty on error)
+        """
+        try:
+            response = await self.send_command({'type': 'get_states'})
+        except Exception as e:
+            logger.error(f'Error getting states: {e}')
+            return []
+
+        if not response.get('success'):
+            return []
+
+        states = response.get('result') or []
+        count = self.state_cache.update_many(states)
+        logger.info(f'Cached {count} entity states')
+        return states
+
+    async def get_state(self, entity_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get state of an entity (from the cache when fresh)
+
+        The WebSocket API only returns all states at once, so a cache miss
+        fetches (and caches) every state.
+
+        Args:
+            entity_id: Entity ID
+            use_cache: Serve a cached state if available
+
+        Returns:
+            State dictionary or None
+        """
+        if use_cache and self.state_cache_current():
+            state = self.state_cache.get(entity_id)
+            if state is not None:
+                return state
+
+        for state in await self.get_states():
+            if state.get('entity_id') == entity_id:
+                return state
+        return None
+
+    async def subscribe_events(self, callback: Callable[[Dict[str, Any]], None],
+                               event_type: Optional[str] = 'state_changed') -> bool:
+        """
+        Subscribe to Home Assistant events on this connection
+
+        Args:
+            callback: Called with each event dictionary (on the event loop)
+            event_type: Event type to receive (None for all events)
+
+        Returns:
+            True if subscribed
+        """
+        message = {'type': 'subscribe_events'}
+        if event_type:
+            message['event_type'] = event_type
+
+        # Register before sending: the first event may follow the result
+        # immediately
+        await self._ensure_connected()
+        message_id = self._allocate_id()
+        self._subscriptions[message_id] = (event_type, callback)
+
+        try:
+            response = await self.send_command(message, message_id)
+        except Exception as e:
+            logger.error(f'Failed to subscribe to {event_type or "all"} events: {e}')
+            response = {}
+
+        if not response.get('success'):
+            self._subscriptions.pop(message_id, None)
+            return False
+
+        logger.info(f'Subscribed to {event_type or "all"} events')
+        return True
+
+    def is_connected(self) -> bool:
+        """Check whether the connection (and its subscriptions) is up"""
+        return self._ws is not None
+
+    def state_cache_current(self) -> bool:
+        """
+        Check whether cached states may be served
+
+        False while the connection carrying the state subscription is down.
+        Without a subscription, HA_STATE_CACHE_TTL bounds staleness.
+        """
+        return not self._state_events_subscribed or self.is_connected()
+
+    async def test_connection(self) -> bool:
+        """
+        Test connection to Home Assistant
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            response = await self.send_command({'type': 'ping'})
+        except HomeAssistantAuthError as e:
+            logger.error(f'Home Assistant authentication failed: {e}')
+            return False
+        except Exception as e:
+            logger.error(f'Connection test failed: {e}')
+            return False
+
+        if response.get('type') == 'pong':
+            logger.info(f'Connected to Home Assistant {self.ha_version} (WebSocket API)')
+            return True
+        return False
+
+    async def close(self):
+        """Close the connection"""
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            await ws.close()
+        if self._reader_task is not None:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+            self._reader_task = None
+        logger.info('WebSocket connection closed')
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get connection statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'transport': 'websocket',
+            'connected': self._ws is not None,
+            'connects': self.connects,
+            'requests': self.requests,
+            'in_flight': len(self._pending),
+            'max_in_flight': self.max_in_flight,
+            'subscriptions': len(self._subscriptions),
+            'state_subscribed': self._state_events_subscribed and self.is_connected(),
+            'state_cache': self.state_cache.get_statistics()
+        }
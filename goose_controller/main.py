@@ -16,7 +16,21 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+try:
+    from config.constants import (
+        LATENCY_STATS_INTERVAL,
+        DEFAULT_UNIX_SOCKET_PATH,
+        UNIX_SOCKET_MODE
+    )
+except ImportError:
+    # Fallback to hardcoded values if constants not available
+    LATENCY_STATS_INTERVAL = 5.0
+    DEFAULT_UNIX_SOCKET_PATH = '/tmp/gesture_control.sock'
+    UNIX_SOCKET_MODE = 0o660
+
 from gesture_handler import GestureHandler
+from gesture_recognition.latency_stats import write_latency_snapshot
+from gesture_recognition.transport import parse_socket_mode
 
 # Configure logging
 logging.basicConfig(
@@ -144,9 +158,21 @@ class GestureControlMain:
         )
         host = socket_config.get('host', 'localhost')
         port = socket_config.get('port', 5555)
-
-        logger.info(f'Starting socket server on {host}:{port}...')
-        self.gesture_handler.start_socket_server(host, port)
+        server_mode = socket_config.get('server', 'asyncio')
+
+        # Unix domain socket for recognizers on the same machine
+        unix_socket_path = None
+        if socket_config.get('type', 'tcp') == 'unix':
+            unix_socket_path = socket_config.get('unix_socket_path', DEFAULT_UNIX_SOCKET_PATH)
+
+        self.gesture_handler.start_socket_server(
+            host, port,
+            mode=server_mode,
+            unix_socket_path=unix_socket_path,
+            unix_socket_mode=parse_socket_mode(
+                socket_config.get('unix_socket_mode'), UNIX_SOCKET_MODE
+            )
+        )
 
         self.running = True
 
@@ -157,14 +183,22 @@ class GestureControlMain:
         logger.info('Press Ctrl+C to stop')
 
         # Main loop
+        last_latency_snapshot = 0.0
         try:
             while self.running:
                 time.sleep(1)
 
+                # Publish latency percentiles for the web server's /health
+                now = time.monotonic()
+                if now - last_latency_snapshot >= LATENCY_STATS_INTERVAL:
+                    last_latency_snapshot = now
+                    write_latency_snapshot(
+                        'goose_controller', self.gesture_handler.latency.get_statistics()
+                    )
+
                 # Periodic tasks could go here
                 # - Check Home Assistant connection
                 # - Reload config if changed
-                # - Log statistics
 
         except KeyboardInterrupt:
             logger.info('Keyboard interrupt received')
@@ -198,6 +232,16 @@ class GestureControlMain:
             logger.info(f"  Actions triggered: {stats['actions_triggered']}")
             logger.info(f"  Actions succeeded: {stats['actions_succeeded']}")
             logger.info(f"  Actions failed: {stats['actions_failed']}")
+            dispatcher = stats['dispatcher']
+            logger.info(
+                f"  Action queue: max depth {dispatcher['max_queue_depth']}, "
+                f"rejected {dispatcher['rejected']}"
+            )
+            for stage, summary in stats['latency'].items():
+                logger.info(
+                    f"  Latency {stage}: p50 {summary['p50']:.1f} ms, "
+                    f"p95 {summary['p95']:.1f} ms, p99 {summary['p99']:.1f} ms"
+                )
             logger.info('='*60)
 
         logger.info('Shutdown complete')
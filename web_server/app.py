@@ -6,6 +6,7 @@ It serves the UI, handles WebSocket connections, and provides REST API endpoints
 """
 
 import os
+import sys
 import logging
 from flask import Flask, render_template, jsonify, request
 from flask_socketio import SocketIO, emit
@@ -13,6 +14,17 @@ from flask_cors import CORS
 from dotenv import load_dotenv
 from camera_feed import get_camera_feed, create_mjpeg_response
 
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    from config.constants import LATENCY_STATS_MAX_AGE
+except ImportError:
+    # Fallback to hardcoded values if constants not available
+    LATENCY_STATS_MAX_AGE = 60.0
+
+from gesture_recognition.latency_stats import read_latency_snapshots
+
 # Load environment variables
 load_dotenv()
 
@@ -46,11 +58,12 @@ def index():
 
 @app.route('/health')
 def health():
-    """Health check endpoint"""
+    """Health check endpoint (includes per-stage latency percentiles)"""
     return jsonify({
         'status': 'healthy',
         'gesture_mode': gesture_mode_active,
-        'camera_active': camera_active
+        'camera_active': camera_active,
+        'latency': read_latency_snapshots(max_age=LATENCY_STATS_MAX_AGE)
     })
 
 
@@ -1,7 +1,9 @@
 """
 Camera Feed Module for MJPEG Streaming
 
-Provides MJPEG video stream from the gesture recognition system
+Provides MJPEG video stream from the gesture recognition system, either from
+an in-process GestureRecognizer or from the shared-memory frame bus published
+by gesture_stream.py running in its own process
 """
 
 import cv2
@@ -19,15 +21,21 @@ try:
     from config.constants import (
         MJPEG_QUALITY,
         MJPEG_FRAME_DELAY,
-        DEFAULT_CAMERA_WIDTH,
-        DEFAULT_CAMERA_HEIGHT
+        PREVIEW_WIDTH,
+        PREVIEW_HEIGHT,
+        FRAME_BUS_NAME,
+        FRAME_BUS_STALE_TIMEOUT
     )
 except ImportError:
     # Fallback to hardcoded values if constants not available
     MJPEG_QUALITY = 85
     MJPEG_FRAME_DELAY = 0.033
-    DEFAULT_CAMERA_WIDTH = 640
-    DEFAULT_CAMERA_HEIGHT = 480
+    PREVIEW_WIDTH = 640
+    PREVIEW_HEIGHT = 480
+    FRAME_BUS_NAME = 'ha_gesture_preview'
+    FRAME_BUS_STALE_TIMEOUT = 2.0
+
+from gesture_recognition.frame_bus import SharedFrameBus
 
 logger = logging.getLogger(__name__)
 
@@ -35,17 +43,85 @@ logger = logging.getLogger(__name__)
 class CameraFeed:
     """Manages camera feed and MJPEG streaming"""
 
-    def __init__(self, gesture_recognizer=None):
+    def __init__(self, gesture_recognizer=None, frame_bus_name=FRAME_BUS_NAME):
         """
         Initialize camera feed
 
         Args:
             gesture_recognizer: GestureRecognizer instance (optional)
+            frame_bus_name: Shared memory name of the preview frame bus, used
+                when no in-process recognizer is set (None disables)
         """
         self.gesture_recognizer = gesture_recognizer
+        self.frame_bus_name = frame_bus_name
+        self.frame_bus = None
         self.active = False
         self.frame_count = 0
 
+        # Frame bus reader state
+        self.last_bus_seq = 0
+        self.last_bus_frame_time = 0.0
+        self.last_attach_attempt = 0.0
+
+    def _attach_frame_bus(self):
+        """
+        Attach to the frame bus, re-attaching if the writer went away
+
+        Returns:
+            True if a frame bus is attached
+        """
+        now = time.monotonic()
+
+        # A restarted recognizer creates a new segment; the old mapping stays
+        # valid but never receives frames again
+        if (self.frame_bus is not None and
+                now - self.last_bus_frame_time > FRAME_BUS_STALE_TIMEOUT):
+            self.frame_bus.close()
+            self.frame_bus = None
+
+        if self.frame_bus is not None:
+            return True
+
+        if now - self.last_attach_attempt < FRAME_BUS_STALE_TIMEOUT:
+            return False
+        self.last_attach_attempt = now
+
+        try:
+            self.frame_bus = SharedFrameBus.attach(self.frame_bus_name)
+            self.last_bus_seq = 0
+            self.last_bus_frame_time = now
+            logger.info(f'Attached to frame bus: {self.frame_bus_name}')
+            return True
+
+        except (FileNotFoundError, ValueError) as e:
+            logger.debug(f'Frame bus not available: {e}')
+            return False
+
+    def _encode_bus_frame(self):
+        """
+        Encode the newest frame bus frame straight from shared memory
+
+        Returns:
+            JPEG bytes, or None if no new intact frame is available
+        """
+        if not self.frame_bus_name or not self._attach_frame_bus():
+            return None
+
+        latest = self.frame_bus.get_latest(self.last_bus_seq)
+        if latest is None:
+            return None
+
+        seq, frame_view, _ = latest
+        ret, buffer = cv2.imencode('.jpg', frame_view, [cv2.IMWRITE_JPEG_QUALITY, MJPEG_QUALITY])
+
+        # Discard the result if the writer reused the slot while encoding
+        if not ret or not self.frame_bus.is_intact(seq):
+            return None
+
+        self.last_bus_seq = seq
+        self.last_bus_frame_time = time.monotonic()
+        return buffer.tobytes()
+
     def generate_frames(self):
         """
         Generator function for MJPEG streaming
@@ -60,24 +136,32 @@ class CameraFeed:
             while self.active:
                 # Get frame from gesture recognizer if available
                 frame = None
+                frame_bytes = None
 
                 if self.gesture_recognizer:
                     frame = self.gesture_recognizer.get_current_frame()
+                else:
+                    frame_bytes = self._encode_bus_frame()
 
-                # If no frame available, generate a placeholder
-                if frame is None:
-                    frame = self._generate_placeholder_frame()
+                if frame_bytes is None:
+                    # If no frame available, generate a placeholder
+                    if frame is None:
+                        if self.frame_bus is not None:
+                            # Bus attached but no new frame yet; keep the last one
+                            time.sleep(MJPEG_FRAME_DELAY)
+                            continue
+                        frame = self._generate_placeholder_frame()
 
-                # Encode frame as JPEG
-                ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, MJPEG_QUALITY])
+                    # Encode frame as JPEG
+                    ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, MJPEG_QUALITY])
 
-                if not ret:
-                    logger.warning('Failed to encode frame')
-                    time.sleep(0.1)
-                    continue
+                    if not ret:
+                        logger.warning('Failed to encode frame')
+                        time.sleep(0.1)
+                        continue
 
-                # Convert to bytes
-                frame_bytes = buffer.tobytes()
+                    # Convert to bytes
+                    frame_bytes = buffer.tobytes()
 
                 # Yield frame in multipart format
                 yield (b'--frame\r\n'
@@ -106,7 +190,7 @@ class CameraFeed:
             OpenCV frame (BGR format)
         """
         # Create black frame
-        frame = np.zeros((DEFAULT_CAMERA_HEIGHT, DEFAULT_CAMERA_WIDTH, 3), dtype=np.uint8)
+        frame = np.zeros((PREVIEW_HEIGHT, PREVIEW_WIDTH, 3), dtype=np.uint8)
 
         # Add text
         text = 'Camera Initializing...'
@@ -119,13 +203,13 @@ class CameraFeed:
         (text_width, text_height), _ = cv2.getTextSize(text, font, font_scale, thickness)
 
         # Center text
-        x = (DEFAULT_CAMERA_WIDTH - text_width) // 2
-        y = (DEFAULT_CAMERA_HEIGHT + text_height) // 2
+        x = (PREVIEW_WIDTH - text_width) // 2
+        y = (PREVIEW_HEIGHT + text_height) // 2
 
         cv2.putText(frame, text, (x, y), font, font_scale, color, thickness)
 
         # Add camera icon (simple circle with a dot)
-        center_x, center_y = DEFAULT_CAMERA_WIDTH // 2, 200
+        center_x, center_y = PREVIEW_WIDTH // 2, 200
         cv2.circle(frame, (center_x, center_y), 50, (100, 100, 100), 3)
         cv2.circle(frame, (center_x, center_y), 20, (100, 100, 100), -1)
         cv2.rectangle(frame, (center_x - 10, center_y - 60), (center_x + 10, center_y - 50), (100, 100, 100), -1)
@@ -137,6 +221,10 @@ class CameraFeed:
         logger.info('Stopping camera feed')
         self.active = False
 
+        if self.frame_bus is not None:
+            self.frame_bus.close()
+            self.frame_bus = None
+
     def is_active(self):
         """Check if camera feed is active"""
         return self.active
@@ -171,7 +259,7 @@ def get_camera_feed():
     global _camera_feed
 
     if _camera_feed is None:
-        _camera_feed = CameraFeed()
+        _camera_feed = CameraFeed(frame_bus_name=os.getenv('FRAME_BUS_NAME', FRAME_BUS_NAME))
 
     return _camera_feed
 